@@ -0,0 +1,12 @@
+import pytest
+
+from .server import OlsStandIn
+
+
+@pytest.fixture(scope="session")
+def ols_server():
+    """
+    Local stand-in OLS server, shared by all benchmarks
+    """
+    with OlsStandIn(num_pages=5) as server:
+        yield server
@@ -0,0 +1,101 @@
+"""
+Large example responses for benchmarks
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Optional
+
+from tests.factories import (
+    BASE_URL,
+    make_multiple_terms,
+    make_search_response,
+    make_term,
+)
+
+
+def descendants_page(num_terms: int = 1000) -> bytes:
+    """
+    A page of ``num_terms`` terms, like a large /descendants response
+    """
+    terms = [
+        make_term(short_form=f"GO_{i:07d}", label=f"term {i}") for i in range(num_terms)
+    ]
+    data = make_multiple_terms(terms, size=num_terms, total_elements=num_terms * 50)
+    return json.dumps(data).encode()
+
+
+def search_page(num_docs: int = 1000, fields: Optional[list[str]] = None) -> bytes:
+    """
+    A /search response with ``num_docs`` results, with the fields
+    returned by default, or only ``fields`` (and ``id``) like
+    the server returns for ``fieldList``
+    """
+    docs = []
+    for i in range(num_docs):
+        short_form = f"MONDO_{i:07d}"
+        docs.append(
+            {
+                "id": f"mondo:class:http://purl.obolibrary.org/obo/{short_form}",
+                "iri": f"http://purl.obolibrary.org/obo/{short_form}",
+                "short_form": short_form,
+                "obo_id": short_form.replace("_", ":"),
+                "label": f"disease {i}",
+                "description": [f"A disease that is number {i}. " * 5],
+                "synonym": [f"disease synonym {i}", f"other synonym {i}"],
+                "ontology_name": "mondo",
+                "ontology_prefix": "MONDO",
+                "type": "class",
+            }
+        )
+    if fields is not None:
+        docs = [
+            {name: value for name, value in doc.items() if name in {"id", *fields}}
+            for doc in docs
+        ]
+    return json.dumps(make_search_response(docs)).encode()
+
+
+def ontology_list_page(num_ontologies: int = 300) -> bytes:
+    """
+    An /ontologies response listing ``num_ontologies`` ontologies on one page
+    """
+    ontologies = []
+    for i in range(num_ontologies):
+        ontology_id = f"onto{i}"
+        ontologies.append(
+            {
+                "ontologyId": ontology_id,
+                "status": "LOADED",
+                "numberOfProperties": 100 + i,
+                "numberOfTerms": 10_000 + i,
+                "languages": ["en"],
+                "config": {
+                    "title": f"Ontology {i}",
+                    "description": f"An example ontology, number {i}. " * 5,
+                    "preferredPrefix": ontology_id.upper(),
+                },
+                "_links": {
+                    rel: {"href": f"{BASE_URL}ontologies/{ontology_id}/{rel}"}
+                    for rel in ["self", "terms", "properties", "individuals"]
+                },
+            }
+        )
+    data = {
+        "_embedded": {"ontologies": ontologies},
+        "page": {
+            "size": num_ontologies,
+            "totalElements": num_ontologies,
+            "totalPages": 1,
+            "number": 0,
+        },
+    }
+    return json.dumps(data).encode()
+
+
+def term_response() -> bytes:
+    """
+    A single term, like a /terms/{iri} response
+    """
+    return json.dumps(make_term()).encode()
@@ -0,0 +1,55 @@
+"""
+Record responses from a live OLS instance for the stand-in server to replay:
+
+    python -m benchmarks.record [--base-url https://www.ebi.ac.uk/ols4/api/]
+
+Recordings are saved to ``benchmarks/fixtures``. Without them the stand-in
+server uses generated responses of the same shape.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import requests
+
+from ols_py.client import BEST_HIT_FIELDS, _BaseOls4Client
+from ols_py.instances import EBI_OLS4
+
+from .server import FIXTURES_DIR
+
+TERM_IRI = "http://purl.obolibrary.org/obo/GO_0043226"
+
+REQUESTS = {
+    "descendants": (
+        "ontologies/go/descendants",
+        {"id": "GO:0008150", "page": 0, "size": 1000},
+    ),
+    "search": ("search", {"q": "disease", "rows": 1000}),
+    "search-fields": (
+        "search",
+        {"q": "disease", "rows": 1000, "fieldList": ",".join(BEST_HIT_FIELDS)},
+    ),
+    "ontologies": ("ontologies", {"page": 0, "size": 1000}),
+    "term": (f"ontologies/go/terms/{_BaseOls4Client._quote_iri(TERM_IRI)}", {}),
+}
+"""Path and params to record each response from"""
+
+
+def record(base_url: str = EBI_OLS4, fixtures_dir: Path = FIXTURES_DIR) -> None:
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    with requests.Session() as session:
+        session.headers["accept"] = "application/json"
+        for name, (path, params) in REQUESTS.items():
+            resp = session.get(base_url.rstrip("/") + "/" + path, params=params)
+            resp.raise_for_status()
+            (fixtures_dir / f"{name}.json").write_bytes(resp.content)
+            print(f"Recorded {name}: {len(resp.content)} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=EBI_OLS4)
+    args = parser.parse_args()
+    record(base_url=args.base_url)
@@ -0,0 +1,204 @@
+"""
+Local stand-in for an OLS server, so client benchmarks don't depend on
+the network or the live EBI server.
+
+The server replays a fixed set of responses: recorded from a real OLS
+instance if they are in the fixtures directory (see ``record.py``),
+otherwise generated payloads of the same shape. Paged endpoints return
+the same page for every page number, with the page info rewritten,
+so a traversal of any length can be simulated.
+"""
+
+from __future__ import annotations
+
+import http.server
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from ols_py.client import BEST_HIT_FIELDS
+
+from .payloads import descendants_page, ontology_list_page, search_page, term_response
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+GENERATORS: dict[str, Callable[[], bytes]] = {
+    "descendants": descendants_page,
+    "search": search_page,
+    "search-fields": lambda: search_page(fields=BEST_HIT_FIELDS),
+    "ontologies": ontology_list_page,
+    "term": term_response,
+}
+"""Functions generating each response, used if no recording is available"""
+
+RELATIVES = {
+    "parents",
+    "children",
+    "ancestors",
+    "descendants",
+    "hierarchicalParents",
+    "hierarchicalChildren",
+    "hierarchicalAncestors",
+    "hierarchicalDescendants",
+}
+
+
+def load_fixture(name: str, fixtures_dir: Path = FIXTURES_DIR) -> bytes:
+    """
+    Get the recorded response ``name`` if it exists, or generate one
+    """
+    path = fixtures_dir / f"{name}.json"
+    if path.exists():
+        return path.read_bytes()
+    return GENERATORS[name]()
+
+
+class _Page:
+    """
+    A recorded page of results, re-serialized for each page number requested
+    """
+
+    def __init__(self, content: bytes, num_pages: int):
+        self.data = json.loads(content)
+        self.num_pages = num_pages
+        self._pages: dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, number: int) -> bytes:
+        with self._lock:
+            if number not in self._pages:
+                self._pages[number] = self._render(number)
+            return self._pages[number]
+
+    def _render(self, number: int) -> bytes:
+        data = dict(self.data)
+        if "page" in data:
+            size = data["page"]["size"]
+            data["page"] = {
+                "size": size,
+                "totalElements": size * self.num_pages,
+                "totalPages": self.num_pages,
+                "number": number,
+            }
+        else:
+            # search/select responses are paged with start/rows
+            docs = data["response"]["docs"]
+            data["response"] = {
+                **data["response"],
+                "numFound": len(docs) * self.num_pages,
+                "start": number * len(docs),
+            }
+        return json.dumps(data).encode()
+
+
+class OlsStandIn:
+    """
+    Threaded HTTP server replaying OLS responses, e.g.:
+
+        with OlsStandIn(num_pages=10) as server:
+            client = Ols4Client(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        num_pages: int = 5,
+        fixtures_dir: Path = FIXTURES_DIR,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0,
+    ):
+        """
+        :param num_pages: Number of pages reported for the term relatives
+            and search endpoints
+        :param fixtures_dir: Directory containing recorded responses
+        :param port: Port to listen on, 0 picks a free port
+        :param delay: Seconds to wait before each response, to simulate
+            a slow instance
+        """
+        self.num_pages = num_pages
+        self.delay = delay
+        self.pages = {
+            name: _Page(load_fixture(name, fixtures_dir), num_pages=num_pages)
+            for name in ("descendants", "search")
+        }
+        # The ontology list is small enough to fit on one page
+        self.pages["ontologies"] = _Page(
+            load_fixture("ontologies", fixtures_dir), num_pages=1
+        )
+        self.term = load_fixture("term", fixtures_dir)
+        self._server = http.server.ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> OlsStandIn:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def get_response(self, path: str, query: dict[str, list[str]]) -> Optional[bytes]:
+        """
+        Get the response body for a request, or None if the path isn't supported
+        """
+        parts = path.strip("/").split("/")
+        if parts[0] != "api":
+            return None
+        parts = parts[1:]
+        if parts in (["search"], ["select"]):
+            rows = int(query.get("rows", ["1"])[0])
+            start = int(query.get("start", ["0"])[0])
+            return self.pages["search"].get(start // max(rows, 1))
+        page = int(query.get("page", ["0"])[0])
+        if parts == ["ontologies"]:
+            return self.pages["ontologies"].get(page)
+        if len(parts) == 3 and parts[0] == "ontologies" and parts[2] in RELATIVES:
+            return self.pages["descendants"].get(page)
+        if len(parts) == 4 and parts[0] == "ontologies" and parts[2] == "terms":
+            return self.term
+        return None
+
+    def _handler(self) -> type[http.server.BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            # Keep connections open, like the real server
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if stand_in.delay:
+                    time.sleep(stand_in.delay)
+                url = urlsplit(self.path)
+                body = stand_in.get_response(url.path, parse_qs(url.query))
+                if body is None:
+                    body = b'{"status": 404, "error": "Not Found"}'
+                    self.send_response(404)
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
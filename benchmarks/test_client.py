@@ -0,0 +1,126 @@
+"""
+End-to-end client benchmarks against the local stand-in server, covering
+request + parsing throughput, pagination, bulk lookups and the async client.
+
+Alongside pytest-benchmark's timings, each benchmark records per-request
+latency percentiles and peak memory in ``extra_info``.
+"""
+
+import asyncio
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.instrumentation import StatsCollector
+
+NUM_BULK_TERMS = 200
+TERM_IRIS = [
+    f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(NUM_BULK_TERMS)
+]
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    Peak bytes allocated while running ``func`` once
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(benchmark, stats: StatsCollector, func: Callable[[], object]):
+    """
+    Benchmark ``func``, recording request latency percentiles and
+    peak memory in the benchmark's ``extra_info``
+    """
+    func()  # Warm up connections
+    stats.reset()
+    result = benchmark(func)
+    for endpoint, endpoint_stats in stats.summary().items():
+        benchmark.extra_info[endpoint] = {
+            "requests": endpoint_stats.requests,
+            "request_percentiles": endpoint_stats.request_percentiles,
+            "parse_percentiles": endpoint_stats.parse_percentiles,
+        }
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory(func)
+    return result
+
+
+@pytest.fixture
+def stats():
+    return StatsCollector()
+
+
+@pytest.fixture
+def client(ols_server, stats):
+    return Ols4Client(base_url=ols_server.base_url, hooks=[stats])
+
+
+def test_get_with_schema(benchmark, client, stats):
+    benchmark.group = "get-descendants-1000"
+    page = run_benchmark(
+        benchmark,
+        stats,
+        lambda: client.get_term_descendants(
+            "go", "GO:0008150", params={"page": 0, "size": 1000}
+        ),
+    )
+    assert len(page.embedded.terms) == 1000
+
+
+def test_search(benchmark, client, stats):
+    benchmark.group = "search-1000"
+    results = run_benchmark(
+        benchmark, stats, lambda: client.search("disease", params={"rows": 1000})
+    )
+    assert len(results.response.docs) == 1000
+
+
+def test_iter_ontologies(benchmark, client, stats):
+    benchmark.group = "iter-ontologies"
+    ontologies = run_benchmark(benchmark, stats, lambda: list(client.iter_ontologies()))
+    assert len(ontologies) > 0
+
+
+@pytest.mark.parametrize("prefetch", [False, True, 8])
+def test_iter_descendants(benchmark, client, stats, ols_server, prefetch):
+    benchmark.group = "iter-descendants"
+    terms = run_benchmark(
+        benchmark,
+        stats,
+        lambda: list(
+            client.iter_term_descendants("go", "GO:0008150", prefetch=prefetch)
+        ),
+    )
+    assert len(terms) == 1000 * ols_server.num_pages
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_get_terms_bulk(benchmark, client, stats, max_workers):
+    benchmark.group = f"bulk-{NUM_BULK_TERMS}"
+    results = run_benchmark(
+        benchmark,
+        stats,
+        lambda: client.get_terms_bulk("go", TERM_IRIS, max_workers=max_workers),
+    )
+    assert len(results) == NUM_BULK_TERMS
+
+
+def test_async_get_terms_bulk(benchmark, ols_server, stats):
+    benchmark.group = f"bulk-{NUM_BULK_TERMS}"
+
+    async def get_terms():
+        async with AsyncOls4Client(
+            base_url=ols_server.base_url, max_concurrency=8, hooks=[stats]
+        ) as client:
+            return await client.get_terms_bulk("go", TERM_IRIS)
+
+    results = run_benchmark(benchmark, stats, lambda: asyncio.run(get_terms()))
+    assert len(results) == NUM_BULK_TERMS
@@ -0,0 +1,58 @@
+"""
+Crawl a 20k-term subtree with simulated server latency, comparing the
+number of concurrent requests per BFS level
+"""
+
+import json
+import time
+
+import pytest
+import requests
+
+from ols_py.client import Ols4Client
+from ols_py.crawl import crawl_subtree
+from tests.factories import BASE_URL, make_multiple_terms, make_term
+
+NUM_TERMS = 20_000
+BRANCHING = 5
+LATENCY = 0.005
+OBO = "http://purl.obolibrary.org/obo/"
+
+
+def get_children(node: int) -> range:
+    return range(node * BRANCHING + 1, min((node + 1) * BRANCHING + 1, NUM_TERMS))
+
+
+def fake_get(url, params=None, headers=None, timeout=None, stream=False):
+    """
+    hierarchicalChildren endpoint for a tree where each term has
+    ``BRANCHING`` children, taking ``LATENCY`` seconds to respond
+    """
+    time.sleep(LATENCY)
+    node = int(params["id"].removeprefix(OBO + "T_"))
+    terms = [
+        make_term(f"T_{child}", has_children=bool(get_children(child)))
+        for child in get_children(node)
+    ]
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = json.dumps(make_multiple_terms(terms)).encode()
+    return resp
+
+
+@pytest.mark.parametrize("max_workers", [8, 32])
+def test_crawl_subtree(benchmark, max_workers):
+    client = Ols4Client(base_url=BASE_URL, pool_maxsize=max_workers)
+    client._session.get = fake_get
+
+    def crawl() -> int:
+        edges = crawl_subtree(
+            client, "test", OBO + "T_0", "children", max_workers=max_workers
+        )
+        return sum(1 for _ in edges)
+
+    benchmark.group = "crawl-20k"
+    num_edges = benchmark.pedantic(crawl, rounds=1, iterations=1)
+    benchmark.extra_info["requests"] = NUM_TERMS // BRANCHING
+    benchmark.extra_info["serial_latency_seconds"] = NUM_TERMS // BRANCHING * LATENCY
+    assert num_edges == NUM_TERMS - 1
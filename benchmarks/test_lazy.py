@@ -0,0 +1,42 @@
+"""
+Compare full validation of a 1000-term page against lazy validation,
+for a caller that reads a few fields of each term
+"""
+
+import pydantic_core
+import pytest
+
+from ols_py.lazy import lazy_validate
+from ols_py.schemas.responses import MultipleTerms
+
+from .payloads import descendants_page
+
+CONTENT = descendants_page(1000)
+
+
+def read_full() -> list[str]:
+    page = MultipleTerms.model_validate_json(CONTENT)
+    return [f"{t.obo_id} {t.label}" for t in page.embedded.terms if not t.is_obsolete]
+
+
+def read_lazy() -> list[str]:
+    page = lazy_validate(MultipleTerms, pydantic_core.from_json(CONTENT))
+    return [f"{t.obo_id} {t.label}" for t in page.embedded.terms if not t.is_obsolete]
+
+
+def validate_lazy() -> MultipleTerms:
+    page = lazy_validate(MultipleTerms, pydantic_core.from_json(CONTENT))
+    return page.materialize()
+
+
+READERS = {"full": read_full, "lazy": read_lazy, "lazy-validate": validate_lazy}
+
+
+@pytest.mark.parametrize("mode", READERS)
+def test_read_terms(benchmark, mode):
+    benchmark.group = "lazy-terms-1000"
+    benchmark(READERS[mode])
+
+
+def test_lazy_reads_same_values():
+    assert read_lazy() == read_full()
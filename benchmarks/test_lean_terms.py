@@ -0,0 +1,43 @@
+"""
+Compare parse time and memory use of full Term objects vs. LeanTerm
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from ols_py.schemas.responses import LeanMultipleTerms, MultipleTerms
+
+from .payloads import descendants_page
+
+SCHEMAS = {"full": MultipleTerms, "lean": LeanMultipleTerms}
+CONTENT = descendants_page(1000)
+
+
+def retained_memory(schema) -> int:
+    """
+    Bytes still allocated after parsing a page of 1000 terms with ``schema``
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    page = schema.model_validate_json(CONTENT)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    return end - start
+
+
+@pytest.mark.parametrize("model", SCHEMAS)
+def test_parse_terms(benchmark, model):
+    schema = SCHEMAS[model]
+    benchmark.group = "terms-1000"
+    benchmark.extra_info["retained_bytes"] = retained_memory(schema)
+    benchmark(schema.model_validate_json, CONTENT)
+
+
+def test_lean_terms_use_less_memory():
+    full = retained_memory(MultipleTerms)
+    lean = retained_memory(LeanMultipleTerms)
+    assert lean < full / 4
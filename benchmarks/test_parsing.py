@@ -0,0 +1,31 @@
+"""
+Compare parsing responses via a dict (``schema(**resp.json())``, the
+old approach) against validating the raw bytes with ``model_validate_json()``
+"""
+
+import json
+
+import pytest
+
+from ols_py.schemas.responses import MultipleTerms, SearchResponse
+
+from .payloads import descendants_page, search_page
+
+PAYLOADS = {
+    "descendants": (MultipleTerms, descendants_page(1000)),
+    "search": (SearchResponse, search_page(1000)),
+}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_parse_via_dict(benchmark, payload):
+    schema, content = PAYLOADS[payload]
+    benchmark.group = f"parse-{payload}"
+    benchmark(lambda: schema(**json.loads(content)))
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_parse_from_bytes(benchmark, payload):
+    schema, content = PAYLOADS[payload]
+    benchmark.group = f"parse-{payload}"
+    benchmark(schema.model_validate_json, content)
@@ -0,0 +1,31 @@
+"""
+Compare response size and parse time of full search results against
+results with only the fields needed for a typical lookup (``fields=``,
+which sets ``fieldList``). Both are parsed with the same model, so the
+difference comes from what the server leaves out. Record real responses
+with ``python -m benchmarks.record`` to compare the server's actual output.
+"""
+
+import pytest
+
+from ols_py.schemas.responses import SearchResponse
+
+from .server import load_fixture
+
+PAYLOADS = {
+    "full": load_fixture("search"),
+    "fields": load_fixture("search-fields"),
+}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_parse_search(benchmark, payload):
+    content = PAYLOADS[payload]
+    benchmark.group = "search-fields-1000"
+    benchmark.extra_info["response_bytes"] = len(content)
+    benchmark.extra_info["full_response_bytes"] = len(PAYLOADS["full"])
+    benchmark(SearchResponse.model_validate_json, content)
+
+
+def test_fields_response_is_smaller():
+    assert len(PAYLOADS["fields"]) < len(PAYLOADS["full"])
@@ -0,0 +1,39 @@
+"""
+Term lookups with a slow mirror: sent only to the slow instance, or
+routed between it and a fast one
+"""
+
+import pytest
+
+from ols_py.client import Ols4Client
+from ols_py.instrumentation import StatsCollector
+
+from .server import OlsStandIn
+from .test_client import TERM_IRIS
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    with OlsStandIn(num_pages=1, delay=0.05) as server:
+        yield server
+
+
+@pytest.mark.parametrize("instances", ["slow", "routed"])
+def test_get_terms(benchmark, ols_server, slow_server, instances):
+    stats = StatsCollector()
+    if instances == "slow":
+        client = Ols4Client(base_url=slow_server.base_url, hooks=[stats])
+    else:
+        client = Ols4Client(
+            base_url=[slow_server.base_url, ols_server.base_url], hooks=[stats]
+        )
+    iris = TERM_IRIS[:20]
+
+    def get_terms():
+        for iri in iris:
+            client.get_term("go", iri)
+
+    benchmark.group = "routing-20-terms"
+    benchmark.pedantic(get_terms, rounds=3)
+    summary = stats.summary()["/ontologies/{ontology}/terms/{iri}"]
+    benchmark.extra_info["request_percentiles"] = summary.request_percentiles
@@ -0,0 +1,54 @@
+"""
+Score a 50-term query profile against 10k profiles of 15 terms, over a
+synthetic 20k-term hierarchy
+"""
+
+import random
+
+import pytest
+
+from ols_py.similarity import SimilarityIndex
+
+NUM_TERMS = 20_000
+NUM_PROFILES = 10_000
+
+
+def make_index() -> SimilarityIndex:
+    """
+    DAG where each term has a parent in the level above, and 1 in 5
+    terms has a second parent
+    """
+    rng = random.Random(0)
+    parents: list[list[int]] = [[]]
+    for term in range(1, NUM_TERMS):
+        term_parents = {(term - 1) // 4}
+        if rng.random() < 0.2:
+            term_parents.add(rng.randrange(max(term // 4, 1)))
+        parents.append(sorted(term_parents))
+    return SimilarityIndex([f"T_{i}" for i in range(NUM_TERMS)], parents)
+
+
+@pytest.fixture(scope="module")
+def index() -> SimilarityIndex:
+    return make_index()
+
+
+@pytest.fixture(scope="module")
+def profiles(index):
+    rng = random.Random(1)
+    return index.profile_set(
+        {f"D_{i}": rng.sample(index.iris, 15) for i in range(NUM_PROFILES)}
+    )
+
+
+def test_build_index(benchmark):
+    benchmark.group = "similarity-build"
+    benchmark.pedantic(make_index, rounds=3)
+
+
+@pytest.mark.parametrize("method", ["resnik", "lin", "jaccard"])
+def test_score_profiles(benchmark, index, profiles, method):
+    query = random.Random(2).sample(index.iris, 50)
+    benchmark.group = "similarity-50-vs-10k"
+    scores = benchmark(index.score_profiles, query, profiles, method=method)
+    assert len(scores) == NUM_PROFILES
@@ -0,0 +1,44 @@
+"""
+Compare peak memory of parsing a 1000-term page in one go against
+streaming the terms one at a time, using the local stand-in server
+"""
+
+import pytest
+
+from ols_py.client import Ols4Client
+
+from .test_client import peak_memory
+
+PARAMS = {"page": 0, "size": 1000}
+
+
+@pytest.fixture
+def client(ols_server):
+    return Ols4Client(base_url=ols_server.base_url)
+
+
+def count_full_page(client: Ols4Client) -> int:
+    page = client.get_term_descendants("go", "GO:0008150", params=PARAMS)
+    return sum(1 for _ in page.embedded.terms)
+
+
+def count_streamed(client: Ols4Client) -> int:
+    terms = client.stream_term_relatives(
+        "descendants", "go", "GO:0008150", params=PARAMS
+    )
+    return sum(1 for _ in terms)
+
+
+@pytest.mark.parametrize("mode", ["full", "stream"])
+def test_descendants_page(benchmark, client, mode):
+    count = count_full_page if mode == "full" else count_streamed
+    benchmark.group = "descendants-page-1000"
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory(lambda: count(client))
+    assert benchmark(count, client) == 1000
+
+
+def test_streaming_uses_less_memory(client):
+    count_streamed(client)  # Warm up connections
+    full = peak_memory(lambda: count_full_page(client))
+    streamed = peak_memory(lambda: count_streamed(client))
+    assert streamed < full / 4
@@ -0,0 +1,1076 @@
+"""
+asyncio version of the OLS4 client, built on ``httpx``.
+
+Install the ``async`` extra to use it: ``pip install ols-py[async]``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Iterable, Optional, Sequence, Type, cast
+
+from pydantic import validate_call
+
+from . import schemas
+from .bulk import BulkResults, arun_bulk
+from .cache import BaseCache
+from .client import (
+    DEFAULT_TIMEOUT,
+    ParamsMapping,
+    S,
+    Timeout,
+    _BaseOls4Client,
+    normalize_query,
+)
+from .coalesce import AsyncSingleFlight
+from .instances import EBI_OLS4
+from .instrumentation import ClientHooks
+from .pagination import (
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_ROWS,
+    aiter_pages,
+    check_page_size,
+    lean_multiple_terms_items,
+    multiple_terms_items,
+    num_pages_from_page_info,
+    ontology_list_items,
+    raw_num_pages,
+    raw_terms_items,
+    search_items,
+    search_num_pages,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .routing import InstanceRouter
+from .schemas.requests import GetTermRelativesParams
+from .snapshot import SnapshotWriter
+from .term_store import BaseTermStore
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "AsyncOls4Client requires httpx, install it with: pip install ols-py[async]"
+    ) from e
+
+
+def _to_httpx_timeout(timeout: Timeout) -> httpx.Timeout:
+    """
+    Convert a requests-style timeout (a single value or a ``(connect, read)``
+    tuple) to an ``httpx.Timeout``
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncOls4Client(_BaseOls4Client):
+    """
+    asyncio client for communicating with an OLS instance. Provides the same
+    methods as [Ols4Client][ols_py.client.Ols4Client], but each method
+    is a coroutine, so many requests can be in flight at once, e.g.:
+
+        async with AsyncOls4Client(max_concurrency=50) as client:
+            terms = await asyncio.gather(
+                *(client.get_term("mondo", iri) for iri in iris)
+            )
+    """
+
+    max_concurrency: int
+    timeout: Timeout
+
+    def __init__(
+        self,
+        base_url: str | Sequence[str] = EBI_OLS4,
+        max_concurrency: int = 10,
+        http_client: Optional[httpx.AsyncClient] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        coalesce: bool = False,
+        hooks: Iterable[ClientHooks] = (),
+        term_store: Optional[BaseTermStore] = None,
+        lazy: bool = False,
+        router: Optional[InstanceRouter] = None,
+    ):
+        """
+        :param base_url: Base API URL for the OLS instance, up to and including /api/,
+           or several URLs to route requests between.
+           See [Ols4Client][ols_py.client.Ols4Client]
+        :param max_concurrency: Maximum number of requests that will be sent
+           to the server at the same time. Additional requests wait until
+           a slot is free.
+        :param http_client: Optional ``httpx.AsyncClient`` to send requests with,
+           e.g. if you need to configure proxies or transports. By default
+           a new client is created, with a connection pool sized to
+           ``max_concurrency``.
+        :param retry: Optional [RetryPolicy][ols_py.retry.RetryPolicy] for retrying
+           failed requests
+        :param rate_limiter: Optional [RateLimiter][ols_py.rate_limit.RateLimiter]
+           to limit the rate requests are sent at
+        :param timeout: Timeout for requests in seconds, either a single value or
+           a ``(connect, read)`` tuple. ``None`` waits forever. This is used
+           for every request, including with a custom ``http_client``.
+        :param coalesce: Share one request (and parsed result) between tasks
+           making the same call at the same time
+        :param hooks: [ClientHooks][ols_py.instrumentation.ClientHooks] to
+           receive events for requests, retries and response parsing
+        :param term_store: Optional store for parsed terms.
+           See [Ols4Client][ols_py.client.Ols4Client]. The store is read
+           and written in a worker thread (with ``asyncio.to_thread``),
+           so it must be thread-safe, like the stores in
+           [ols_py.term_store][ols_py.term_store].
+        :param lazy: Return [LazyModel][ols_py.lazy.LazyModel] proxies that
+           only validate fields when they're accessed.
+           See [Ols4Client][ols_py.client.Ols4Client]
+        :param router: Router for several instances.
+           See [Ols4Client][ols_py.client.Ols4Client]
+        """
+        super().__init__(
+            base_url=base_url,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            term_store=term_store,
+            lazy=lazy,
+            router=router,
+        )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._httpx_timeout = _to_httpx_timeout(timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                ),
+                follow_redirects=True,
+            )
+        self._http_client = http_client
+        self._http_client.headers.update({"accept": "application/json"})
+        self._single_flight = AsyncSingleFlight() if coalesce else None
+
+    async def __aenter__(self) -> AsyncOls4Client:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and its connections
+        """
+        await self._http_client.aclose()
+
+    async def get(self, path: str, params: Optional[ParamsMapping] = None) -> dict:
+        """
+        Perform a GET request to the API, returning the JSON data
+        as a dict without validation/parsing.
+        See [Ols4Client.get()][ols_py.client.Ols4Client.get]
+
+        :param path: API path (excluding base url)
+        :param params: Query parameters
+        :return: JSON data, as a dict
+        :raises httpx.HTTPStatusError: if response is not OK
+        """
+        if self._single_flight is None:
+            content = await self._get_content(path=path, params=params)
+        else:
+            key = (None, BaseCache.make_key(self._create_url(path), params))
+            content = await self._single_flight.do(
+                key, lambda: self._get_content(path=path, params=params)
+            )
+        if not self.hooks:
+            json_data: dict = json.loads(content)
+            return json_data
+        start = time.perf_counter()
+        json_data = json.loads(content)
+        self._emit_parse(path, None, decode_seconds=time.perf_counter() - start)
+        return json_data
+
+    async def _get_content(
+        self, path: str, params: Optional[ParamsMapping] = None
+    ) -> bytes:
+        """
+        Get the raw response body for ``path``
+
+        :raises httpx.HTTPStatusError: if response is not OK
+        """
+        resp = await self._send(path, params=params)
+        return resp.content
+
+    async def _send(
+        self, path: str, params: Optional[ParamsMapping] = None, stream: bool = False
+    ) -> httpx.Response:
+        """
+        Send a GET request for ``path``, waiting for the rate limiter
+        and retrying according to the retry policy
+
+        :param stream: Return as soon as the headers are received, without
+          reading the body. The response must be closed by the caller.
+        :raises httpx.HTTPStatusError: if response is not OK
+        """
+        url = self._create_url(path)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            status = None
+            try:
+                async with self._semaphore:
+                    self._emit_request_start(url)
+                    start = time.perf_counter()
+                    resp = await self._client_send(url, params, stream)
+            except httpx.TransportError as e:
+                delay = self._get_error_retry_delay(url, start, attempt, e)
+                if delay is None:
+                    raise
+            else:
+                status = resp.status_code
+                delay = self._get_response_retry_delay(
+                    url,
+                    start,
+                    attempt,
+                    status=status,
+                    headers=resp.headers,
+                    num_bytes=0 if stream else len(resp.content),
+                )
+                if delay is None:
+                    return await self._raise_for_status(resp, stream)
+                await resp.aclose()
+            self._emit_retry(url, attempt + 1, delay, status=status)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    async def _raise_for_status(resp: httpx.Response, stream: bool) -> httpx.Response:
+        """
+        Return ``resp`` if it's OK, otherwise close it (if streamed) and raise
+
+        :raises httpx.HTTPStatusError: if response is not OK
+        """
+        if stream and resp.is_error:
+            await resp.aclose()
+        resp.raise_for_status()
+        return resp
+
+    async def _client_send(
+        self, url: str, params: Optional[ParamsMapping], stream: bool
+    ) -> httpx.Response:
+        """
+        Send a single GET request, routing it to one of the instances
+        if there are several. If an instance fails, the request is sent
+        to the next one, and the last error/response is returned.
+        """
+        if self.router is None:
+            request = self._http_client.build_request(
+                "GET", url, params=params, timeout=self._httpx_timeout
+            )
+            return await self._http_client.send(request, stream=stream)
+        path = url[len(self.base_url) :]
+        resp: Optional[httpx.Response] = None
+        error: Optional[Exception] = None
+        for instance in self.router.candidates():
+            if resp is not None:
+                await resp.aclose()
+            resp = None
+            start = time.perf_counter()
+            request = self._http_client.build_request(
+                "GET",
+                instance.base_url + path,
+                params=params,
+                timeout=self._httpx_timeout,
+            )
+            try:
+                resp = await self._http_client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                self.router.record_failure(instance)
+                error = e
+                continue
+            if self.router.is_failure(resp.status_code):
+                self.router.record_failure(instance)
+                continue
+            self.router.record_success(instance, time.perf_counter() - start)
+            return resp
+        if resp is not None:
+            return resp
+        assert error is not None
+        raise error
+
+    async def get_with_schema(
+        self, schema: Type[S], path: str, params: Optional[ParamsMapping] = None
+    ) -> S:
+        """
+        Get data from ``path`` and parse it with ``schema`` to return
+        a pydantic object.
+        See [Ols4Client.get_with_schema()][ols_py.client.Ols4Client.get_with_schema]
+        """
+        return await self._get_with_schema(schema, path, params)
+
+    async def _get_with_schema(
+        self,
+        schema: Type[S],
+        path: str,
+        params: Optional[ParamsMapping] = None,
+        store_terms: bool = False,
+    ) -> S:
+        """
+        Get data from ``path`` and parse it with ``schema``, see
+        ``Ols4Client._get_with_schema()``
+        """
+        if self._single_flight is None:
+            return await self._get_and_parse(schema, path, params, store_terms)
+        key = (schema, BaseCache.make_key(self._create_url(path), params))
+        return await self._single_flight.do(
+            key, lambda: self._get_and_parse(schema, path, params, store_terms)
+        )
+
+    async def _get_and_parse(
+        self,
+        schema: Type[S],
+        path: str,
+        params: Optional[ParamsMapping],
+        store_terms: bool,
+    ) -> S:
+        content = await self._get_content(path=path, params=params)
+        obj = self._parse_content(schema, path, content)
+        if store_terms and self.term_store is not None:
+            await asyncio.to_thread(self._store_terms, obj)
+        # Lazy proxies are returned as the model, see Ols4Client's ``lazy``
+        return cast(S, obj)
+
+    async def _astore_streamed(
+        self, terms: list[schemas.responses.Term]
+    ) -> list[schemas.responses.Term]:
+        if self.term_store is None or not terms:
+            return terms
+        return await asyncio.to_thread(self._store_streamed, terms)
+
+    async def _stream_terms(
+        self, path: str, params: Optional[ParamsMapping] = None
+    ) -> AsyncIterator[schemas.responses.Term]:
+        from .streaming import STREAM_CHUNK_SIZE, TERMS_PREFIX, ItemParser
+
+        parser = ItemParser(schemas.responses.Term, TERMS_PREFIX)
+        resp = await self._send(path, params=params, stream=True)
+        try:
+            async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                for term in await self._astore_streamed(parser.feed(chunk)):
+                    yield term
+        finally:
+            await resp.aclose()
+        for term in await self._astore_streamed(parser.close()):
+            yield term
+
+    async def get_api_info(self) -> schemas.responses.ApiInfo:
+        """
+        Get the list of endpoints supported by the API
+        """
+        return await self.get_with_schema(schemas.responses.ApiInfo, path="/")
+
+    async def get_ontologies(
+        self, page: Optional[int] = None, size: Optional[int] = None
+    ) -> schemas.responses.OntologyList:
+        """
+        Get the list of ontologies the OLS instance has.
+
+        :param page: Page number of results (starting at 0)
+        :param size: Number of results per page (API default is 20)
+        """
+        params = schemas.requests.PageParams(page=page, size=size).model_dump(
+            exclude_none=True
+        )
+        return await self.get_with_schema(
+            schemas.responses.OntologyList, "/ontologies", params=params
+        )
+
+    def iter_ontologies(
+        self, page_size: int = MAX_PAGE_SIZE, prefetch: bool | int = True
+    ) -> AsyncIterator[schemas.responses.OntologyItem]:
+        """
+        Iterate over every ontology the OLS instance has.
+        See [Ols4Client.iter_ontologies()][ols_py.client.Ols4Client.iter_ontologies]
+        """
+        check_page_size(page_size)
+        return aiter_pages(
+            lambda page: self.get_ontologies(page=page, size=page_size),
+            get_items=ontology_list_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    async def get_ontology(self, ontology_id: str) -> schemas.responses.OntologyItem:
+        """
+        Get details for a single ontology
+
+        :param ontology_id: Ontology ID/name, e.g. "mondo"
+        """
+        path = f"/ontologies/{ontology_id}/"
+        return await self.get_with_schema(schemas.responses.OntologyItem, path)
+
+    async def get_term(self, ontology_id: str, iri: str) -> schemas.responses.Term:
+        """
+        Get a single term in a specific ontology
+
+        :param ontology_id: Ontology ID/name, e.g. "mondo"
+        :param iri: IRI for a single term
+        :return: Term details
+        """
+        if self.term_store is not None:
+            stored = await asyncio.to_thread(self._get_stored_term, ontology_id, iri)
+            if stored is not None:
+                return stored
+        iri = self._quote_iri(iri)
+        path = f"/ontologies/{ontology_id}/terms/{iri}"
+        return await self._get_with_schema(
+            schemas.responses.Term, path, store_terms=True
+        )
+
+    async def get_terms(
+        self, ontology_id: str, params: Optional[schemas.requests.GetTermsParams] = None
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get multiple terms in a specific ontology.
+        See [Ols4Client.get_terms()][ols_py.client.Ols4Client.get_terms]
+        """
+        path = f"/ontologies/{ontology_id}/terms"
+        return await self._get_with_schema(
+            schemas.responses.MultipleTerms, path, params=params, store_terms=True
+        )
+
+    def stream_terms(
+        self, ontology_id: str, params: Optional[schemas.requests.GetTermsParams] = None
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Get a page of terms, parsing the response as it's downloaded.
+        See [Ols4Client.stream_terms()][ols_py.client.Ols4Client.stream_terms]
+        """
+        path = f"/ontologies/{ontology_id}/terms"
+        return self._stream_terms(path, params=params)
+
+    def iter_terms(
+        self,
+        ontology_id: str,
+        params: Optional[schemas.requests.GetTermsParams] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over every term in a specific ontology.
+        See [Ols4Client.iter_terms()][ols_py.client.Ols4Client.iter_terms]
+        """
+        check_page_size(page_size)
+        filters = self._get_terms_filters(params)
+        return aiter_pages(
+            lambda page: self.get_terms(
+                ontology_id, params={**filters, "page": page, "size": page_size}
+            ),
+            get_items=multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def iter_lean_terms(
+        self,
+        ontology_id: str,
+        params: Optional[schemas.requests.GetTermsParams] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.LeanTerm]:
+        """
+        Iterate over every term in a specific ontology as compact
+        [LeanTerm][ols_py.schemas.responses.LeanTerm] objects.
+        See [Ols4Client.iter_lean_terms()][ols_py.client.Ols4Client.iter_lean_terms]
+        """
+        check_page_size(page_size)
+        filters = self._get_terms_filters(params)
+        path = f"/ontologies/{ontology_id}/terms"
+        return aiter_pages(
+            lambda page: self.get_with_schema(
+                schemas.responses.LeanMultipleTerms,
+                path,
+                params={**filters, "page": page, "size": page_size},
+            ),
+            get_items=lean_multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    async def export_ontology(
+        self,
+        ontology_id: str,
+        path: str | os.PathLike[str],
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> int:
+        """
+        Download every term in an ontology to a snapshot file.
+        See [Ols4Client.export_ontology()][ols_py.client.Ols4Client.export_ontology]
+        """
+        check_page_size(page_size)
+        endpoint = f"/ontologies/{ontology_id}/terms"
+        # Each page's terms are written together, in a worker thread
+        #   so file I/O doesn't block the event loop
+        pages = aiter_pages(
+            lambda page: self.get(endpoint, params={"page": page, "size": page_size}),
+            get_items=lambda page: [raw_terms_items(page)],
+            get_num_pages=raw_num_pages,
+        )
+        with SnapshotWriter(path, ontology_id=ontology_id) as writer:
+            async for terms in pages:
+                await asyncio.to_thread(writer.write_many, terms)
+            await asyncio.to_thread(writer.close)
+        return len(writer)
+
+    async def find_terms(
+        self, params: schemas.requests.GetTermsParams
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Search for terms across ontologies.
+        See [Ols4Client.find_terms()][ols_py.client.Ols4Client.find_terms]
+        """
+        return await self._get_with_schema(
+            schemas.responses.MultipleTerms, "/terms", params=params, store_terms=True
+        )
+
+    async def get_term_in_defining_ontology(
+        self,
+        iri: Optional[str] = None,
+        params: Optional[schemas.requests.TermInDefiningOntologyParams] = None,
+    ) -> schemas.responses.TermInDefiningOntology:
+        """
+        Find a term in its defining ontology.
+        See [Ols4Client.get_term_in_defining_ontology()][ols_py.client.Ols4Client.get_term_in_defining_ontology]
+
+        :raises ValueError: if both/neither IRI and params arguments were given.
+        """
+        if iri and params:
+            raise ValueError("Pass either iri or params arguments, not both")
+        if iri:
+            iri_encoded = self._quote_iri(iri)
+            path = f"/terms/findByIdAndIsDefiningOntology/{iri_encoded}"
+            return await self._get_with_schema(
+                schemas.responses.TermInDefiningOntology, path=path, store_terms=True
+            )
+        if params:
+            path = "/terms/findByIdAndIsDefiningOntology"
+            return await self._get_with_schema(
+                schemas.responses.TermInDefiningOntology,
+                path=path,
+                params=params,
+                store_terms=True,
+            )
+        raise ValueError("One of iri or params arguments is required")
+
+    async def get_terms_bulk(
+        self, ontology_id: str, iris: Iterable[str]
+    ) -> BulkResults[str, schemas.responses.Term]:
+        """
+        Get many terms in a specific ontology by IRI, sending requests
+        concurrently (up to ``max_concurrency`` at a time).
+        See [Ols4Client.get_terms_bulk()][ols_py.client.Ols4Client.get_terms_bulk]
+        """
+        return await arun_bulk(iris, lambda iri: self.get_term(ontology_id, iri))
+
+    async def resolve_many(
+        self, ids: Iterable[str]
+    ) -> BulkResults[str, schemas.responses.Term]:
+        """
+        Look up many terms in their defining ontologies, sending requests
+        concurrently (up to ``max_concurrency`` at a time).
+        See [Ols4Client.resolve_many()][ols_py.client.Ols4Client.resolve_many]
+        """
+        return await arun_bulk(ids, self._resolve_term)
+
+    async def _resolve_term(self, term_id: str) -> schemas.responses.Term:
+        params = self._get_term_id_params(term_id)
+        if "iri" in params:
+            resp = await self.get_term_in_defining_ontology(iri=term_id)
+        else:
+            resp = await self.get_term_in_defining_ontology(params=params)
+        return self._get_defining_term(resp, term_id)
+
+    async def _get_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Common method for getting a term's parents, children, ancestors etc.
+        """
+        path = f"/ontologies/{ontology_id}/{relatives}"
+        if params is None:
+            params = {}
+        return await self._get_with_schema(
+            schemas.responses.MultipleTerms,
+            path,
+            params={"id": term_id, **params},
+            store_terms=True,
+        )
+
+    def stream_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Get a page of a term's relatives, parsing the response as it's downloaded.
+        See [Ols4Client.stream_term_relatives()][ols_py.client.Ols4Client.stream_term_relatives]
+        """
+        path = f"/ontologies/{ontology_id}/{relatives}"
+        return self._stream_terms(path, params={"id": term_id, **(params or {})})
+
+    async def get_term_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get parents for a term.
+        See [Ols4Client.get_term_parents()][ols_py.client.Ols4Client.get_term_parents]
+        """
+        return await self._get_term_relatives(
+            "parents", ontology_id=ontology_id, term_id=term_id, params=params
+        )
+
+    async def get_term_hierarchical_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get hierarchical parents for a term.
+        """
+        return await self._get_term_relatives(
+            "hierarchicalParents",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            params=params,
+        )
+
+    async def get_term_children(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get children for a term.
+        """
+        return await self._get_term_relatives(
+            "children", ontology_id=ontology_id, term_id=term_id, params=params
+        )
+
+    async def get_term_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get ancestors for a term.
+        """
+        return await self._get_term_relatives(
+            "ancestors", ontology_id=ontology_id, term_id=term_id, params=params
+        )
+
+    async def get_term_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get descendants for a term.
+        """
+        return await self._get_term_relatives(
+            "descendants", ontology_id=ontology_id, term_id=term_id, params=params
+        )
+
+    async def get_term_hierarchical_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get hierarchical ancestors for a term.
+        """
+        return await self._get_term_relatives(
+            "hierarchicalAncestors",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            params=params,
+        )
+
+    async def get_term_hierarchical_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Get hierarchical descendants for a term.
+        """
+        return await self._get_term_relatives(
+            "hierarchicalDescendants",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            params=params,
+        )
+
+    def _iter_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Common method for iterating over every page of a term's
+        parents, children, ancestors etc.
+        """
+        check_page_size(page_size)
+        return aiter_pages(
+            lambda page: self._get_term_relatives(
+                relatives,
+                ontology_id=ontology_id,
+                term_id=term_id,
+                params={"page": page, "size": page_size},
+            ),
+            get_items=multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def iter_lean_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.LeanTerm]:
+        """
+        Iterate over all of a term's relatives as compact
+        [LeanTerm][ols_py.schemas.responses.LeanTerm] objects.
+        See [Ols4Client.iter_lean_term_relatives()][ols_py.client.Ols4Client.iter_lean_term_relatives]
+        """
+        check_page_size(page_size)
+        path = f"/ontologies/{ontology_id}/{relatives}"
+        return aiter_pages(
+            lambda page: self.get_with_schema(
+                schemas.responses.LeanMultipleTerms,
+                path,
+                params={"id": term_id, "page": page, "size": page_size},
+            ),
+            get_items=lean_multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def iter_term_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all parents of a term.
+        """
+        return self._iter_term_relatives(
+            "parents",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical parents of a term.
+        """
+        return self._iter_term_relatives(
+            "hierarchicalParents",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_children(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all children of a term.
+        """
+        return self._iter_term_relatives(
+            "children",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all ancestors of a term.
+        """
+        return self._iter_term_relatives(
+            "ancestors",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all descendants of a term.
+        """
+        return self._iter_term_relatives(
+            "descendants",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical ancestors of a term.
+        """
+        return self._iter_term_relatives(
+            "hierarchicalAncestors",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical descendants of a term.
+        """
+        return self._iter_term_relatives(
+            "hierarchicalDescendants",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    @validate_call
+    async def search(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SearchParams] = None,
+        add_wildcards: bool = False,
+        fields: Optional[list[schemas.requests.SearchReturnFields]] = None,
+    ) -> schemas.responses.SearchResponse:
+        """
+        Search for ``query`` using the /search API endpoint.
+        See [Ols4Client.search()][ols_py.client.Ols4Client.search]
+        """
+        request_params = self._get_search_params(query, params, add_wildcards, fields)
+        return await self.get_with_schema(
+            schemas.responses.SearchResponse, "/search", params=request_params
+        )
+
+    @validate_call
+    async def select(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SelectParams] = None,
+        add_wildcards: bool = False,
+        fields: Optional[list[schemas.requests.SearchReturnFields]] = None,
+    ) -> schemas.responses.SearchResponse:
+        """
+        Search for ``query``, tuned for autocomplete.
+        See [Ols4Client.select()][ols_py.client.Ols4Client.select]
+        """
+        request_params = self._get_search_params(query, params, add_wildcards, fields)
+        return await self.get_with_schema(
+            schemas.responses.SearchResponse, "/select", params=request_params
+        )
+
+    async def search_many(
+        self,
+        queries: Iterable[str],
+        params: Optional[schemas.requests.SearchParams] = None,
+        add_wildcards: bool = False,
+        best_hit_only: bool = False,
+        deduplicate: bool = True,
+    ) -> BulkResults[str, schemas.responses.SearchResponse]:
+        """
+        Run many searches with the same ``params``, sending requests
+        concurrently (up to ``max_concurrency`` at a time).
+        See [Ols4Client.search_many()][ols_py.client.Ols4Client.search_many]
+        """
+        queries = list(queries)
+        shared_params = self._get_search_many_params(params, best_hit_only)
+
+        async def search(query: str) -> schemas.responses.SearchResponse:
+            if add_wildcards:
+                query = self._add_wildcards(query)
+            return await self.get_with_schema(
+                schemas.responses.SearchResponse,
+                "/search",
+                params={"q": query, **shared_params},
+            )
+
+        if not deduplicate:
+            return await arun_bulk(queries, search)
+        results = await arun_bulk((normalize_query(q) for q in queries), search)
+        return {query: results[normalize_query(query)] for query in queries}
+
+    def _iter_search_results(
+        self,
+        method,
+        query: str,
+        params: Optional[schemas.requests.SearchParams | schemas.requests.SelectParams],
+        add_wildcards: bool,
+        page_size: int,
+        prefetch: bool | int,
+    ) -> AsyncIterator[schemas.responses.SearchResultItem]:
+        """
+        Common method for iterating over every page of search()/select() results
+        """
+        check_page_size(page_size)
+        search_params: dict[str, Any] = dict(params or {})
+        start = int(search_params.pop("start", 0))
+        search_params.pop("rows", None)
+        return aiter_pages(
+            lambda page: method(
+                query,
+                params={
+                    **search_params,
+                    "rows": page_size,
+                    "start": start + page * page_size,
+                },
+                add_wildcards=add_wildcards,
+            ),
+            get_items=search_items,
+            get_num_pages=search_num_pages(start=start, rows=page_size),
+            prefetch=prefetch,
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SearchParams] = None,
+        add_wildcards: bool = False,
+        page_size: int = MAX_SEARCH_ROWS,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.SearchResultItem]:
+        """
+        Iterate over every result for ``query`` from the /search API endpoint.
+        See [Ols4Client.iter_search()][ols_py.client.Ols4Client.iter_search]
+        """
+        return self._iter_search_results(
+            self.search,
+            query,
+            params=params,
+            add_wildcards=add_wildcards,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_select(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SelectParams] = None,
+        add_wildcards: bool = False,
+        page_size: int = MAX_SEARCH_ROWS,
+        prefetch: bool | int = True,
+    ) -> AsyncIterator[schemas.responses.SearchResultItem]:
+        """
+        Iterate over every result for ``query`` from the /select API endpoint.
+        See [Ols4Client.iter_select()][ols_py.client.Ols4Client.iter_select]
+        """
+        return self._iter_search_results(
+            self.select,
+            query,
+            params=params,
+            add_wildcards=add_wildcards,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    async def get_property(self, ontology_id: str, iri: str) -> schemas.responses.Term:
+        """
+        Get a property from a specific ontology.
+        """
+        quoted_iri = self._quote_iri(iri)
+        path = f"/ontologies/{ontology_id}/properties/{quoted_iri}"
+        return await self.get_with_schema(schemas.responses.Term, path=path)
+
+    async def get_individual(
+        self, ontology_id: str, iri: str
+    ) -> schemas.responses.Term:
+        """
+        Get an individual from a specific ontology.
+        """
+        quoted_iri = self._quote_iri(iri)
+        path = f"/ontologies/{ontology_id}/individuals/{quoted_iri}"
+        return await self.get_with_schema(schemas.responses.Term, path=path)
+
+    async def get_related_term_by_property(
+        self, ontology_id: str, term_iri: str, property_iri: str
+    ) -> schemas.responses.MultipleTerms:
+        """
+        Find terms related to ``term_iri`` by ``property_iri``.
+        See [Ols4Client.get_related_term_by_property()][ols_py.client.Ols4Client.get_related_term_by_property]
+        """
+        term_iri = self._quote_iri(term_iri)
+        property_iri = self._quote_iri(property_iri)
+        path = f"/ontologies/{ontology_id}/terms/{term_iri}/{property_iri}"
+        return await self.get_with_schema(schemas.responses.MultipleTerms, path=path)
@@ -0,0 +1,645 @@
+"""
+Helpers for autocomplete/type-ahead.
+
+A local prefix index over term labels and synonyms, for autocomplete
+without a request to the server for each keystroke, e.g.:
+
+    from ols_py.autocomplete import PrefixIndex
+    index = PrefixIndex.build(client, "mondo")
+    index.select("diabetes mel")
+
+Or autocomplete sessions, that send debounced requests to the /select
+endpoint as the user types, dropping results for outdated input, e.g.:
+
+    from ols_py.autocomplete import AutocompleteSession
+    session = AutocompleteSession(client, on_results=show_results, params={"ontology": "mondo"})
+    session.update("diab")
+    session.update("diabe")  # Only "diabe" is sent
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+
+from .cache import CacheStats
+from .schemas.requests import SearchReturnFields, SelectParams
+from .schemas.responses import (
+    SearchResponse,
+    SearchResponseResponse,
+    SearchResultItem,
+    Term,
+)
+
+if TYPE_CHECKING:
+    from .async_client import AsyncOls4Client
+    from .client import Ols4Client
+    from .snapshot import OntologySnapshot
+
+_WORD_START = re.compile(r"(?<!\w)\w")
+_SINGLE_WORD = re.compile(r"\w+")
+# Texts longer than this only have their first words indexed
+_MAX_OFFSET = 0xFFFF
+
+AUTOCOMPLETE_FIELDS: list[SearchReturnFields] = [
+    "iri",
+    "label",
+    "obo_id",
+    "short_form",
+    "ontology_name",
+    "synonym",
+]
+"""
+Fields requested by autocomplete sessions: enough to display results, and
+to match them against longer queries locally
+"""
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for matching: case-insensitive, with
+    runs of whitespace treated as a single space
+    """
+    return " ".join(text.casefold().split())
+
+
+class _TermRecord(NamedTuple):
+    iri: str
+    label: str
+    short_form: Optional[str]
+    obo_id: Optional[str]
+    ontology_name: Optional[str]
+    ontology_prefix: Optional[str]
+    synonyms: Optional[list[str]]
+
+
+class PrefixIndex:
+    """
+    Prefix index over the labels and synonyms of an ontology's terms.
+
+    Matching texts are stored in sorted arrays, so a query is a binary search
+    plus reading off as many matches as needed - fast enough for
+    type-ahead even with hundreds of thousands of labels.
+
+    Results are ranked similarly to the /select endpoint:
+
+    1. Exact label matches
+    2. Exact synonym matches
+    3. Labels starting with the query
+    4. Synonyms starting with the query
+    5. Labels containing a word starting with the query
+    6. Synonyms containing a word starting with the query
+
+    with alphabetical order within each group.
+    """
+
+    def __init__(self, records: Iterable[_TermRecord]):
+        """
+        Use [from_terms()][ols_py.autocomplete.PrefixIndex.from_terms],
+        [from_snapshot()][ols_py.autocomplete.PrefixIndex.from_snapshot] or
+        [build()][ols_py.autocomplete.PrefixIndex.build] to create an index.
+        """
+        self._records: list[_TermRecord] = []
+        # Normalized label/synonym texts, and the term each one belongs to
+        self._texts: list[str] = []
+        self._text_terms = array("i")
+        # Each entry is a (text index, offset) pair, packed into a single
+        #   integer, for a suffix of a text starting at a word boundary
+        label_entries: list[int] = []
+        synonym_entries: list[int] = []
+        label_word_entries: list[int] = []
+        synonym_word_entries: list[int] = []
+        for record in records:
+            term_index = len(self._records)
+            self._records.append(record)
+            texts = [(record.label, label_entries, label_word_entries)]
+            texts.extend(
+                (synonym, synonym_entries, synonym_word_entries)
+                for synonym in record.synonyms or []
+            )
+            for text, entries, word_entries in texts:
+                key = normalize(text)
+                if not key:
+                    continue
+                text_index = len(self._texts)
+                self._texts.append(key)
+                self._text_terms.append(term_index)
+                entries.append(text_index << 16)
+                for match in _WORD_START.finditer(key, 1, _MAX_OFFSET + 1):
+                    word_entries.append((text_index << 16) | match.start())
+
+        self._tiers = [
+            self._sorted(entries)
+            for entries in (
+                label_entries,
+                synonym_entries,
+                label_word_entries,
+                synonym_word_entries,
+            )
+        ]
+
+    def _get_key(self, entry: int) -> str:
+        text_index, offset = entry >> 16, entry & _MAX_OFFSET
+        return self._texts[text_index][offset:]
+
+    def _sorted(self, entries: list[int]) -> array:
+        entries.sort(key=self._get_key)
+        return array("q", entries)
+
+    @staticmethod
+    def _record_from_dict(term: Mapping[str, Any]) -> _TermRecord:
+        return _TermRecord(
+            iri=term["iri"],
+            label=term["label"],
+            short_form=term.get("short_form"),
+            obo_id=term.get("obo_id"),
+            ontology_name=term.get("ontology_name"),
+            ontology_prefix=term.get("ontology_prefix"),
+            synonyms=term.get("synonyms"),
+        )
+
+    @classmethod
+    def from_terms(
+        cls, terms: Iterable[Term], include_obsolete: bool = False
+    ) -> PrefixIndex:
+        """
+        Create an index from terms, e.g. from
+        [Ols4Client.iter_terms()][ols_py.client.Ols4Client.iter_terms]
+
+        :param include_obsolete: Include obsolete terms (like ``select()``,
+            they're excluded by default)
+        """
+        return cls(
+            _TermRecord(
+                iri=str(term.iri),
+                label=term.label,
+                short_form=term.short_form,
+                obo_id=term.obo_id,
+                ontology_name=term.ontology_name,
+                ontology_prefix=term.ontology_prefix,
+                synonyms=term.synonyms,
+            )
+            for term in terms
+            if include_obsolete or not term.is_obsolete
+        )
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: OntologySnapshot, include_obsolete: bool = False
+    ) -> PrefixIndex:
+        """
+        Create an index from an [OntologySnapshot][ols_py.snapshot.OntologySnapshot],
+        without needing access to the server.
+
+        :param include_obsolete: Include obsolete terms
+        """
+        raw_terms: Iterator[dict] = (
+            json.loads(snapshot.get_raw(iri)) for iri in snapshot.iris
+        )
+        return cls(
+            cls._record_from_dict(term)
+            for term in raw_terms
+            if include_obsolete or not term.get("is_obsolete")
+        )
+
+    @classmethod
+    def build(
+        cls, client: Ols4Client, ontology_id: str, include_obsolete: bool = False
+    ) -> PrefixIndex:
+        """
+        Create an index by fetching all of an ontology's terms from the server
+
+        :param client: Client to fetch terms with
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param include_obsolete: Include obsolete terms
+        """
+        return cls.from_terms(
+            client.iter_terms(ontology_id), include_obsolete=include_obsolete
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _iter_matches(
+        self, tier: array, query: str, matches: Callable[[str], bool]
+    ) -> Iterator[int]:
+        """
+        Get the terms for entries in ``tier`` that match, starting from
+        the first entry that could match ``query``
+        """
+        position = bisect_left(tier, query, key=self._get_key)
+        while position < len(tier):
+            entry = tier[position]
+            if not matches(self._get_key(entry)):
+                return
+            yield self._text_terms[entry >> 16]
+            position += 1
+
+    def _iter_ranked(self, query: str) -> Iterator[int]:
+        label_tier, synonym_tier = self._tiers[:2]
+
+        def is_exact(key: str) -> bool:
+            return key == query
+
+        def is_prefix(key: str) -> bool:
+            return key.startswith(query)
+
+        yield from self._iter_matches(label_tier, query, is_exact)
+        yield from self._iter_matches(synonym_tier, query, is_exact)
+        for tier in self._tiers:
+            yield from self._iter_matches(tier, query, is_prefix)
+
+    def select(self, query: str, rows: int = 10) -> list[SearchResultItem]:
+        """
+        Find terms with a label or synonym matching ``query``, like
+        [Ols4Client.select()][ols_py.client.Ols4Client.select]
+
+        :param query: Text typed so far
+        :param rows: Maximum number of results to return
+        """
+        query = normalize(query)
+        if not query or rows < 1:
+            return []
+        results: dict[int, None] = {}
+        for term_index in self._iter_ranked(query):
+            results[term_index] = None
+            if len(results) >= rows:
+                break
+        return [self._to_result(self._records[i]) for i in results]
+
+    @staticmethod
+    def _to_result(record: _TermRecord) -> SearchResultItem:
+        return SearchResultItem.model_construct(
+            iri=record.iri,
+            label=record.label,
+            short_form=record.short_form,
+            obo_id=record.obo_id,
+            ontology_name=record.ontology_name,
+            ontology_prefix=record.ontology_prefix,
+            synonyms=record.synonyms,
+            type="class",
+        )
+
+
+def _has_word_prefix(text: Optional[str], query: str) -> bool:
+    if not text:
+        return False
+    key = normalize(text)
+    return any(key.startswith(query, m.start()) for m in _WORD_START.finditer(key))
+
+
+def _matches(doc: SearchResultItem, query: str) -> bool:
+    """
+    Check if a search result has a label, synonym or ID containing a
+    word starting with (normalized) ``query``
+    """
+    texts = [doc.label, doc.obo_id, doc.short_form, *(doc.synonyms or [])]
+    return any(_has_word_prefix(text, query) for text in texts)
+
+
+class SelectCache:
+    """
+    LRU cache of /select responses by normalized query. If a response for
+    a shorter prefix of the query contained every match, the query is answered
+    locally by filtering that response, keeping its ranking.
+
+    Only single-word queries are narrowed locally. Results are kept if a
+    label, synonym or ID has a word starting with the query, which can
+    differ from how the server matches queries with several words (e.g. in
+    any order), so those are always sent to the server.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: Maximum number of responses to keep
+        """
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._responses: OrderedDict[str, SearchResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str) -> Optional[SearchResponse]:
+        """
+        Get the response for ``query`` (already normalized), from the cache
+        or by narrowing the complete response for a shorter prefix
+        """
+        with self._lock:
+            resp = self._responses.get(query)
+            if resp is not None:
+                self._responses.move_to_end(query)
+                self.stats.hits += 1
+                return resp
+            broader = self._get_complete_prefix(query)
+            if broader is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        docs = [doc for doc in broader.response.docs if _matches(doc, query)]
+        narrowed = SearchResponse.model_construct(
+            responseHeader=broader.responseHeader,
+            response=SearchResponseResponse.model_construct(
+                numFound=len(docs), start=0, docs=docs
+            ),
+        )
+        self.store(query, narrowed)
+        return narrowed
+
+    def _get_complete_prefix(self, query: str) -> Optional[SearchResponse]:
+        if not _SINGLE_WORD.fullmatch(query):
+            return None
+        for end in range(len(query) - 1, 0, -1):
+            resp = self._responses.get(query[:end])
+            if resp is not None and resp.response.start == 0:
+                if resp.response.numFound <= len(resp.response.docs):
+                    return resp
+        return None
+
+    def store(self, query: str, resp: SearchResponse) -> None:
+        with self._lock:
+            self._responses[query] = resp
+            self._responses.move_to_end(query)
+            while len(self._responses) > self.max_size:
+                self._responses.popitem(last=False)
+                self.stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+class _BaseAutocompleteSession:
+    """
+    Logic shared between sync and async autocomplete sessions
+    """
+
+    def __init__(
+        self,
+        params: Optional[SelectParams],
+        rows: int,
+        fields: list[SearchReturnFields],
+        debounce: float,
+        min_length: int,
+        cache: Optional[SelectCache],
+    ):
+        if debounce < 0:
+            raise ValueError("debounce must not be negative")
+        self.params: SelectParams = {**(params or {}), "rows": rows}
+        self.fields = list(fields)
+        self.debounce = debounce
+        self.min_length = min_length
+        self.cache = cache if cache is not None else SelectCache()
+        self._generation = 0
+
+    def _should_send(self, query: str) -> bool:
+        return len(query) >= self.min_length
+
+    def _next_generation(self) -> int:
+        self._generation += 1
+        return self._generation
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+
+class AutocompleteSession(_BaseAutocompleteSession):
+    """
+    Type-ahead session for one input box, using
+    [Ols4Client.select()][ols_py.client.Ols4Client.select].
+
+    Call ``update()`` with the text on every keystroke. A request is only
+    sent once the text hasn't changed for ``debounce`` seconds, and results
+    for text that has since changed are dropped instead of being passed to
+    ``on_results``. Responses are cached, and when a response for a shorter
+    prefix contained every match, longer queries are answered from it without
+    a request (and without waiting for the debounce delay).
+
+    Requests are sent from a background thread, so ``on_results`` is
+    called from that thread.
+    """
+
+    def __init__(
+        self,
+        client: Ols4Client,
+        on_results: Callable[[str, SearchResponse], None],
+        params: Optional[SelectParams] = None,
+        rows: int = 10,
+        fields: list[SearchReturnFields] = AUTOCOMPLETE_FIELDS,
+        debounce: float = 0.15,
+        min_length: int = 1,
+        cache: Optional[SelectCache] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ):
+        """
+        :param client: Client to send requests with
+        :param on_results: Called with the text and response, for the
+           latest text only
+        :param params: Parameters for ``select()``, e.g. ``{"ontology": "mondo"}``
+        :param rows: Number of results to request
+        :param fields: Fields to request for each result. Results are only
+           answered from shorter prefixes if these include the label,
+           synonyms and IDs
+        :param debounce: Seconds to wait for more input before sending a request
+        :param min_length: Don't send queries shorter than this (after normalizing)
+        :param cache: Cache for responses, can be shared between sessions
+           with the same ``params``/``rows``/``fields``
+        :param on_error: Called with the text and exception if a request
+           fails. By default errors are raised in the background thread
+        """
+        super().__init__(
+            params=params,
+            rows=rows,
+            fields=fields,
+            debounce=debounce,
+            min_length=min_length,
+            cache=cache,
+        )
+        self.client = client
+        self.on_results = on_results
+        self.on_error = on_error
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def update(self, text: str) -> None:
+        """
+        Set the current text, cancelling any request that hasn't been sent yet,
+        and ignoring results for any requests in flight
+        """
+        with self._lock:
+            generation = self._next_generation()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            query = normalize(text)
+            if not self._should_send(query):
+                return
+            # Cached results don't need debouncing
+            cached = self.cache.get(query)
+            delay = 0 if cached is not None else self.debounce
+            self._timer = threading.Timer(
+                delay, self._run, args=(generation, text, cached)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(
+        self, generation: int, text: str, cached: Optional[SearchResponse]
+    ) -> None:
+        with self._lock:
+            if not self._is_current(generation):
+                return
+        try:
+            resp = cached if cached is not None else self._fetch(normalize(text))
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            with self._lock:
+                is_current = self._is_current(generation)
+            if is_current:
+                self.on_error(text, e)
+            return
+        with self._lock:
+            if not self._is_current(generation):
+                return
+        self.on_results(text, resp)
+
+    def select(self, text: str) -> SearchResponse:
+        """
+        Get results for ``text`` immediately, without debouncing, from
+        the cache if possible
+        """
+        query = normalize(text)
+        resp = self.cache.get(query)
+        if resp is not None:
+            return resp
+        return self._fetch(query)
+
+    def _fetch(self, query: str) -> SearchResponse:
+        """
+        Send a request for ``query`` (already normalized and looked up
+        in the cache), and cache the response
+        """
+        resp = self.client.select(query, params=self.params, fields=self.fields)
+        self.cache.store(query, resp)
+        return resp
+
+    def close(self) -> None:
+        """
+        Cancel any pending request, and drop results for requests in flight
+        """
+        with self._lock:
+            self._next_generation()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+class AsyncAutocompleteSession(_BaseAutocompleteSession):
+    """
+    asyncio version of [AutocompleteSession][ols_py.autocomplete.AutocompleteSession],
+    using [AsyncOls4Client.select()][ols_py.async_client.AsyncOls4Client.select].
+
+    Each ``update()`` cancels the previous one, including its request if
+    it's in flight, e.g.:
+
+        async def on_input(text):
+            resp = await session.update(text)
+            if resp is not None:
+                show_results(resp)
+    """
+
+    def __init__(
+        self,
+        client: AsyncOls4Client,
+        params: Optional[SelectParams] = None,
+        rows: int = 10,
+        fields: list[SearchReturnFields] = AUTOCOMPLETE_FIELDS,
+        debounce: float = 0.15,
+        min_length: int = 1,
+        cache: Optional[SelectCache] = None,
+    ):
+        """
+        See [AutocompleteSession][ols_py.autocomplete.AutocompleteSession]
+        """
+        super().__init__(
+            params=params,
+            rows=rows,
+            fields=fields,
+            debounce=debounce,
+            min_length=min_length,
+            cache=cache,
+        )
+        self.client = client
+        self._task: Optional[asyncio.Task[SearchResponse]] = None
+
+    async def update(self, text: str) -> Optional[SearchResponse]:
+        """
+        Set the current text and get results for it, after waiting
+        ``debounce`` seconds for more input
+
+        :return: The response, or None if the text was too short or
+           ``update()`` was called again before the results arrived
+        """
+        self._next_generation()
+        self.cancel()
+        if not self._should_send(normalize(text)):
+            return None
+        task = asyncio.ensure_future(self._debounced_select(text))
+        self._task = task
+        try:
+            await asyncio.wait([task])
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task.cancelled():
+            return None
+        return task.result()
+
+    async def _debounced_select(self, text: str) -> SearchResponse:
+        query = normalize(text)
+        resp = self.cache.get(query)
+        if resp is not None:
+            return resp
+        if self.debounce:
+            await asyncio.sleep(self.debounce)
+        return await self._fetch(query)
+
+    async def select(self, text: str) -> SearchResponse:
+        """
+        Get results for ``text`` immediately, without debouncing, from
+        the cache if possible
+        """
+        query = normalize(text)
+        resp = self.cache.get(query)
+        if resp is not None:
+            return resp
+        return await self._fetch(query)
+
+    async def _fetch(self, query: str) -> SearchResponse:
+        """
+        Send a request for ``query``, see ``AutocompleteSession._fetch()``
+        """
+        resp = await self.client.select(query, params=self.params, fields=self.fields)
+        self.cache.store(query, resp)
+        return resp
+
+    def cancel(self) -> None:
+        """
+        Cancel the current ``update()``, if it's still waiting for results
+        """
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
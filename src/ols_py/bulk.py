@@ -0,0 +1,82 @@
+"""
+Helpers for running many lookups concurrently
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Hashable, Iterable, TypeVar, Union
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+BulkResults = dict[K, Union[T, Exception]]
+"""
+Results of a bulk lookup, in the same order as the (deduplicated) inputs.
+Failed lookups have the exception that was raised instead of a result.
+"""
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def check_max_workers(max_workers: int) -> int:
+    """
+    :raises ValueError: if ``max_workers`` is not positive
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return max_workers
+
+
+def _capture_errors(func: Callable[[K], T]) -> Callable[[K], Union[T, Exception]]:
+    def wrapper(key: K) -> Union[T, Exception]:
+        try:
+            return func(key)
+        except Exception as e:
+            return e
+
+    return wrapper
+
+
+def run_bulk(
+    keys: Iterable[K],
+    func: Callable[[K], T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BulkResults[K, T]:
+    """
+    Call ``func`` for each unique key in ``keys``, using a pool of
+    ``max_workers`` threads.
+
+    :return: Mapping of key to result, in the same order as ``keys``.
+      Exceptions are returned rather than raised, so one failure doesn't
+      stop the rest of the lookups.
+    """
+    check_max_workers(max_workers)
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return {}
+    workers = min(max_workers, len(unique_keys))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ols-bulk") as pool:
+        results = pool.map(_capture_errors(func), unique_keys)
+        return dict(zip(unique_keys, results))
+
+
+async def arun_bulk(
+    keys: Iterable[K], func: Callable[[K], Awaitable[T]]
+) -> BulkResults[K, T]:
+    """
+    Async version of [run_bulk()][ols_py.bulk.run_bulk]: awaits ``func``
+    for each unique key concurrently. Concurrency is limited by the client
+    making the requests.
+    """
+    unique_keys = list(dict.fromkeys(keys))
+
+    async def capture(key: K) -> Union[T, Exception]:
+        try:
+            return await func(key)
+        except Exception as e:
+            return e
+
+    results = await asyncio.gather(*(capture(key) for key in unique_keys))
+    return dict(zip(unique_keys, results))
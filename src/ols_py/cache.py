@@ -0,0 +1,472 @@
+"""
+Caches for API responses. Pass a cache to the client to avoid repeating
+requests, e.g.:
+
+    from ols_py.cache import MemoryCache
+    client = Ols4Client(cache=MemoryCache(ttl=3600, endpoint_ttls={"/search": 60}))
+
+Responses are cached as raw bytes, keyed on the request URL and its
+(normalized) query parameters. Once a response expires, it is revalidated
+with a conditional request (using its ``ETag``/``Last-Modified`` headers)
+if possible - if the server says it hasn't changed, the stored body is
+reused without downloading it again. Set a TTL of 0 to revalidate every time.
+
+A ``MemoryCache`` without a ``max_bytes`` limit also keeps parsed models
+alongside responses, so repeated requests return the same model instance -
+treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from os import PathLike
+from typing import Any, Mapping, Optional
+from urllib.parse import urlencode
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response body
+    """
+
+    content: bytes
+    """Raw response body"""
+    created: float
+    """Time the response was stored (seconds since the epoch)"""
+    expires: Optional[float]
+    """Time the response expires (seconds since the epoch), or None to never expire"""
+    headers: dict[str, str] = field(default_factory=dict)
+    """Response headers stored alongside the body (validators like ETag)"""
+    parsed: dict[type, Any] = field(default_factory=dict, repr=False, compare=False)
+    """
+    Models already parsed from ``content``, by schema, if the cache's
+    ``keep_parsed`` is set. Not persisted, but means responses in a
+    [MemoryCache][ols_py.cache.MemoryCache] are only parsed once.
+    """
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        if self.expires is None:
+            return True
+        if now is None:
+            now = time.time()
+        return now < self.expires
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Request headers to revalidate this entry with a conditional request
+        (empty if the response didn't include any validators)
+        """
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for cache usage
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    """Stale responses that the server confirmed are unchanged (304 Not Modified)"""
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class BaseCache(ABC):
+    """
+    Base class for response caches. To implement a new storage backend,
+    subclass this and implement ``get_entry()``, ``set_entry()``,
+    ``delete_entry()``, ``clear()`` and ``__len__()``.
+
+    Backends must be safe to use from multiple threads.
+    """
+
+    ttl: Optional[float]
+    endpoint_ttls: dict[str, Optional[float]]
+    stats: CacheStats
+    keep_parsed: bool = False
+    """Whether the client keeps parsed models on entries, see ``CacheEntry.parsed``"""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 3600,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ):
+        """
+        :param ttl: Default time (in seconds) to keep responses for. None
+           means responses never expire
+        :param endpoint_ttls: Override the TTL for specific API paths, as a mapping
+           of glob patterns to TTLs, e.g. ``{"/search": 60, "/ontologies/*/terms/*": 86400}``.
+           Patterns are checked in order and the first match is used.
+        """
+        self.ttl = ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Create a cache key from the request URL and query parameters.
+        Parameters are sorted and converted to strings, and parameters
+        with value None are dropped (as they aren't sent in the request),
+        so equivalent requests get the same key.
+        """
+        if not params:
+            return url
+        normalized = []
+        for name, value in sorted(params.items()):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = [str(v) for v in value]
+            else:
+                value = str(value)
+            normalized.append((name, value))
+        if not normalized:
+            return url
+        return url + "?" + urlencode(normalized, doseq=True)
+
+    def get_ttl(self, path: str) -> Optional[float]:
+        """
+        Get the TTL for an API path, checking ``endpoint_ttls`` first
+        """
+        path = "/" + path.lstrip("/")
+        for pattern, ttl in self.endpoint_ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get an entry from the cache, updating hit/miss counts.
+        Expired entries are counted as misses but still returned, so
+        they can be revalidated - check ``entry.is_fresh()`` before using them.
+
+        :return: The cached entry, or None if there is no entry
+        """
+        entry = self.get_entry(key)
+        hit = entry is not None and entry.is_fresh()
+        with self._stats_lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+        return entry
+
+    def store(
+        self,
+        key: str,
+        path: str,
+        content: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CacheEntry:
+        """
+        Store a response body, with an expiry time based on the TTL for ``path``
+        """
+        now = time.time()
+        ttl = self.get_ttl(path)
+        entry = CacheEntry(
+            content=content,
+            created=now,
+            expires=None if ttl is None else now + ttl,
+            headers=dict(headers or {}),
+        )
+        self.set_entry(key, entry)
+        return entry
+
+    def revalidate(
+        self,
+        key: str,
+        path: str,
+        entry: CacheEntry,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CacheEntry:
+        """
+        Store ``entry`` again with a new expiry time, after the server
+        has confirmed it hasn't changed. Validators in ``headers``
+        replace the stored ones.
+        """
+        with self._stats_lock:
+            self.stats.revalidations += 1
+        revalidated = self.store(
+            key,
+            path=path,
+            content=entry.content,
+            headers={**entry.headers, **(headers or {})},
+        )
+        # Content is unchanged, so previously parsed models are still valid
+        revalidated.parsed.update(entry.parsed)
+        return revalidated
+
+    def _record_evictions(self, count: int) -> None:
+        if count:
+            with self._stats_lock:
+                self.stats.evictions += count
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get the entry for ``key`` (even if expired), or None
+        """
+
+    @abstractmethod
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store ``entry``, evicting other entries if needed
+        """
+
+    @abstractmethod
+    def delete_entry(self, key: str) -> None:
+        """
+        Remove the entry for ``key`` if present
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of entries stored
+        """
+
+
+class MemoryCache(BaseCache):
+    """
+    In-memory cache, evicting the least recently used entries once
+    ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = 3600,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+        keep_parsed: bool = False,
+    ):
+        """
+        :param max_entries: Maximum number of responses to store, or None for no limit
+        :param max_bytes: Maximum total size of stored response bodies,
+           or None for no limit
+        :param ttl: Default time (in seconds) to keep responses for.
+           See [BaseCache][ols_py.cache.BaseCache]
+        :param endpoint_ttls: TTLs for specific API paths.
+           See [BaseCache][ols_py.cache.BaseCache]
+        :param keep_parsed: Keep parsed models with the responses, so repeated
+           requests aren't parsed again. They return the same (shared) model
+           instance, so don't modify it. Parsed models usually take several
+           times more memory than the response and aren't counted towards
+           ``max_bytes``, so only set this for caches with a small
+           ``max_entries`` (not for caches used to iterate over or
+           export whole ontologies)
+        """
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.keep_parsed = keep_parsed
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        evicted = 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while len(self._entries) > 1 and self._over_limit():
+                _, removed = self._entries.popitem(last=False)
+                self._size -= len(removed.content)
+                evicted += 1
+        self._record_evictions(evicted)
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._size > self.max_bytes
+
+    def delete_entry(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCache(BaseCache):
+    """
+    On-disk cache stored in an SQLite database, so responses can be
+    reused between processes/runs. The least recently used entries
+    are evicted once ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = 86400,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ):
+        """
+        :param path: Path to the database file, created if it doesn't exist
+        :param max_entries: Maximum number of responses to store, or None for no limit
+        :param max_bytes: Maximum total size of stored response bodies,
+           or None for no limit
+        :param ttl: Default time (in seconds) to keep responses for.
+           See [BaseCache][ols_py.cache.BaseCache]
+        :param endpoint_ttls: TTLs for specific API paths.
+           See [BaseCache][ols_py.cache.BaseCache]
+        """
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    expires REAL,
+                    headers TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT content, created, expires, headers FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        content, created, expires, headers = row
+        return CacheEntry(
+            content=content,
+            created=created,
+            expires=expires,
+            headers=json.loads(headers),
+        )
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.content,
+                    len(entry.content),
+                    entry.created,
+                    entry.expires,
+                    json.dumps(entry.headers),
+                    time.time(),
+                ),
+            )
+            evicted = self._evict()
+        self._record_evictions(evicted)
+
+    def _evict(self) -> int:
+        """
+        Delete least recently used entries until we're within the size limits.
+        Must be called with the lock held.
+
+        :return: Number of entries evicted
+        """
+        evicted = 0
+        if self.max_entries is not None:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY last_used DESC, rowid DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            evicted += cursor.rowcount
+        if self.max_bytes is not None:
+            # Keep the most recently used entries whose cumulative size
+            #   fits in max_bytes (always keeping at least one)
+            cursor = self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (
+                            ORDER BY last_used DESC, rowid DESC
+                        ) AS total, ROW_NUMBER() OVER (
+                            ORDER BY last_used DESC, rowid DESC
+                        ) AS row_num
+                        FROM responses
+                    ) WHERE total > ? AND row_num > 1
+                )
+                """,
+                (self.max_bytes,),
+            )
+            evicted += cursor.rowcount
+        return evicted
+
+    def delete_entry(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(count)
@@ -1,37 +1,386 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, Type, TypeVar
+import json
+import os
+import time
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from urllib.parse import quote_plus
 
 import pydantic
+import pydantic_core
 import requests
+import requests.adapters
 from pydantic import validate_call
 
 from . import schemas
+from .bulk import DEFAULT_MAX_WORKERS, BulkResults, run_bulk
+from .cache import BaseCache, CacheEntry
+from .coalesce import SingleFlight
 from .instances import EBI_OLS4
+from .instrumentation import (
+    CacheEvent,
+    CacheResult,
+    ClientHooks,
+    HookList,
+    ParseEvent,
+    RequestEvent,
+    RequestStartEvent,
+    RetryEvent,
+    get_endpoint,
+)
+from .lazy import LazyModel, is_lazy, lazy_validate
+from .pagination import (
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_ROWS,
+    check_page_size,
+    iter_pages,
+    lean_multiple_terms_items,
+    multiple_terms_items,
+    num_pages_from_page_info,
+    ontology_list_items,
+    raw_num_pages,
+    raw_terms_items,
+    search_items,
+    search_num_pages,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .retry import sleep as retry_sleep
+from .routing import InstanceRouter
 from .schemas.requests import GetTermRelativesParams, get_query_dict
+from .snapshot import SnapshotWriter
+from .term_store import BaseTermStore
 
 S = TypeVar("S", bound=pydantic.BaseModel, covariant=True)
 ParamsMapping = Mapping[str, Any]
+Timeout = Union[float, tuple[float, float], None]
 
+DEFAULT_TIMEOUT: Timeout = (10.0, 60.0)
+"""Default (connect, read) timeouts for requests, in seconds"""
+DEFAULT_POOL_SIZE = 10
+BEST_HIT_FIELDS: list[schemas.requests.SearchReturnFields] = [
+    "iri",
+    "label",
+    "obo_id",
+    "short_form",
+    "ontology_name",
+    "type",
+]
+"""Fields returned for each query by ``search_many(best_hit_only=True)``"""
 
-class Ols4Client:
+
+def create_session(
+    pool_maxsize: int = DEFAULT_POOL_SIZE,
+    pool_block: bool = False,
+    compression: bool = True,
+) -> requests.Session:
     """
-    Client for communicating with an OLS instance.
+    Create a session with a connection pool sized for ``pool_maxsize``
+    concurrent requests to the OLS server.
+
+    :param pool_maxsize: Maximum number of connections kept open to the server.
+        Set this to the number of threads sharing the client.
+    :param pool_block: Block when all connections are in use, rather
+        than opening extra connections that are discarded after the request
+    :param compression: Ask the server for compressed (gzip/deflate) responses
+    """
+    if pool_maxsize < 1:
+        raise ValueError("pool_maxsize must be at least 1")
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_maxsize=pool_maxsize, pool_block=pool_block
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not compression:
+        session.headers["accept-encoding"] = "identity"
+    return session
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for deduplication: collapse whitespace and
+    ignore case, so e.g. "Type 2  diabetes" and "type 2 diabetes" are
+    only searched once
+    """
+    return " ".join(query.split()).casefold()
+
+
+def _get_validators(resp: requests.Response) -> dict[str, str]:
+    """
+    Get the headers needed to revalidate a response with a conditional request
+    """
+    return {
+        name: resp.headers[name]
+        for name in ("ETag", "Last-Modified")
+        if name in resp.headers
+    }
+
+
+class _BaseOls4Client:
+    """
+    Functionality shared between the sync and async clients: building
+    URLs and request parameters, and deciding when to retry.
     """
 
     base_url: str
+    retry: Optional[RetryPolicy]
+    rate_limiter: Optional[RateLimiter]
+    hooks: HookList
+    term_store: Optional[BaseTermStore]
+    lazy: bool
+    router: Optional[InstanceRouter]
 
-    def __init__(self, base_url: str = EBI_OLS4):
+    def __init__(
+        self,
+        base_url: str | Sequence[str] = EBI_OLS4,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Iterable[ClientHooks] = (),
+        term_store: Optional[BaseTermStore] = None,
+        lazy: bool = False,
+        router: Optional[InstanceRouter] = None,
+    ):
         """
-        :param base_url: Base API URL for the OLS instance, up to and including /api/
+        :param base_url: Base API URL for the OLS instance, up to and including
+           /api/, or several URLs to route requests between
+        :param retry: Optional policy for retrying failed requests
+        :param rate_limiter: Optional rate limiter for requests
+        :param hooks: Hooks to send instrumentation events to
+        :param term_store: Optional store to save parsed terms in
+        :param lazy: Return lazily validated proxies instead of models
+        :param router: Optional router for sending requests to several
+           instances, overrides ``base_url``
         """
+        if router is None and not isinstance(base_url, str):
+            router = InstanceRouter(base_url)
+        if router is not None:
+            base_url = router.base_url
+        assert isinstance(base_url, str)
         if not base_url.endswith("/"):
             base_url = base_url + "/"
         self.base_url = base_url
-        self._session = requests.Session()
-        self._session.headers.update({"accept": "application/json"})
-        # TODO: do we need to set access-control-allow-origin header?
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.hooks = HookList(hooks)
+        self.term_store = term_store
+        self.lazy = lazy
+        self.router = router
+
+    def _get_retry_delay(
+        self,
+        attempt: int,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        connection_error: bool = False,
+    ) -> Optional[float]:
+        """
+        Check whether a failed request should be retried, using the retry policy.
+        If the server says we're sending too many requests, requests from all
+        threads sharing the rate limiter are paused until the retry.
+
+        :return: Seconds to wait before retrying, or None to not retry
+        """
+        if self.retry is None:
+            return None
+        delay = self.retry.get_retry_delay(
+            attempt,
+            status=status,
+            retry_after=retry_after,
+            connection_error=connection_error,
+        )
+        if delay is not None and status == 429 and self.rate_limiter is not None:
+            self.rate_limiter.pause(delay)
+        return delay
+
+    def _emit_request(
+        self,
+        url: str,
+        start: float,
+        attempt: int,
+        status: Optional[int] = None,
+        num_bytes: int = 0,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Send a finished request to the hooks (callers should check
+        ``self.hooks`` first, to skip timing requests when there are no hooks)
+        """
+        self.hooks.on_request(
+            RequestEvent(
+                endpoint=get_endpoint(url[len(self.base_url) :]),
+                url=url,
+                status=status,
+                seconds=time.perf_counter() - start,
+                num_bytes=num_bytes,
+                attempt=attempt,
+                error=error,
+            )
+        )
+
+    def _emit_retry(
+        self, url: str, attempt: int, delay: float, status: Optional[int] = None
+    ) -> None:
+        if self.hooks:
+            self.hooks.on_retry(
+                RetryEvent(
+                    endpoint=get_endpoint(url[len(self.base_url) :]),
+                    url=url,
+                    attempt=attempt,
+                    delay=delay,
+                    status=status,
+                )
+            )
+
+    def _emit_request_start(self, url: str) -> None:
+        if self.hooks:
+            self.hooks.on_request_start(
+                RequestStartEvent(
+                    endpoint=get_endpoint(url[len(self.base_url) :]), url=url
+                )
+            )
+
+    def _get_error_retry_delay(
+        self, url: str, start: float, attempt: int, error: BaseException
+    ) -> Optional[float]:
+        """
+        Send a request that failed to connect to the hooks, and check
+        whether it should be retried
+
+        :return: Seconds to wait before retrying, or None to not retry
+        """
+        if self.hooks:
+            self._emit_request(url, start, attempt, error=error)
+        return self._get_retry_delay(attempt, connection_error=True)
+
+    def _get_response_retry_delay(
+        self,
+        url: str,
+        start: float,
+        attempt: int,
+        status: int,
+        headers: Mapping[str, str],
+        num_bytes: int,
+    ) -> Optional[float]:
+        """
+        Send a finished request to the hooks, and check whether
+        it should be retried
+
+        :return: Seconds to wait before retrying, or None to not retry
+        """
+        if self.hooks:
+            self._emit_request(url, start, attempt, status=status, num_bytes=num_bytes)
+        return self._get_retry_delay(
+            attempt, status=status, retry_after=headers.get("Retry-After")
+        )
+
+    def _emit_cache(self, url: str, result: CacheResult) -> None:
+        if self.hooks:
+            self.hooks.on_cache(
+                CacheEvent(
+                    endpoint=get_endpoint(url[len(self.base_url) :]),
+                    url=url,
+                    result=result,
+                )
+            )
+
+    def _emit_parse(
+        self,
+        path: str,
+        schema: Optional[Type[pydantic.BaseModel]],
+        decode_seconds: float = 0.0,
+        validation_seconds: float = 0.0,
+    ) -> None:
+        self.hooks.on_parse(
+            ParseEvent(
+                endpoint=get_endpoint(path),
+                schema=schema.__name__ if schema is not None else None,
+                decode_seconds=decode_seconds,
+                validation_seconds=validation_seconds,
+            )
+        )
+
+    def _parse_content(
+        self, schema: Type[S], path: str, content: bytes
+    ) -> S | LazyModel[S]:
+        """
+        Parse a response body with ``schema``, or wrap it in a lazily
+        validated proxy if ``self.lazy`` is set
+        """
+        if self.lazy:
+            # pydantic's JSON parser is faster than the json module
+            if not self.hooks:
+                return lazy_validate(schema, pydantic_core.from_json(content))
+            start = time.perf_counter()
+            data = pydantic_core.from_json(content)
+            self._emit_parse(path, schema, decode_seconds=time.perf_counter() - start)
+            return lazy_validate(schema, data)
+        # Validate directly from the raw JSON bytes, which is much faster
+        #   than decoding to a dict first
+        if not self.hooks:
+            return schema.model_validate_json(content)
+        start = time.perf_counter()
+        obj = schema.model_validate_json(content)
+        self._emit_parse(path, schema, validation_seconds=time.perf_counter() - start)
+        return obj
+
+    def _store_terms(self, obj: pydantic.BaseModel | LazyModel[Any]) -> None:
+        """
+        Add the terms in a parsed response to the term store, if there is one.
+        Lazy terms are validated before they're stored.
+        """
+        if self.term_store is None:
+            return
+        multiple_terms = (
+            schemas.responses.MultipleTerms,
+            schemas.responses.TermInDefiningOntology,
+        )
+        if isinstance(obj, LazyModel):
+            if is_lazy(obj, schemas.responses.Term):
+                self.term_store.add([obj.materialize()])
+            elif any(is_lazy(obj, schema) for schema in multiple_terms):
+                if obj.embedded is not None:
+                    self.term_store.add(t.materialize() for t in obj.embedded.terms)
+        elif isinstance(obj, schemas.responses.Term):
+            self.term_store.add([obj])
+        elif isinstance(obj, multiple_terms):
+            if obj.embedded is not None:
+                self.term_store.add(obj.embedded.terms)
+
+    def _get_stored_term(
+        self, ontology_id: str, iri: str
+    ) -> Optional[schemas.responses.Term]:
+        """
+        Get a term from the term store, wrapped in a proxy if ``self.lazy``
+        is set so it has the same type as terms from the API
+        """
+        if self.term_store is None:
+            return None
+        stored = self.term_store.get(ontology_id, iri)
+        if stored is not None and self.lazy:
+            return cast(schemas.responses.Term, LazyModel.from_model(stored))
+        return stored
+
+    def _store_streamed(
+        self, terms: list[schemas.responses.Term]
+    ) -> list[schemas.responses.Term]:
+        """
+        Add terms from a streamed response to the term store, returning them
+        """
+        if self.term_store is not None and terms:
+            self.term_store.add(terms)
+        return terms
 
     def _create_url(self, path: str) -> str:
         # Remove leading /
@@ -48,6 +397,191 @@ class Ols4Client:
         """
         return quote_plus(quote_plus(iri))
 
+    @staticmethod
+    def _add_wildcards(query: str) -> str:
+        """
+        Add a wildcard (*) to each word/term in the query.
+        """
+        with_wildcards = [f"{term}*" for term in query.split(" ")]
+        return " ".join(with_wildcards)
+
+    @staticmethod
+    def _get_terms_filters(
+        params: Optional[schemas.requests.GetTermsParams],
+    ) -> schemas.requests.GetTermsParams:
+        """
+        Get the filters from GetTermsParams, removing pagination params
+        """
+        filters = schemas.requests.GetTermsParams(**(params or {}))
+        filters.pop("page", None)
+        filters.pop("size", None)
+        return filters
+
+    @staticmethod
+    def _get_term_id_params(
+        term_id: str,
+    ) -> schemas.requests.TermInDefiningOntologyParams:
+        """
+        Get the params to look up a term by IRI, OBO ID (e.g. "MONDO:0018660")
+        or short form (e.g. "MONDO_0018660")
+        """
+        if "://" in term_id:
+            return {"iri": term_id}
+        if ":" in term_id:
+            return {"obo_id": term_id}
+        return {"short_form": term_id}
+
+    @staticmethod
+    def _get_defining_term(
+        resp: schemas.responses.TermInDefiningOntology, term_id: str
+    ) -> schemas.responses.Term:
+        """
+        Get the term from a /findByIdAndIsDefiningOntology response
+
+        :raises LookupError: if no term was found
+        """
+        if resp.embedded is None or not resp.embedded.terms:
+            raise LookupError(f"No term found in a defining ontology for {term_id}")
+        return resp.embedded.terms[0]
+
+    @classmethod
+    def _get_search_params(
+        cls,
+        query: str,
+        params: Optional[schemas.requests.SearchParams | schemas.requests.SelectParams],
+        add_wildcards: bool,
+        fields: Optional[list[schemas.requests.SearchReturnFields]] = None,
+    ) -> dict[str, str]:
+        """
+        Build the GET parameters for the /search and /select endpoints
+        """
+        if add_wildcards:
+            query = cls._add_wildcards(query)
+        if fields is not None:
+            params = {**(params or {}), "fieldList": list(fields)}
+        if params is None:
+            return {"q": query}
+        return {"q": query, **get_query_dict(params)}
+
+    @staticmethod
+    def _get_search_many_params(
+        params: Optional[schemas.requests.SearchParams], best_hit_only: bool
+    ) -> dict[str, str]:
+        """
+        Build the GET parameters shared by every query in ``search_many()``
+        (everything except ``q``), so they're only converted once
+        """
+        search_params: dict[str, Any] = dict(params or {})
+        if best_hit_only:
+            search_params["rows"] = 1
+            search_params.setdefault("fieldList", BEST_HIT_FIELDS)
+        return get_query_dict(cast(schemas.requests.SearchParams, search_params))
+
+
+class Ols4Client(_BaseOls4Client):
+    """
+    Client for communicating with an OLS instance.
+
+    A client can be shared between threads, e.g. in a thread pool: requests
+    share the session's connection pool, and the cache, retry policy and
+    rate limiter are all thread-safe. Set ``pool_maxsize`` to the number of
+    threads so they don't have to wait for connections.
+    """
+
+    cache: Optional[BaseCache]
+    timeout: Timeout
+
+    def __init__(
+        self,
+        base_url: str | Sequence[str] = EBI_OLS4,
+        cache: Optional[BaseCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        pool_block: bool = False,
+        compression: bool = True,
+        session: Optional[requests.Session] = None,
+        coalesce: bool = False,
+        hooks: Iterable[ClientHooks] = (),
+        term_store: Optional[BaseTermStore] = None,
+        lazy: bool = False,
+        router: Optional[InstanceRouter] = None,
+    ):
+        """
+        :param base_url: Base API URL for the OLS instance, up to and including /api/.
+           Pass several URLs (e.g. a local mirror and ``EBI_OLS4``) to send each
+           request to the fastest healthy instance, failing over to the others
+           if it fails. See [routing][ols_py.routing]
+        :param cache: Optional cache for responses, e.g.
+           [MemoryCache][ols_py.cache.MemoryCache] or
+           [SqliteCache][ols_py.cache.SqliteCache]. Responses that are
+           in the cache and not expired are returned without a request
+           to the server. A ``MemoryCache`` may also return the same model
+           instance for repeated requests (see its ``keep_parsed``), so treat
+           returned models as read-only.
+        :param retry: Optional [RetryPolicy][ols_py.retry.RetryPolicy] for retrying
+           requests that fail with rate limiting (429), server errors or
+           connection errors. By default requests are not retried.
+        :param rate_limiter: Optional [RateLimiter][ols_py.rate_limit.RateLimiter]
+           to limit the rate requests are sent at. Can be shared between clients.
+        :param timeout: Timeout for requests in seconds, either a single value or
+           a ``(connect, read)`` tuple. ``None`` waits forever.
+        :param pool_maxsize: Maximum number of connections kept open to the server.
+           Set this to the number of threads sharing the client.
+        :param pool_block: Make threads wait for a free connection when all
+           ``pool_maxsize`` connections are in use, instead of opening extra
+           connections that aren't reused
+        :param compression: Ask the server for compressed responses
+        :param session: Use your own ``requests.Session``, e.g. with custom
+           adapters, proxies or authentication. The pool and compression
+           options are ignored if this is provided.
+        :param coalesce: Share one request (and parsed result) between threads
+           making the same call at the same time, instead of each thread
+           sending its own request
+        :param hooks: [ClientHooks][ols_py.instrumentation.ClientHooks] to
+           receive events for requests, retries, cache lookups and response
+           parsing, e.g. a [StatsCollector][ols_py.instrumentation.StatsCollector]
+        :param term_store: Optional store for terms, e.g.
+           [SqliteTermStore][ols_py.term_store.SqliteTermStore]. Every term
+           the client gets from the term endpoints (including relatives, but not
+           properties or individuals) is added to it, and ``get_term()``
+           returns stored terms without a request.
+        :param lazy: Return [LazyModel][ols_py.lazy.LazyModel] proxies from
+           ``get_with_schema()`` and the methods that use it, which only
+           validate fields when they're accessed. Much faster when you only
+           read a few fields of each term in large pages. Call ``materialize()``
+           on a proxy to get the full model. Proxies are typed as the model
+           they wrap, but aren't instances of it: check for them with
+           [is_lazy()][ols_py.lazy.is_lazy]. Streamed and ``iter_lean_*``
+           results aren't affected.
+        :param router: [InstanceRouter][ols_py.routing.InstanceRouter] for
+           several instances, to configure how requests are routed or share the
+           instance health between clients. Overrides ``base_url``. Set a short
+           read ``timeout``, so slow instances are failed over from quickly.
+        """
+        super().__init__(
+            base_url=base_url,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            term_store=term_store,
+            lazy=lazy,
+            router=router,
+        )
+        self.cache = cache
+        self.timeout = timeout
+        if session is None:
+            session = create_session(
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                compression=compression,
+            )
+        self._session = session
+        self._session.headers.update({"accept": "application/json"})
+        self._single_flight = SingleFlight() if coalesce else None
+        # TODO: do we need to set access-control-allow-origin header?
+
     def get(self, path: str, params: Optional[ParamsMapping] = None) -> dict:
         """
         Perform a GET request to the API. Unlike most of
@@ -60,11 +594,161 @@ class Ols4Client:
         :return: JSON data, as a dict
         :raises HTTPError: if response is not OK
         """
+        if self._single_flight is None:
+            content, _ = self._get_content(path=path, params=params)
+        else:
+            key = (None, BaseCache.make_key(self._create_url(path), params))
+            content, _ = self._single_flight.do(
+                key, lambda: self._get_content(path=path, params=params)
+            )
+        if not self.hooks:
+            json_data: dict = json.loads(content)
+            return json_data
+        start = time.perf_counter()
+        json_data = json.loads(content)
+        self._emit_parse(path, None, decode_seconds=time.perf_counter() - start)
+        return json_data
+
+    def _get_content(
+        self, path: str, params: Optional[ParamsMapping] = None
+    ) -> tuple[bytes, Optional[CacheEntry]]:
+        """
+        Get the raw response body for ``path``, from the cache if possible.
+        Expired cache entries are revalidated with a conditional request.
+
+        :return: The response body, and the cache entry it is stored in (if caching)
+        :raises HTTPError: if response is not OK
+        """
         url = self._create_url(path)
-        resp = self._session.get(url=url, params=params)
+        if self.cache is None:
+            return self._send(url, params=params).content, None
+        key = self.cache.make_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            self._emit_cache(url, "hit")
+            return entry.content, entry
+        self._emit_cache(url, "miss" if entry is None else "stale")
+        headers = entry.conditional_headers() if entry is not None else None
+        resp = self._send(url, params=params, headers=headers)
+        validators = _get_validators(resp)
+        if resp.status_code == 304 and entry is not None:
+            self._emit_cache(url, "revalidated")
+            entry = self.cache.revalidate(
+                key, path=path, entry=entry, headers=validators
+            )
+            return entry.content, entry
+        entry = self.cache.store(
+            key, path=path, content=resp.content, headers=validators
+        )
+        return entry.content, entry
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[ParamsMapping] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a GET request to the server, waiting for the rate limiter
+        and retrying according to the retry policy
+
+        :param stream: Return as soon as the headers are received, without
+          reading the body. The response must be closed by the caller.
+        :raises HTTPError: if response is not OK
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self._emit_request_start(url)
+            start = time.perf_counter()
+            status = None
+            try:
+                resp = self._session_get(url, params, headers, stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._get_error_retry_delay(url, start, attempt, e)
+                if delay is None:
+                    raise
+            else:
+                status = resp.status_code
+                delay = self._get_response_retry_delay(
+                    url,
+                    start,
+                    attempt,
+                    status=status,
+                    headers=resp.headers,
+                    num_bytes=0 if stream else len(resp.content),
+                )
+                if delay is None:
+                    return self._raise_for_status(resp, stream)
+                if stream:
+                    resp.close()
+            self._emit_retry(url, attempt + 1, delay, status=status)
+            retry_sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _raise_for_status(resp: requests.Response, stream: bool) -> requests.Response:
+        """
+        Return ``resp`` if it's OK, otherwise close it (if streamed) and raise
+
+        :raises HTTPError: if response is not OK
+        """
+        if stream and not resp.ok:
+            resp.close()
         resp.raise_for_status()
-        json_data: dict = resp.json()
-        return json_data
+        return resp
+
+    def _session_get(
+        self,
+        url: str,
+        params: Optional[ParamsMapping],
+        headers: Optional[Mapping[str, str]],
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Send a single GET request, routing it to one of the instances
+        if there are several. If an instance fails, the request is sent
+        to the next one, and the last error/response is returned.
+        """
+        if self.router is None:
+            return self._session.get(
+                url=url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream,
+            )
+        path = url[len(self.base_url) :]
+        resp: Optional[requests.Response] = None
+        error: Optional[Exception] = None
+        for instance in self.router.candidates():
+            if resp is not None and stream:
+                resp.close()
+            resp = None
+            start = time.perf_counter()
+            try:
+                resp = self._session.get(
+                    url=instance.base_url + path,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.router.record_failure(instance)
+                error = e
+                continue
+            if self.router.is_failure(resp.status_code):
+                self.router.record_failure(instance)
+                continue
+            self.router.record_success(instance, time.perf_counter() - start)
+            return resp
+        if resp is not None:
+            return resp
+        assert error is not None
+        raise error
 
     def get_with_schema(
         self, schema: Type[S], path: str, params: Optional[ParamsMapping] = None
@@ -80,10 +764,72 @@ class Ols4Client:
         :raises pydantic.ValidationError: if response data fails
            to validate.
         """
-        resp = self.get(path=path, params=params)
-        obj = schema(**resp)
+        return self._get_with_schema(schema, path, params)
+
+    def _get_with_schema(
+        self,
+        schema: Type[S],
+        path: str,
+        params: Optional[ParamsMapping] = None,
+        store_terms: bool = False,
+    ) -> S:
+        """
+        Get data from ``path`` and parse it with ``schema``, sharing
+        the request with other threads if ``coalesce`` is set
+
+        :param store_terms: Add the terms in the response to the term store.
+          Only set this for the term endpoints: properties and individuals
+          are parsed with the same schema, but mustn't be returned by
+          ``get_term()``.
+        """
+        if self._single_flight is None:
+            return self._get_and_parse(schema, path, params, store_terms)
+        key = (schema, BaseCache.make_key(self._create_url(path), params))
+        return self._single_flight.do(
+            key, lambda: self._get_and_parse(schema, path, params, store_terms)
+        )
+
+    def _get_and_parse(
+        self,
+        schema: Type[S],
+        path: str,
+        params: Optional[ParamsMapping],
+        store_terms: bool,
+    ) -> S:
+        content, entry = self._get_content(path=path, params=params)
+        parsed = None
+        # Lazy proxies aren't kept on the cache entry, since the cache
+        #   may be shared with clients that aren't lazy
+        if entry is not None and self.cache is not None and self.cache.keep_parsed:
+            parsed = entry.parsed
+        if parsed is not None and not self.lazy and schema in parsed:
+            return cast(S, parsed[schema])
+        obj = self._parse_content(schema, path, content)
+        if store_terms:
+            self._store_terms(obj)
+        if isinstance(obj, LazyModel):
+            # Proxies are read the same way as the model, so they're
+            #   returned as it, see the ``lazy`` option
+            return cast(S, obj)
+        if parsed is not None:
+            parsed[schema] = obj
         return obj
 
+    def _stream_terms(
+        self, path: str, params: Optional[ParamsMapping] = None
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Stream the terms from a MultipleTerms response, validating each
+        term as soon as it has been downloaded
+        """
+        from .streaming import STREAM_CHUNK_SIZE, TERMS_PREFIX, ItemParser
+
+        parser = ItemParser(schemas.responses.Term, TERMS_PREFIX)
+        with self._send(self._create_url(path), params=params, stream=True) as resp:
+            for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+                yield from self._store_streamed(parser.feed(chunk))
+        yield from self._store_streamed(parser.close())
+
     def get_api_info(self) -> schemas.responses.ApiInfo:
         """
         Get the list of endpoints supported by the API
@@ -108,6 +854,27 @@ class Ols4Client:
         )
         return ontology_list
 
+    def iter_ontologies(
+        self, page_size: int = MAX_PAGE_SIZE, prefetch: bool | int = True
+    ) -> Iterator[schemas.responses.OntologyItem]:
+        """
+        Iterate over every ontology the OLS instance has, fetching
+        pages of results as needed.
+
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        check_page_size(page_size)
+        return iter_pages(
+            lambda page: self.get_ontologies(page=page, size=page_size),
+            get_items=ontology_list_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
     def get_ontology(self, ontology_id: str) -> schemas.responses.OntologyItem:
         """
         Get details for a single ontology
@@ -126,9 +893,12 @@ class Ols4Client:
         :param iri: IRI for a single term
         :return: Term details
         """
+        stored = self._get_stored_term(ontology_id, iri)
+        if stored is not None:
+            return stored
         iri = self._quote_iri(iri)
         path = f"/ontologies/{ontology_id}/terms/{iri}"
-        term = self.get_with_schema(schemas.responses.Term, path)
+        term = self._get_with_schema(schemas.responses.Term, path, store_terms=True)
         return term
 
     def get_terms(
@@ -141,10 +911,123 @@ class Ols4Client:
             number of results with ``page`` and ``size``
         """
         path = f"/ontologies/{ontology_id}/terms"
-        return self.get_with_schema(
-            schemas.responses.MultipleTerms, path, params=params
+        return self._get_with_schema(
+            schemas.responses.MultipleTerms, path, params=params, store_terms=True
+        )
+
+    def stream_terms(
+        self, ontology_id: str, params: Optional[schemas.requests.GetTermsParams] = None
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Get a page of terms like [get_terms()][ols_py.client.Ols4Client.get_terms],
+        but parse the response as it's downloaded, yielding each term as soon
+        as it's complete. Memory use doesn't depend on the page size, so large
+        pages (e.g. ``size=10000``) can be used.
+
+        Requires the ``stream`` extra: ``pip install ols-py[stream]``.
+        Responses aren't cached.
+
+        :param params: Optional params. Filter by iri, short_form or obo_id, or specify the
+            number of results with ``page`` and ``size``
+        """
+        path = f"/ontologies/{ontology_id}/terms"
+        return self._stream_terms(path, params=params)
+
+    def iter_terms(
+        self,
+        ontology_id: str,
+        params: Optional[schemas.requests.GetTermsParams] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over every term in a specific ontology, fetching pages
+        of results as needed.
+
+        :param params: Optional params to filter by iri, short_form or obo_id.
+          ``page`` and ``size`` are ignored, use ``page_size`` instead.
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        check_page_size(page_size)
+        filters = self._get_terms_filters(params)
+        return iter_pages(
+            lambda page: self.get_terms(
+                ontology_id, params={**filters, "page": page, "size": page_size}
+            ),
+            get_items=multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
         )
 
+    def iter_lean_terms(
+        self,
+        ontology_id: str,
+        params: Optional[schemas.requests.GetTermsParams] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.LeanTerm]:
+        """
+        Iterate over every term in a specific ontology, like
+        [iter_terms()][ols_py.client.Ols4Client.iter_terms], but returning
+        compact [LeanTerm][ols_py.schemas.responses.LeanTerm] objects with
+        only the core fields, which use much less memory and are faster to parse.
+
+        :param params: Optional params to filter by iri, short_form or obo_id.
+          ``page`` and ``size`` are ignored, use ``page_size`` instead.
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        check_page_size(page_size)
+        filters = self._get_terms_filters(params)
+        path = f"/ontologies/{ontology_id}/terms"
+        return iter_pages(
+            lambda page: self.get_with_schema(
+                schemas.responses.LeanMultipleTerms,
+                path,
+                params={**filters, "page": page, "size": page_size},
+            ),
+            get_items=lean_multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def export_ontology(
+        self,
+        ontology_id: str,
+        path: str | os.PathLike[str],
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> int:
+        """
+        Download every term in an ontology to a snapshot file, which can be
+        loaded with [OntologySnapshot][ols_py.snapshot.OntologySnapshot]
+        to look up terms without access to the server.
+
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param path: Path to save the snapshot to. An index is also
+          saved to ``<path>.index.json``
+        :param page_size: Number of terms to request per page (defaults to the
+          maximum the API allows)
+        :return: Number of terms exported
+        """
+        check_page_size(page_size)
+        endpoint = f"/ontologies/{ontology_id}/terms"
+        pages = iter_pages(
+            lambda page: self.get(endpoint, params={"page": page, "size": page_size}),
+            get_items=raw_terms_items,
+            get_num_pages=raw_num_pages,
+        )
+        with SnapshotWriter(path, ontology_id=ontology_id) as writer:
+            for term in pages:
+                writer.write(term)
+        return len(writer)
+
     def find_terms(self, params: schemas.requests.GetTermsParams):
         """
         Search for terms across ontologies.
@@ -162,8 +1045,8 @@ class Ols4Client:
             curl -L 'http://www.ebi.ac.uk/ols4/api/terms?id=EFO:0000001' -i -H 'Accept: application/json'
         """
         path = "/terms"
-        return self.get_with_schema(
-            schemas.responses.MultipleTerms, path, params=params
+        return self._get_with_schema(
+            schemas.responses.MultipleTerms, path, params=params, store_terms=True
         )
 
     def get_term_in_defining_ontology(
@@ -188,16 +1071,65 @@ class Ols4Client:
         if iri:
             iri_encoded = self._quote_iri(iri)
             path = f"/terms/findByIdAndIsDefiningOntology/{iri_encoded}"
-            return self.get_with_schema(
-                schemas.responses.TermInDefiningOntology, path=path
+            return self._get_with_schema(
+                schemas.responses.TermInDefiningOntology, path=path, store_terms=True
             )
         if params:
             path = "/terms/findByIdAndIsDefiningOntology"
-            return self.get_with_schema(
-                schemas.responses.TermInDefiningOntology, path=path, params=params
+            return self._get_with_schema(
+                schemas.responses.TermInDefiningOntology,
+                path=path,
+                params=params,
+                store_terms=True,
             )
         raise ValueError("One of iri or params arguments is required")
 
+    def get_terms_bulk(
+        self,
+        ontology_id: str,
+        iris: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> BulkResults[str, schemas.responses.Term]:
+        """
+        Get many terms in a specific ontology by IRI, sending requests
+        concurrently. Duplicate IRIs are only requested once.
+
+        :param ontology_id: Ontology ID/name, e.g. "mondo"
+        :param iris: IRIs of the terms
+        :param max_workers: Maximum number of requests to send at once
+        :return: Dict of IRI to term, in the same order as ``iris``. If a lookup
+          fails, e.g. because the IRI isn't in the ontology, the exception that was
+          raised is returned in place of the term, so check with
+          ``isinstance(result, Exception)``
+        """
+        return run_bulk(
+            iris, lambda iri: self.get_term(ontology_id, iri), max_workers=max_workers
+        )
+
+    def resolve_many(
+        self, ids: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BulkResults[str, schemas.responses.Term]:
+        """
+        Look up many terms in their defining ontologies, sending requests
+        concurrently. Duplicate IDs are only requested once.
+
+        :param ids: Term IDs: IRIs, OBO IDs (e.g. "MONDO:0018660") or short forms
+          (e.g. "MONDO_0018660"). IDs can be from different ontologies
+        :param max_workers: Maximum number of requests to send at once
+        :return: Dict of ID to term, in the same order as ``ids``. Failed
+          lookups have the exception that was raised in place of the term,
+          e.g. ``LookupError`` if no term was found.
+        """
+        return run_bulk(ids, self._resolve_term, max_workers=max_workers)
+
+    def _resolve_term(self, term_id: str) -> schemas.responses.Term:
+        params = self._get_term_id_params(term_id)
+        if "iri" in params:
+            resp = self.get_term_in_defining_ontology(iri=term_id)
+        else:
+            resp = self.get_term_in_defining_ontology(params=params)
+        return self._get_defining_term(resp, term_id)
+
     def _get_term_relatives(
         self,
         relatives: schemas.requests.RelativeTypes,
@@ -211,10 +1143,32 @@ class Ols4Client:
         path = f"/ontologies/{ontology_id}/{relatives}"
         if params is None:
             params = {}
-        return self.get_with_schema(
-            schemas.responses.MultipleTerms, path, params={"id": term_id, **params}
+        return self._get_with_schema(
+            schemas.responses.MultipleTerms,
+            path,
+            params={"id": term_id, **params},
+            store_terms=True,
         )
 
+    def stream_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        params: Optional[GetTermRelativesParams] = None,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Get a page of a term's parents, children, ancestors etc., parsing
+        the response as it's downloaded. See [stream_terms()][ols_py.client.Ols4Client.stream_terms]
+
+        :param relatives: Type of relatives, e.g. "descendants"
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param term_id: Term ID (URI, short form or obo ID)
+        :param params: optional pagination params, page and size
+        """
+        path = f"/ontologies/{ontology_id}/{relatives}"
+        return self._stream_terms(path, params={"id": term_id, **(params or {})})
+
     def get_term_parents(
         self,
         ontology_id: str,
@@ -315,19 +1269,207 @@ class Ols4Client:
         Get hierarchical descendants for a term. See [get_term_parents()][ols_py.client.OlsClient.get_term_parents]
         """
         return self._get_term_relatives(
-            "hierarchicalAncestors",
+            "hierarchicalDescendants",
             ontology_id=ontology_id,
             term_id=term_id,
             params=params,
         )
 
-    @staticmethod
-    def _add_wildcards(query: str) -> str:
+    def _iter_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
         """
-        Add a wildcard (*) to each word/term in the query.
+        Common method for iterating over every page of a term's
+        parents, children, ancestors etc.
         """
-        with_wildcards = [f"{term}*" for term in query.split(" ")]
-        return " ".join(with_wildcards)
+        check_page_size(page_size)
+        return iter_pages(
+            lambda page: self._get_term_relatives(
+                relatives,
+                ontology_id=ontology_id,
+                term_id=term_id,
+                params={"page": page, "size": page_size},
+            ),
+            get_items=multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def iter_lean_term_relatives(
+        self,
+        relatives: schemas.requests.RelativeTypes,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.LeanTerm]:
+        """
+        Iterate over all of a term's parents, children, ancestors etc.
+        as compact [LeanTerm][ols_py.schemas.responses.LeanTerm] objects, with
+        only the core fields. Useful for large traversals, e.g.
+        all the descendants of a high-level term.
+
+        :param relatives: Which relatives to get, e.g. "descendants" or "hierarchicalAncestors"
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param term_id: Term ID (URI, short form or obo ID)
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        check_page_size(page_size)
+        path = f"/ontologies/{ontology_id}/{relatives}"
+        return iter_pages(
+            lambda page: self.get_with_schema(
+                schemas.responses.LeanMultipleTerms,
+                path,
+                params={"id": term_id, "page": page, "size": page_size},
+            ),
+            get_items=lean_multiple_terms_items,
+            get_num_pages=num_pages_from_page_info,
+            prefetch=prefetch,
+        )
+
+    def iter_term_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all parents of a term, fetching pages of results
+        as needed.
+
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param term_id: Term ID (URI, short form or obo ID)
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        return self._iter_term_relatives(
+            "parents",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_parents(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical parents of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "hierarchicalParents",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_children(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all children of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "children",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all ancestors of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "ancestors",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all descendants of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "descendants",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_ancestors(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical ancestors of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "hierarchicalAncestors",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_term_hierarchical_descendants(
+        self,
+        ontology_id: str,
+        term_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.Term]:
+        """
+        Iterate over all hierarchical descendants of a term. See [iter_term_parents()][ols_py.client.Ols4Client.iter_term_parents]
+        """
+        return self._iter_term_relatives(
+            "hierarchicalDescendants",
+            ontology_id=ontology_id,
+            term_id=term_id,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
 
     @validate_call
     def search(
@@ -335,6 +1477,7 @@ class Ols4Client:
         query: str,
         params: Optional[schemas.requests.SearchParams] = None,
         add_wildcards: bool = False,
+        fields: Optional[list[schemas.requests.SearchReturnFields]] = None,
     ) -> schemas.responses.SearchResponse:
         """
         Search for ``query`` using the /search API endpoint.
@@ -343,14 +1486,12 @@ class Ols4Client:
         :param params: dictionary of search parameters
         :param add_wildcards: Add a wildcard * to each word in ``query`` -
            good for broad/flexible searches
+        :param fields: Only return these fields for each result (overriding
+           ``fieldList`` in ``params``). The server leaves out the other
+           fields, so responses are smaller and faster to parse.
         :return:
         """
-        if add_wildcards:
-            query = self._add_wildcards(query)
-        if params is None:
-            request_params = {"q": query}
-        else:
-            request_params = {"q": query, **get_query_dict(params)}
+        request_params = self._get_search_params(query, params, add_wildcards, fields)
         resp = self.get_with_schema(
             schemas.responses.SearchResponse, "/search", params=request_params
         )
@@ -362,6 +1503,7 @@ class Ols4Client:
         query: str,
         params: Optional[schemas.requests.SelectParams] = None,
         add_wildcards: bool = False,
+        fields: Optional[list[schemas.requests.SearchReturnFields]] = None,
     ) -> schemas.responses.SearchResponse:
         """
         Search for ``query`` using the /select API endpoint, which
@@ -371,19 +1513,146 @@ class Ols4Client:
         :param params: dictionary of optional parameters
         :param add_wildcards: Add a wildcard * to each word in ``query`` -
            good for broad/flexible searches
+        :param fields: Only return these fields for each result (overriding
+           ``fieldList`` in ``params``). The server leaves out the other
+           fields, so responses are smaller and faster to parse.
         :return:
         """
-        if add_wildcards:
-            query = self._add_wildcards(query)
-        if params is None:
-            request_params = {"q": query}
-        else:
-            request_params = {"q": query, **get_query_dict(params)}
+        request_params = self._get_search_params(query, params, add_wildcards, fields)
         resp = self.get_with_schema(
-            schemas.responses.SearchResponse, "/search", params=request_params
+            schemas.responses.SearchResponse, "/select", params=request_params
         )
         return resp
 
+    def search_many(
+        self,
+        queries: Iterable[str],
+        params: Optional[schemas.requests.SearchParams] = None,
+        add_wildcards: bool = False,
+        best_hit_only: bool = False,
+        deduplicate: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> BulkResults[str, schemas.responses.SearchResponse]:
+        """
+        Run many searches with the same ``params``, sending requests concurrently.
+
+        :param queries: Queries to search for, e.g. free-text phenotype descriptions
+        :param params: Search parameters used for every query
+        :param add_wildcards: Add a wildcard * to each word in the queries
+        :param best_hit_only: Only get the top result for each query, with
+          the fields in ``BEST_HIT_FIELDS`` (unless ``params`` has a ``fieldList``),
+          to reduce the size of the responses
+        :param deduplicate: Only search once for queries that are the same
+          after [normalize_query()][ols_py.client.normalize_query]. The
+          normalized query is sent to the server.
+        :param max_workers: Maximum number of requests to send at once
+        :return: Dict of query to search response, in the same order as ``queries``.
+          If a search fails, the exception that was raised is returned in
+          place of the response.
+        """
+        queries = list(queries)
+        shared_params = self._get_search_many_params(params, best_hit_only)
+
+        def search(query: str) -> schemas.responses.SearchResponse:
+            if add_wildcards:
+                query = self._add_wildcards(query)
+            return self.get_with_schema(
+                schemas.responses.SearchResponse,
+                "/search",
+                params={"q": query, **shared_params},
+            )
+
+        if not deduplicate:
+            return run_bulk(queries, search, max_workers=max_workers)
+        results = run_bulk(
+            (normalize_query(q) for q in queries), search, max_workers=max_workers
+        )
+        return {query: results[normalize_query(query)] for query in queries}
+
+    def _iter_search_results(
+        self,
+        method,
+        query: str,
+        params: Optional[schemas.requests.SearchParams | schemas.requests.SelectParams],
+        add_wildcards: bool,
+        page_size: int,
+        prefetch: bool | int,
+    ) -> Iterator[schemas.responses.SearchResultItem]:
+        """
+        Common method for iterating over every page of search()/select() results
+        """
+        check_page_size(page_size)
+        search_params: dict[str, Any] = dict(params or {})
+        start = int(search_params.pop("start", 0))
+        search_params.pop("rows", None)
+        return iter_pages(
+            lambda page: method(
+                query,
+                params={
+                    **search_params,
+                    "rows": page_size,
+                    "start": start + page * page_size,
+                },
+                add_wildcards=add_wildcards,
+            ),
+            get_items=search_items,
+            get_num_pages=search_num_pages(start=start, rows=page_size),
+            prefetch=prefetch,
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SearchParams] = None,
+        add_wildcards: bool = False,
+        page_size: int = MAX_SEARCH_ROWS,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.SearchResultItem]:
+        """
+        Iterate over every result for ``query`` from the /search API endpoint,
+        fetching pages of results as needed. See [search()][ols_py.client.Ols4Client.search]
+
+        :param query: term(s) to search for
+        :param params: dictionary of search parameters. ``rows`` is ignored,
+          use ``page_size`` instead. Results are returned starting from
+          ``start`` if provided.
+        :param add_wildcards: Add a wildcard * to each word in ``query``
+        :param page_size: Number of results per page (defaults to the maximum
+          the API allows)
+        :param prefetch: Fetch the next page in the background while the
+          current page is being consumed. Pass a number to fetch that many
+          pages at once, e.g. ``prefetch=8`` for large traversals
+        """
+        return self._iter_search_results(
+            self.search,
+            query,
+            params=params,
+            add_wildcards=add_wildcards,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_select(
+        self,
+        query: str,
+        params: Optional[schemas.requests.SelectParams] = None,
+        add_wildcards: bool = False,
+        page_size: int = MAX_SEARCH_ROWS,
+        prefetch: bool | int = True,
+    ) -> Iterator[schemas.responses.SearchResultItem]:
+        """
+        Iterate over every result for ``query`` from the /select API endpoint.
+        See [iter_search()][ols_py.client.Ols4Client.iter_search]
+        """
+        return self._iter_search_results(
+            self.select,
+            query,
+            params=params,
+            add_wildcards=add_wildcards,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     def get_property(self, ontology_id: str, iri: str) -> schemas.responses.Term:
         """
         Get a property from a specific ontology.
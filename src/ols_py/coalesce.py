@@ -0,0 +1,105 @@
+"""
+Request coalescing ("single-flight"): when several callers make the same
+call at the same time, only the first one actually runs it, and the rest
+wait for and share its result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls from multiple threads. Results
+    (or exceptions) are only shared with callers that were waiting while
+    the call was in flight - nothing is cached afterwards.
+    """
+
+    coalesced: int
+    """Number of calls that shared another call's result"""
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call ``func``, unless a call with the same ``key`` is already
+        in progress, in which case wait for its result instead.
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is not None:
+                self.coalesced += 1
+            else:
+                future: Future[Any] = Future()
+                self._calls[key] = future
+        if in_flight is not None:
+            shared: T = in_flight.result()
+            return shared
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        """
+        Number of calls currently in flight
+        """
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce identical concurrent calls from multiple asyncio tasks.
+    See [SingleFlight][ols_py.coalesce.SingleFlight]
+    """
+
+    coalesced: int
+    """Number of calls that shared another call's result"""
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``func()``, unless a call with the same ``key`` is already
+        in progress, in which case wait for its result instead.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+
+            async def run() -> T:
+                return await func()
+
+            task = self._calls[key] = asyncio.create_task(run())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # Shield the shared call so one caller being cancelled
+        #   doesn't cancel it for everyone else
+        result: T = await asyncio.shield(task)
+        return result
+
+    def __len__(self) -> int:
+        """
+        Number of calls currently in flight
+        """
+        return len(self._calls)
@@ -0,0 +1,188 @@
+"""
+Breadth-first crawling of an ontology subtree, expanding each level
+of the tree with concurrent requests, e.g.:
+
+    from ols_py.crawl import crawl_subtree
+    for edge in crawl_subtree(client, "hp", "http://purl.obolibrary.org/obo/HP_0000118"):
+        print(edge.child, "is a", edge.parent)
+
+Edges are yielded as soon as each term's children arrive, and can be passed
+to [HierarchyIndex.from_edges()][ols_py.hierarchy.HierarchyIndex.from_edges].
+Pass a [CrawlState][ols_py.crawl.CrawlState] to be able to resume an
+interrupted crawl.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterator, Literal, NamedTuple, Optional
+
+from .bulk import DEFAULT_MAX_WORKERS, check_max_workers
+from .hierarchy import check_skip_leaves
+from .schemas.responses import LeanTerm
+
+if TYPE_CHECKING:
+    from .client import Ols4Client
+
+ChildRelation = Literal["children", "hierarchicalChildren"]
+
+
+class Edge(NamedTuple):
+    """
+    A child/parent relationship found while crawling
+    """
+
+    child: str
+    """IRI of the child term"""
+    parent: str
+    """IRI of the parent term (or the root ID as it was passed in)"""
+    depth: int
+    """Depth of the child below the root (the root's children are at depth 1)"""
+    child_label: str
+
+
+@dataclass
+class CrawlState:
+    """
+    Progress of a crawl, updated as edges are yielded. If a crawl is
+    interrupted, pass the same state to
+    [crawl_subtree()][ols_py.crawl.crawl_subtree] to continue where it left off.
+    Terms are only marked as expanded once all their edges have been yielded,
+    so edges from the terms being processed at the time of the interruption
+    may be yielded again.
+    """
+
+    seen: set[str] = field(default_factory=set)
+    """Terms found so far, including the root"""
+    pending: dict[str, int] = field(default_factory=dict)
+    """Terms whose children still need to be fetched, with their depths"""
+    expanded: set[str] = field(default_factory=set)
+    """Terms whose children have been fetched"""
+
+    @property
+    def is_started(self) -> bool:
+        return bool(self.seen)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.is_started and not self.pending
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Save the state to a JSON file, to resume in another process with
+        [load()][ols_py.crawl.CrawlState.load]
+        """
+        data = {
+            "seen": sorted(self.seen),
+            "pending": self.pending,
+            "expanded": sorted(self.expanded),
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> CrawlState:
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            seen=set(data["seen"]),
+            pending=dict(data["pending"]),
+            expanded=set(data["expanded"]),
+        )
+
+
+def crawl_subtree(
+    client: Ols4Client,
+    ontology_id: str,
+    root_id: str,
+    relation: ChildRelation = "hierarchicalChildren",
+    max_depth: Optional[int] = None,
+    skip_leaves: Optional[bool] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    state: Optional[CrawlState] = None,
+) -> Iterator[Edge]:
+    """
+    Crawl the subtree below ``root_id`` breadth-first, yielding an edge for
+    each child/parent relationship. The children of all terms at one depth
+    are fetched concurrently, using ``max_workers`` threads.
+
+    Each term is only expanded once, even if it's reached through several
+    parents, but an edge is yielded for every parent.
+
+    :param client: Client to fetch children with
+    :param ontology_id: Name of ontology, e.g. "hp"
+    :param root_id: Root term ID (IRI, short form or OBO ID)
+    :param relation: "hierarchicalChildren" to include relations like part-of,
+        "children" for just is-a (subclass) relations
+    :param max_depth: Don't fetch children of terms at this depth, e.g.
+        ``max_depth=1`` only yields the root's direct children
+    :param skip_leaves: Don't request children for terms where OLS reports
+        ``has_children`` as false. As in
+        [HierarchyIndex.build()][ols_py.hierarchy.HierarchyIndex.build],
+        this defaults to true for "children" only, and can't be used with
+        "hierarchicalChildren"
+    :param max_workers: Number of concurrent requests. Set the client's
+        ``pool_maxsize`` to at least this
+    :param state: Crawl state to update as the crawl progresses, or to
+        resume from
+    :raises ValueError: if ``skip_leaves`` is true for "hierarchicalChildren"
+    :raises Exception: The first error from fetching a term's children. Terms
+        that haven't been expanded yet are left in ``state.pending``.
+    """
+    check_max_workers(max_workers)
+    skip_leaves = check_skip_leaves(relation == "hierarchicalChildren", skip_leaves)
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must not be negative")
+    if state is None:
+        state = CrawlState()
+    if not state.is_started:
+        state.seen.add(root_id)
+        if max_depth != 0:
+            state.pending[root_id] = 0
+
+    def get_children(iri: str) -> list[LeanTerm]:
+        return list(
+            client.iter_lean_term_relatives(relation, ontology_id, iri, prefetch=False)
+        )
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ols-crawl")
+    try:
+        while state.pending:
+            yield from _expand_level(pool, state, get_children, max_depth, skip_leaves)
+    finally:
+        # Don't wait for the rest of the level if the crawl is stopped early
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _expand_level(
+    pool: ThreadPoolExecutor,
+    state: CrawlState,
+    get_children: Callable[[str], list[LeanTerm]],
+    max_depth: Optional[int],
+    skip_leaves: bool,
+) -> Iterator[Edge]:
+    """
+    Fetch the children of every pending term, adding any new terms
+    to ``state.pending`` for the next level
+    """
+    level = list(state.pending.items())
+    futures: dict[Future[list[LeanTerm]], tuple[str, int]] = {
+        pool.submit(get_children, iri): (iri, depth) for iri, depth in level
+    }
+    for future in as_completed(futures):
+        parent, depth = futures[future]
+        children = future.result()
+        for child in children:
+            yield Edge(child.iri, parent, depth + 1, child.label)
+        for child in children:
+            if child.iri in state.seen:
+                continue
+            state.seen.add(child.iri)
+            expand = child.has_children or not skip_leaves
+            if expand and (max_depth is None or depth + 1 < max_depth):
+                state.pending[child.iri] = depth + 1
+        del state.pending[parent]
+        state.expanded.add(parent)
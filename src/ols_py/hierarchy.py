@@ -0,0 +1,369 @@
+"""
+Local copy of an ontology's class hierarchy, for answering ancestor/descendant
+queries without a request to the server for each one, e.g.:
+
+    from ols_py.hierarchy import HierarchyIndex
+    index = HierarchyIndex.build(client, "mondo")
+    index.save("mondo.hierarchy")
+    # Later/in another process
+    index = HierarchyIndex.load("mondo.hierarchy")
+    index.is_a("http://purl.obolibrary.org/obo/MONDO_0005148",
+               "http://purl.obolibrary.org/obo/MONDO_0000001")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping, Optional, Sequence
+
+from .bulk import DEFAULT_MAX_WORKERS, run_bulk
+
+if TYPE_CHECKING:
+    from .client import Ols4Client
+
+Relation = Literal["parents", "hierarchicalParents"]
+
+_CHILD_RELATIVES: dict[str, Literal["children", "hierarchicalChildren"]] = {
+    "parents": "children",
+    "hierarchicalParents": "hierarchicalChildren",
+}
+_MAGIC = b"OLSHIER1"
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+def check_skip_leaves(hierarchical: bool, skip_leaves: Optional[bool]) -> bool:
+    """
+    Get whether to skip requesting children for terms OLS reports as leaves.
+    ``has_children`` only reflects is-a children, so leaves are only skipped
+    by default for is-a relations, and skipping them for hierarchical
+    relations (which would miss e.g. part-of children) is an error.
+    """
+    if skip_leaves is None:
+        return not hierarchical
+    if skip_leaves and hierarchical:
+        raise ValueError(
+            "skip_leaves can't be used with hierarchical relations: has_children"
+            " only reflects is-a children, so some children would be missed"
+        )
+    return skip_leaves
+
+
+def _build_csr(num_nodes: int, pairs: Sequence[tuple[int, int]]) -> tuple[array, array]:
+    """
+    Build compressed sparse row arrays for a list of ``(source, target)`` pairs:
+    the targets for node ``n`` are ``indices[offsets[n]:offsets[n + 1]]``
+    """
+    offsets = array("i", [0]) * (num_nodes + 1)
+    for source, _ in pairs:
+        offsets[source + 1] += 1
+    for n in range(num_nodes):
+        offsets[n + 1] += offsets[n]
+    indices = array("i", [0]) * len(pairs)
+    position = offsets[:-1]
+    for source, target in pairs:
+        indices[position[source]] = target
+        position[source] += 1
+    return offsets, indices
+
+
+def _row(offsets: array, indices: array, node: int) -> array:
+    """
+    Get the targets for ``node`` from CSR arrays
+    """
+    start, end = offsets[node], offsets[node + 1]
+    return indices[start:end]
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(data: bytes) -> array:
+    values = array("i")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class HierarchyIndex:
+    """
+    Parent/child relationships between an ontology's terms, stored as
+    integer-indexed CSR (compressed sparse row) arrays, so a large
+    ontology only needs a few MB of memory.
+
+    Terms are identified by IRI. Query methods raise ``KeyError`` for
+    IRIs that aren't in the index.
+    """
+
+    ontology_id: Optional[str]
+    relation: Relation
+    iris: list[str]
+    """IRIs of all terms in the index"""
+    labels: list[str]
+    """Labels of the terms, in the same order as ``iris``"""
+
+    def __init__(
+        self,
+        iris: list[str],
+        labels: list[str],
+        parent_offsets: array,
+        parent_indices: array,
+        ontology_id: Optional[str] = None,
+        relation: Relation = "hierarchicalParents",
+    ):
+        """
+        Use [from_edges()][ols_py.hierarchy.HierarchyIndex.from_edges],
+        [build()][ols_py.hierarchy.HierarchyIndex.build] or
+        [load()][ols_py.hierarchy.HierarchyIndex.load] to create an index.
+        """
+        self.iris = iris
+        self.labels = labels
+        self.ontology_id = ontology_id
+        self.relation = relation
+        self._ids = {iri: i for i, iri in enumerate(iris)}
+        self._parent_offsets = parent_offsets
+        self._parent_indices = parent_indices
+        child_pairs = [
+            (parent, child)
+            for child in range(len(iris))
+            for parent in _row(parent_offsets, parent_indices, child)
+        ]
+        self._child_offsets, self._child_indices = _build_csr(len(iris), child_pairs)
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[str, str]],
+        labels: Optional[Mapping[str, str]] = None,
+        ontology_id: Optional[str] = None,
+        relation: Relation = "hierarchicalParents",
+    ) -> HierarchyIndex:
+        """
+        Create an index from ``(child_iri, parent_iri)`` pairs.
+
+        :param edges: Child/parent IRI pairs. Duplicates are ignored
+        :param labels: Optional mapping of IRI to label. Terms in ``labels``
+            are included in the index even if they have no parents or children
+        :param ontology_id: Ontology the hierarchy belongs to
+        :param relation: Which relation the edges come from
+        """
+        labels = labels or {}
+        ids: dict[str, int] = {iri: i for i, iri in enumerate(labels)}
+        pairs = set()
+        for child, parent in edges:
+            child_id = ids.setdefault(child, len(ids))
+            parent_id = ids.setdefault(parent, len(ids))
+            pairs.add((child_id, parent_id))
+        iris = list(ids)
+        parent_offsets, parent_indices = _build_csr(len(iris), sorted(pairs))
+        return cls(
+            iris=iris,
+            labels=[labels.get(iri, "") for iri in iris],
+            parent_offsets=parent_offsets,
+            parent_indices=parent_indices,
+            ontology_id=ontology_id,
+            relation=relation,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        client: Ols4Client,
+        ontology_id: str,
+        relation: Relation = "hierarchicalParents",
+        skip_leaves: Optional[bool] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> HierarchyIndex:
+        """
+        Download an ontology's hierarchy using the existing API endpoints.
+        All the ontology's terms are listed (as lean terms), then the children
+        of each term are fetched, using ``max_workers`` threads.
+
+        :param client: Client to fetch the hierarchy with
+        :param ontology_id: Name of ontology, e.g. "go"
+        :param relation: "hierarchicalParents" to include relations like part-of
+            in the hierarchy, "parents" for just is-a (subclass) relations
+        :param skip_leaves: Don't request children for terms where OLS reports
+            ``has_children`` as false, saving a request per leaf term. Defaults
+            to true for "parents" only: ``has_children`` only reflects is-a
+            children, so it can't be used with "hierarchicalParents"
+        :param max_workers: Number of concurrent requests
+        :raises ValueError: if ``skip_leaves`` is true for "hierarchicalParents"
+        :raises Exception: The first error from fetching a term's children,
+            rather than returning an incomplete index
+        """
+        skip_leaves = check_skip_leaves(relation == "hierarchicalParents", skip_leaves)
+        child_relatives = _CHILD_RELATIVES[relation]
+        labels: dict[str, str] = {}
+        parent_iris = []
+        for term in client.iter_lean_terms(ontology_id):
+            labels[term.iri] = term.label
+            if term.has_children or not skip_leaves:
+                parent_iris.append(term.iri)
+
+        def get_children(iri: str) -> list[str]:
+            return [
+                child.iri
+                for child in client.iter_lean_term_relatives(
+                    child_relatives, ontology_id, iri, prefetch=False
+                )
+            ]
+
+        results = run_bulk(parent_iris, get_children, max_workers=max_workers)
+        edges: list[tuple[str, str]] = []
+        for parent, children in results.items():
+            if isinstance(children, Exception):
+                raise children
+            edges.extend((child, parent) for child in children)
+        return cls.from_edges(
+            edges, labels=labels, ontology_id=ontology_id, relation=relation
+        )
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Save the index to a file, which can be loaded with
+        [load()][ols_py.hierarchy.HierarchyIndex.load]
+        """
+        header = json.dumps(
+            {
+                "ontology_id": self.ontology_id,
+                "relation": self.relation,
+                "iris": self.iris,
+                "labels": self.labels,
+                "num_edges": len(self._parent_indices),
+            }
+        ).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            f.write(_to_little_endian(self._parent_offsets))
+            f.write(_to_little_endian(self._parent_indices))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> HierarchyIndex:
+        """
+        Load an index saved with [save()][ols_py.hierarchy.HierarchyIndex.save]
+
+        :raises ValueError: if the file isn't a saved index
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a saved HierarchyIndex")
+            (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+            header = json.loads(f.read(header_length))
+            num_terms = len(header["iris"])
+            parent_offsets = _from_little_endian(f.read(4 * (num_terms + 1)))
+            parent_indices = _from_little_endian(f.read(4 * header["num_edges"]))
+        return cls(
+            iris=header["iris"],
+            labels=header["labels"],
+            parent_offsets=parent_offsets,
+            parent_indices=parent_indices,
+            ontology_id=header["ontology_id"],
+            relation=header["relation"],
+        )
+
+    def __len__(self) -> int:
+        return len(self.iris)
+
+    def __contains__(self, iri: object) -> bool:
+        return iri in self._ids
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._parent_indices)
+
+    def _get_id(self, iri: str) -> int:
+        try:
+            return self._ids[iri]
+        except KeyError:
+            raise KeyError(f"{iri} is not in the hierarchy") from None
+
+    def _traverse(self, start: int, offsets: array, indices: array) -> set[int]:
+        """
+        Get all nodes reachable from ``start`` (not including ``start``)
+        """
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for other in _row(offsets, indices, node):
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        seen.discard(start)
+        return seen
+
+    def _ancestor_ids(self, node: int) -> set[int]:
+        return self._traverse(node, self._parent_offsets, self._parent_indices)
+
+    def label(self, iri: str) -> str:
+        return self.labels[self._get_id(iri)]
+
+    def parents(self, iri: str) -> list[str]:
+        node = self._get_id(iri)
+        parents = _row(self._parent_offsets, self._parent_indices, node)
+        return [self.iris[i] for i in parents]
+
+    def children(self, iri: str) -> list[str]:
+        node = self._get_id(iri)
+        children = _row(self._child_offsets, self._child_indices, node)
+        return [self.iris[i] for i in children]
+
+    def ancestors(self, iri: str) -> set[str]:
+        return {self.iris[i] for i in self._ancestor_ids(self._get_id(iri))}
+
+    def descendants(self, iri: str) -> set[str]:
+        node = self._get_id(iri)
+        return {
+            self.iris[i]
+            for i in self._traverse(node, self._child_offsets, self._child_indices)
+        }
+
+    def is_a(self, iri: str, ancestor_iri: str) -> bool:
+        """
+        Check whether ``iri`` is ``ancestor_iri`` or one of its descendants
+        """
+        node = self._get_id(iri)
+        target = self._get_id(ancestor_iri)
+        if node == target:
+            return True
+        offsets, indices = self._parent_offsets, self._parent_indices
+        seen = {node}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for parent in _row(offsets, indices, current):
+                if parent == target:
+                    return True
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+        return False
+
+    def lowest_common_ancestors(self, iri1: str, iri2: str) -> set[str]:
+        """
+        Get the most specific terms that both terms are a subclass of (or equal to).
+        There can be more than one, since a term can have multiple parents.
+        """
+        node1, node2 = self._get_id(iri1), self._get_id(iri2)
+        common = (self._ancestor_ids(node1) | {node1}) & (
+            self._ancestor_ids(node2) | {node2}
+        )
+        offsets, indices = self._child_offsets, self._child_indices
+        # Common ancestors are closed upwards, so a common ancestor is
+        #   lowest if none of its children are also common ancestors
+        return {
+            self.iris[node]
+            for node in common
+            if not any(child in common for child in _row(offsets, indices, node))
+        }
@@ -0,0 +1,418 @@
+"""
+Hooks for monitoring what the client is doing: request timings, response
+sizes, parse times, retries and cache hits/misses, e.g.:
+
+    from ols_py.instrumentation import StatsCollector
+    stats = StatsCollector()
+    client = Ols4Client(hooks=[stats])
+    ...
+    print(stats.summary())
+
+To handle events yourself, subclass [ClientHooks][ols_py.instrumentation.ClientHooks]
+and override the methods you need.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Literal, Optional, Sequence
+
+import requests
+
+CacheResult = Literal["hit", "miss", "stale", "revalidated"]
+
+_ID_AFTER = {
+    "ontologies": "{ontology}",
+    "terms": "{iri}",
+    "properties": "{iri}",
+    "individuals": "{iri}",
+    "findByIdAndIsDefiningOntology": "{iri}",
+}
+
+
+def get_endpoint(path: str) -> str:
+    """
+    Get the endpoint for an API path, with ontology IDs and IRIs replaced
+    by placeholders so requests can be grouped, e.g.
+    ``/ontologies/go/terms/<iri>/parents`` -> ``/ontologies/{ontology}/terms/{iri}/parents``
+    """
+    parts = path.strip("/").split("/")
+    endpoint = []
+    for i, part in enumerate(parts):
+        previous = parts[i - 1] if i > 0 else None
+        if previous in _ID_AFTER and part not in _ID_AFTER:
+            endpoint.append(_ID_AFTER[previous])
+        else:
+            endpoint.append(part)
+    return "/" + "/".join(endpoint)
+
+
+@dataclass(frozen=True)
+class RequestStartEvent:
+    endpoint: str
+    url: str
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    A request to the server finished (each retry is a separate request)
+    """
+
+    endpoint: str
+    url: str
+    status: Optional[int]
+    """HTTP status, or None if no response was received"""
+    seconds: float
+    """
+    Time taken to receive the full response (or just the headers, for
+    streamed responses)
+    """
+    num_bytes: int
+    """Size of the response body (0 for streamed responses)"""
+    attempt: int
+    """0 for the first attempt, 1 for the first retry etc."""
+    error: Optional[BaseException] = None
+    """Connection error/timeout, if the request failed without a response"""
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    endpoint: str
+    url: str
+    attempt: int
+    """Number of the retry that is about to be made, starting at 1"""
+    delay: float
+    """Seconds to wait before retrying"""
+    status: Optional[int]
+    """HTTP status of the failed request, or None for connection errors"""
+
+
+@dataclass(frozen=True)
+class CacheEvent:
+    endpoint: str
+    url: str
+    result: CacheResult
+    """
+    "hit" (fresh cached response), "miss" (not cached), "stale" (expired, so
+    a conditional request is sent) or "revalidated" (server said the stale
+    response is still valid)
+    """
+
+
+@dataclass(frozen=True)
+class ParseEvent:
+    """
+    A response was parsed. For ``get_with_schema()``, JSON is validated
+    directly from bytes, so decoding time is included in ``validation_seconds``
+    """
+
+    endpoint: str
+    schema: Optional[str]
+    """Name of the schema, or None for get() (which only decodes JSON)"""
+    decode_seconds: float
+    validation_seconds: float
+
+
+class ClientHooks:
+    """
+    Base class for receiving events from the client. All methods do nothing
+    by default, override the ones you're interested in.
+
+    Hooks are called synchronously on the thread making the request, so
+    they should be fast, and must be thread-safe if the client is shared
+    between threads.
+    """
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        pass
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+    def on_cache(self, event: CacheEvent) -> None:
+        pass
+
+    def on_parse(self, event: ParseEvent) -> None:
+        pass
+
+
+class HookList(ClientHooks):
+    """
+    Forwards events to multiple hooks. Evaluates as false if empty, so
+    clients can skip creating events when nothing is listening.
+    """
+
+    def __init__(self, hooks: Iterable[ClientHooks] = ()):
+        self.hooks = list(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self.hooks)
+
+    def on_request_start(self, event: RequestStartEvent) -> None:
+        for hook in self.hooks:
+            hook.on_request_start(event)
+
+    def on_request(self, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            hook.on_request(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        for hook in self.hooks:
+            hook.on_retry(event)
+
+    def on_cache(self, event: CacheEvent) -> None:
+        for hook in self.hooks:
+            hook.on_cache(event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        for hook in self.hooks:
+            hook.on_parse(event)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Get the ``q``-th percentile (0-100) of already sorted values,
+    using the nearest-rank method
+    """
+    if not sorted_values:
+        return math.nan
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+@dataclass
+class EndpointStats:
+    """
+    Summary of requests to a single endpoint
+    """
+
+    requests: int = 0
+    errors: int = 0
+    """Requests that failed, with a connection error or an error status"""
+    retries: int = 0
+    num_bytes: int = 0
+    request_seconds: float = 0.0
+    """Total time spent on requests"""
+    parses: int = 0
+    """Number of responses parsed"""
+    parse_seconds: float = 0.0
+    """Total time spent decoding and validating responses"""
+    cache: dict[str, int] = field(default_factory=dict)
+    """Number of cache events of each type (hit/miss/stale/revalidated)"""
+    request_percentiles: dict[float, float] = field(default_factory=dict)
+    """Request time percentiles, in seconds, for the recent requests"""
+    parse_percentiles: dict[float, float] = field(default_factory=dict)
+    """Parse time percentiles, in seconds, for the recent responses"""
+
+
+class _EndpointData:
+    def __init__(self, max_samples: int):
+        self.stats = EndpointStats()
+        self.request_times: deque[float] = deque(maxlen=max_samples)
+        self.parse_times: deque[float] = deque(maxlen=max_samples)
+
+
+class StatsCollector(ClientHooks):
+    """
+    Collect request counts, sizes, timings and cache results per endpoint,
+    in memory. Thread-safe, so it can be shared between clients and threads.
+    """
+
+    percentiles: tuple[float, ...]
+
+    def __init__(
+        self,
+        max_samples: int = 10_000,
+        percentiles: Sequence[float] = (50, 90, 99),
+    ):
+        """
+        :param max_samples: Number of recent timings per endpoint to keep
+            for calculating percentiles
+        :param percentiles: Percentiles (0-100) to report
+        """
+        self.max_samples = max_samples
+        self.percentiles = tuple(percentiles)
+        self._lock = threading.Lock()
+        self._endpoints: defaultdict[str, _EndpointData] = defaultdict(
+            lambda: _EndpointData(self.max_samples)
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            data = self._endpoints[event.endpoint]
+            data.stats.requests += 1
+            data.stats.num_bytes += event.num_bytes
+            data.stats.request_seconds += event.seconds
+            if event.error is not None or (event.status or 0) >= 400:
+                data.stats.errors += 1
+            data.request_times.append(event.seconds)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._endpoints[event.endpoint].stats.retries += 1
+
+    def on_cache(self, event: CacheEvent) -> None:
+        with self._lock:
+            cache = self._endpoints[event.endpoint].stats.cache
+            cache[event.result] = cache.get(event.result, 0) + 1
+
+    def on_parse(self, event: ParseEvent) -> None:
+        seconds = event.decode_seconds + event.validation_seconds
+        with self._lock:
+            data = self._endpoints[event.endpoint]
+            data.stats.parses += 1
+            data.stats.parse_seconds += seconds
+            data.parse_times.append(seconds)
+
+    def summary(self) -> dict[str, EndpointStats]:
+        """
+        Get a snapshot of the stats for each endpoint
+        """
+        with self._lock:
+            endpoints = {
+                endpoint: (
+                    data.stats,
+                    sorted(data.request_times),
+                    sorted(data.parse_times),
+                )
+                for endpoint, data in self._endpoints.items()
+            }
+        summary = {}
+        for endpoint, (stats, request_times, parse_times) in endpoints.items():
+            summary[endpoint] = EndpointStats(
+                requests=stats.requests,
+                errors=stats.errors,
+                retries=stats.retries,
+                parses=stats.parses,
+                num_bytes=stats.num_bytes,
+                request_seconds=stats.request_seconds,
+                parse_seconds=stats.parse_seconds,
+                cache=dict(stats.cache),
+                request_percentiles={
+                    q: percentile(request_times, q) for q in self.percentiles
+                },
+                parse_percentiles={
+                    q: percentile(parse_times, q) for q in self.percentiles
+                },
+            )
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(**labels: str) -> str:
+    formatted = (f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + ",".join(formatted) + "}"
+
+
+def _format_summary(
+    name: str, endpoint: str, stats: EndpointStats, attr: str
+) -> list[str]:
+    """
+    Format the ``attr`` timings of an endpoint as Prometheus summary lines
+    """
+    lines = []
+    values: dict[float, float] = getattr(stats, f"{attr}_percentiles")
+    for q, value in values.items():
+        labels = _format_labels(endpoint=endpoint, quantile=str(q / 100))
+        lines.append(f"{name}{labels} {value}")
+    labels = _format_labels(endpoint=endpoint)
+    total = getattr(stats, f"{attr}_seconds")
+    lines.append(f"{name}_sum{labels} {total}")
+    count = stats.requests if attr == "request" else stats.parses
+    lines.append(f"{name}_count{labels} {count}")
+    return lines
+
+
+class PrometheusExporter:
+    """
+    Export the stats from a [StatsCollector][ols_py.instrumentation.StatsCollector]
+    in the Prometheus text format, e.g. to push to a Prometheus Pushgateway
+    from batch jobs.
+    """
+
+    def __init__(self, collector: StatsCollector, prefix: str = "ols"):
+        """
+        :param collector: Collector to export stats from
+        :param prefix: Prefix for metric names
+        """
+        self.collector = collector
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """
+        Get the current stats in the Prometheus text exposition format
+        """
+        p = self.prefix
+        summary = self.collector.summary()
+        lines = []
+
+        def add_metric(name: str, metric_type: str, help_text: str) -> str:
+            full_name = f"{p}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            return full_name
+
+        for metric, help_text, attr in [
+            ("requests_total", "Requests sent to OLS", "requests"),
+            ("request_errors_total", "Failed requests", "errors"),
+            ("retries_total", "Retried requests", "retries"),
+            ("response_bytes_total", "Response body bytes", "num_bytes"),
+        ]:
+            name = add_metric(metric, "counter", help_text)
+            for endpoint, stats in summary.items():
+                labels = _format_labels(endpoint=endpoint)
+                lines.append(f"{name}{labels} {getattr(stats, attr)}")
+        name = add_metric("cache_events_total", "counter", "Response cache lookups")
+        for endpoint, stats in summary.items():
+            for result, count in sorted(stats.cache.items()):
+                labels = _format_labels(endpoint=endpoint, result=result)
+                lines.append(f"{name}{labels} {count}")
+
+        for metric, help_text, attr in [
+            ("request_duration_seconds", "Request time", "request"),
+            ("parse_duration_seconds", "Response parsing time", "parse"),
+        ]:
+            name = add_metric(metric, "summary", help_text)
+            for endpoint, stats in summary.items():
+                lines.extend(_format_summary(name, endpoint, stats, attr))
+        return "\n".join(lines) + "\n"
+
+    def push(
+        self,
+        gateway_url: str,
+        job: str = "ols_py",
+        session: Optional[requests.Session] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        Push the current stats to a Prometheus Pushgateway
+        (replacing the previous values for ``job``)
+
+        :param gateway_url: Base URL of the Pushgateway, e.g. "http://localhost:9091"
+        :param job: Job name to group the metrics under
+        :param session: Optional session to send the request with
+        :raises HTTPError: if the push fails
+        """
+        url = f"{gateway_url.rstrip('/')}/metrics/job/{job}"
+        sender = session or requests
+        resp = sender.put(
+            url,
+            data=self.render().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4"},
+            timeout=timeout,
+        )
+        resp.raise_for_status()
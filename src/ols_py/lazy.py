@@ -0,0 +1,227 @@
+"""
+Lazily validated responses. With ``Ols4Client(lazy=True)``, responses are
+only decoded from JSON, and wrapped in a [LazyModel][ols_py.lazy.LazyModel]
+proxy that validates each field the first time it's accessed, e.g.:
+
+    client = Ols4Client(lazy=True)
+    page = client.get_term_descendants("go", "GO:0043226", params={"size": 1000})
+    # Only validates the embedded terms' labels, not their IRIs, links,
+    #   synonyms etc.
+    labels = [term.label for term in page.embedded.terms]
+
+Nested models are also returned as proxies, so fields you never read
+are never validated. Call ``materialize()`` to get the full pydantic model.
+Proxies aren't instances of the model class, use
+[is_lazy()][ols_py.lazy.is_lazy] to check for them.
+"""
+
+from __future__ import annotations
+
+import types
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Optional,
+    Type,
+    TypeGuard,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import pydantic
+from pydantic import AliasChoices
+from pydantic.fields import FieldInfo
+
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _LazyField:
+    keys: tuple[str, ...]
+    """Keys the field may be stored under in the JSON data, in order of preference"""
+    convert: Callable[[Any], Any]
+    required: bool
+    get_default: Callable[[], Any]
+
+
+class LazyModel(Generic[M]):
+    """
+    Proxy for a pydantic model of type ``schema`` over decoded JSON data.
+    Each field is validated and converted when it's first accessed, and the
+    result is kept for later accesses. Fields that are models, or lists/dicts
+    of models, are returned as ``LazyModel`` proxies too.
+
+    Extra fields (for models that allow them) are returned as-is.
+    Accessing an invalid field raises ``pydantic.ValidationError``.
+    """
+
+    _lazy_schema: Type[M]
+    _lazy_data: dict[str, Any]
+    _lazy_model: Optional[M] = None
+    """Model the proxy wraps, if it was created from one with ``from_model()``"""
+
+    def __init__(self, schema: Type[M], data: dict[str, Any]):
+        """
+        :param schema: Pydantic model the data should be validated with
+        :param data: Decoded JSON data for the model
+        """
+        object.__setattr__(self, "_lazy_schema", schema)
+        object.__setattr__(self, "_lazy_data", data)
+
+    @classmethod
+    def from_model(cls, model: M) -> LazyModel[M]:
+        """
+        Wrap an already validated model, e.g. a term from a term store,
+        so it can be returned alongside other proxies
+        """
+        proxy = cls(type(model), {})
+        object.__setattr__(proxy, "_lazy_model", model)
+        return proxy
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for fields that haven't been accessed yet, converted
+        #   values are stored on the instance
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._lazy_model is not None:
+            value = getattr(self._lazy_model, name)
+            object.__setattr__(self, name, value)
+            return value
+        field = _get_lazy_fields(self._lazy_schema).get(name)
+        if field is None:
+            extra = self._lazy_schema.model_config.get("extra")
+            if extra == "allow" and name in self._lazy_data:
+                return self._lazy_data[name]
+            raise AttributeError(
+                f"{self._lazy_schema.__name__!r} object has no attribute {name!r}"
+            )
+        for key in field.keys:
+            raw = self._lazy_data.get(key, _MISSING)
+            if raw is not _MISSING:
+                value = field.convert(raw)
+                break
+        else:
+            if field.required:
+                # Raise the same error as validating the whole model
+                self.materialize()
+            value = field.get_default()
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError("LazyModel proxies are read-only, use materialize() first")
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._lazy_schema.__name__}]"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """
+        The unvalidated JSON data
+        """
+        if self._lazy_model is not None:
+            return self._lazy_model.model_dump(mode="json", by_alias=True)
+        return self._lazy_data
+
+    def materialize(self) -> M:
+        """
+        Validate all the data, returning the full pydantic model
+
+        :raises pydantic.ValidationError: if the data is invalid
+        """
+        if self._lazy_model is not None:
+            return self._lazy_model
+        return self._lazy_schema.model_validate(self._lazy_data)
+
+
+def lazy_validate(schema: Type[M], data: Any) -> LazyModel[M]:
+    """
+    Wrap decoded JSON ``data`` for ``schema`` in a
+    [LazyModel][ols_py.lazy.LazyModel] proxy.
+
+    :raises pydantic.ValidationError: if ``data`` isn't a JSON object
+    """
+    if not isinstance(data, dict):
+        # Raise the same error pydantic would
+        schema.model_validate(data)
+        raise TypeError(f"Expected a dict for {schema.__name__}, got {data!r}")
+    return LazyModel(schema, data)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel)
+
+
+def _get_converter(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Get a function that converts raw JSON values for a field with
+    type ``annotation``: proxies for models, otherwise validation
+    with a ``TypeAdapter``
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if _is_model(annotation):
+        return lambda value: lazy_validate(annotation, value)
+    if origin in (Union, types.UnionType):
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(args) == 2:
+            convert = _get_converter(non_none[0])
+            return lambda value: None if value is None else convert(value)
+    if origin is list and args and _is_model(args[0]):
+        convert_item = _get_converter(args[0])
+        list_adapter = pydantic.TypeAdapter(list[Any])
+        return lambda value: [
+            convert_item(v) for v in list_adapter.validate_python(value)
+        ]
+    if origin is dict and len(args) == 2 and _is_model(args[1]):
+        convert_item = _get_converter(args[1])
+        dict_adapter: pydantic.TypeAdapter[dict[Any, Any]] = pydantic.TypeAdapter(
+            dict[args[0], Any]  # type: ignore[valid-type]
+        )
+        return lambda value: {
+            k: convert_item(v) for k, v in dict_adapter.validate_python(value).items()
+        }
+    return pydantic.TypeAdapter(annotation).validate_python
+
+
+def _get_keys(name: str, field: FieldInfo) -> tuple[str, ...]:
+    alias = field.validation_alias
+    if isinstance(alias, AliasChoices):
+        return tuple(choice for choice in alias.choices if isinstance(choice, str))
+    if isinstance(alias, str):
+        return (alias,)
+    if field.alias is not None:
+        return (field.alias,)
+    return (name,)
+
+
+@lru_cache(maxsize=None)
+def _get_lazy_fields(schema: Type[pydantic.BaseModel]) -> dict[str, _LazyField]:
+    fields = {}
+    for name, field in schema.model_fields.items():
+        fields[name] = _LazyField(
+            keys=_get_keys(name, field),
+            convert=_get_converter(field.annotation),
+            required=field.is_required(),
+            get_default=partial(field.get_default, call_default_factory=True),
+        )
+    return fields
+
+
+def is_lazy(
+    obj: Any, schema: Optional[Type[pydantic.BaseModel]] = None
+) -> TypeGuard[LazyModel[Any]]:
+    """
+    Check if ``obj`` is a [LazyModel][ols_py.lazy.LazyModel] proxy, for
+    ``schema`` (or a subclass of it) if given
+    """
+    if not isinstance(obj, LazyModel):
+        return False
+    return schema is None or issubclass(obj._lazy_schema, schema)
@@ -0,0 +1,200 @@
+"""
+Helpers for iterating over every page of a paginated endpoint
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, TypeVar
+
+from . import schemas
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 1000
+"""
+Largest page size accepted by the OLS4 endpoints that use
+``page``/``size`` params
+"""
+MAX_SEARCH_ROWS = 1000
+"""Largest number of ``rows`` accepted by the search and select endpoints"""
+
+
+def check_page_size(page_size: int) -> int:
+    """
+    :raises ValueError: if ``page_size`` is not positive
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    return page_size
+
+
+def get_num_prefetch(prefetch: bool | int) -> int:
+    """
+    Get the number of pages to fetch ahead from a ``prefetch`` argument:
+    ``True`` fetches one page ahead, ``False`` none
+
+    :raises ValueError: if ``prefetch`` is negative
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+    return int(prefetch)
+
+
+def iter_pages(
+    fetch_page: Callable[[int], P],
+    get_items: Callable[[P], Iterable[T]],
+    get_num_pages: Callable[[P], int],
+    prefetch: bool | int = True,
+) -> Iterator[T]:
+    """
+    Iterate over the items in every page of a response.
+
+    :param fetch_page: Function to fetch a page by page number (starting at 0)
+    :param get_items: Function returning the items from a page
+    :param get_num_pages: Function returning the total number of pages
+      from a page
+    :param prefetch: Fetch upcoming pages in background threads while
+      the items from the current page are being consumed: ``True`` fetches
+      the next page, or pass a number to fetch that many pages at once.
+      Items are always returned in page order.
+    """
+    num_prefetch = get_num_prefetch(prefetch)
+    first_page = fetch_page(0)
+    num_pages = get_num_pages(first_page)
+    if num_prefetch == 0 or num_pages <= 1:
+        yield from get_items(first_page)
+        for page_num in range(1, num_pages):
+            yield from get_items(fetch_page(page_num))
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(num_prefetch, num_pages - 1), thread_name_prefix="ols-prefetch"
+    )
+    # Pages being fetched, in order. The total number of pages is known
+    #   from the first page, so all the workers can be kept busy
+    pending: deque[Future[P]] = deque()
+    next_page_num = 1
+    try:
+        while next_page_num < num_pages and len(pending) < num_prefetch:
+            pending.append(executor.submit(fetch_page, next_page_num))
+            next_page_num += 1
+        yield from get_items(first_page)
+        while pending:
+            page = pending.popleft().result()
+            if next_page_num < num_pages:
+                pending.append(executor.submit(fetch_page, next_page_num))
+                next_page_num += 1
+            yield from get_items(page)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[P]],
+    get_items: Callable[[P], Iterable[T]],
+    get_num_pages: Callable[[P], int],
+    prefetch: bool | int = True,
+) -> AsyncIterator[T]:
+    """
+    Async version of [iter_pages()][ols_py.pagination.iter_pages]. Prefetching
+    is done with asyncio tasks instead of threads.
+    """
+    num_prefetch = get_num_prefetch(prefetch)
+    first_page = await fetch_page(0)
+    num_pages = get_num_pages(first_page)
+    pending: deque[asyncio.Future[P]] = deque()
+    next_page_num = 1
+    try:
+        while next_page_num < num_pages and len(pending) < num_prefetch:
+            pending.append(asyncio.ensure_future(fetch_page(next_page_num)))
+            next_page_num += 1
+        for item in get_items(first_page):
+            yield item
+        while next_page_num < num_pages or pending:
+            if pending:
+                page = await pending.popleft()
+            else:
+                page = await fetch_page(next_page_num)
+                next_page_num += 1
+            if num_prefetch and next_page_num < num_pages:
+                pending.append(asyncio.ensure_future(fetch_page(next_page_num)))
+                next_page_num += 1
+            for item in get_items(page):
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def multiple_terms_items(
+    page: schemas.responses.MultipleTerms,
+) -> list[schemas.responses.Term]:
+    # _embedded is missing from empty pages
+    if page.embedded is None:
+        return []
+    return page.embedded.terms
+
+
+def lean_multiple_terms_items(
+    page: schemas.responses.LeanMultipleTerms,
+) -> list[schemas.responses.LeanTerm]:
+    if page.embedded is None:
+        return []
+    return page.embedded.terms
+
+
+def ontology_list_items(
+    page: schemas.responses.OntologyList,
+) -> list[schemas.responses.OntologyItem]:
+    if page.embedded is None:
+        return []
+    return page.embedded.ontologies
+
+
+def raw_terms_items(page: dict) -> list[dict]:
+    """
+    Get the term data from an unparsed MultipleTerms page
+    """
+    terms: list[dict] = page.get("_embedded", {}).get("terms", [])
+    return terms
+
+
+def raw_num_pages(page: dict) -> int:
+    num_pages: int = page["page"]["totalPages"]
+    return num_pages
+
+
+def num_pages_from_page_info(
+    page: (
+        schemas.responses.MultipleTerms
+        | schemas.responses.LeanMultipleTerms
+        | schemas.responses.OntologyList
+    ),
+) -> int:
+    return page.page.totalPages
+
+
+def search_items(
+    page: schemas.responses.SearchResponse,
+) -> list[schemas.responses.SearchResultItem]:
+    return page.response.docs
+
+
+def search_num_pages(
+    start: int, rows: int
+) -> Callable[[schemas.responses.SearchResponse], int]:
+    """
+    Get a function that calculates the number of pages in a search response,
+    for searches starting at result ``start`` with ``rows`` results per page
+    """
+
+    def get_num_pages(page: schemas.responses.SearchResponse) -> int:
+        remaining = max(page.response.numFound - start, 0)
+        return math.ceil(remaining / rows)
+
+    return get_num_pages
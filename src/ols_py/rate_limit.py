@@ -0,0 +1,119 @@
+"""
+Client-side rate limiting, to stay under the request rate an OLS
+instance allows, e.g.:
+
+    from ols_py.rate_limit import RateLimiter
+    client = Ols4Client(rate_limiter=RateLimiter(rate=10))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Counters for rate-limited requests
+    """
+
+    requests: int = 0
+    """Number of requests that have been through the rate limiter"""
+    delayed: int = 0
+    """Number of requests that had to wait"""
+    total_wait: float = 0.0
+    """Total time requests have spent waiting, in seconds"""
+    pauses: int = 0
+    """Number of times sending was paused, e.g. after a 429 response"""
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter. Tokens are added at ``rate`` per second,
+    up to ``burst``, and each request uses one token - requests wait
+    when there are no tokens left.
+
+    The limiter is thread-safe: share one instance between threads/clients
+    so they all stay under the same limit. It also works with the async
+    client, which waits with ``asyncio.sleep()`` instead of blocking.
+    """
+
+    rate: float
+    burst: float
+    stats: RateLimiterStats
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        :param rate: Maximum average number of requests per second
+        :param burst: Maximum number of requests that can be sent at once
+          after a quiet period. Defaults to ``rate`` (at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.stats = RateLimiterStats()
+        self._tokens = self.burst
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token for a request, without waiting.
+
+        :return: Number of seconds the caller needs to wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Tokens can go negative: each waiting request has reserved
+            #   a future token, so later callers wait longer
+            self._tokens -= 1
+            # _last_update is in the future while paused: tokens only
+            #   start refilling once the pause ends
+            wait = max(self._last_update - now, 0.0)
+            wait += max(-self._tokens, 0.0) / self.rate
+            self.stats.requests += 1
+            if wait > 0:
+                self.stats.delayed += 1
+                self.stats.total_wait += wait
+            return wait
+
+    def _refill(self, now: float) -> None:
+        if now <= self._last_update:
+            return
+        elapsed = now - self._last_update
+        self._last_update = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def acquire(self) -> float:
+        """
+        Wait until a request can be sent.
+
+        :return: Number of seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop all requests for ``seconds``, e.g. when the server
+        responds with 429 Too Many Requests. The bucket is emptied, so
+        requests queued during the pause are sent at ``rate`` once it
+        ends, rather than all at once
+        """
+        with self._lock:
+            now = time.monotonic()
+            resume = now + seconds
+            if resume > self._last_update:
+                self._refill(now)
+                self._tokens = min(self._tokens, 0.0)
+                self._last_update = resume
+                self.stats.pauses += 1
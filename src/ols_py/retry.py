@@ -0,0 +1,159 @@
+"""
+Retrying failed requests with exponential backoff. Pass a policy to the client
+to retry rate-limited requests, server errors and connection errors, e.g.:
+
+    from ols_py.retry import RetryPolicy
+    client = Ols4Client(retry=RetryPolicy(max_retries=5))
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryStats:
+    """
+    Counters for retried requests
+    """
+
+    retries: int = 0
+    """Number of times a request was retried"""
+    retry_after: int = 0
+    """Retries where the delay came from the server's Retry-After header"""
+    gave_up: int = 0
+    """Requests that still failed after ``max_retries`` retries"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header, which can either be a number
+    of seconds or an HTTP date.
+
+    :return: Number of seconds to wait, or None if the header is missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed request. Delays grow
+    exponentially (``backoff_factor * 2 ** attempt``, capped at ``max_backoff``),
+    with random "full jitter" so that many clients/threads don't retry in lockstep.
+    A ``Retry-After`` header from the server takes priority over the calculated
+    delay.
+
+    A single policy can be shared between clients and threads.
+    """
+
+    stats: RetryStats
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        """
+        :param max_retries: Maximum number of times to retry a request
+        :param backoff_factor: Base delay in seconds. The delay before retry ``n``
+           (starting at 0) is up to ``backoff_factor * 2 ** n``
+        :param max_backoff: Maximum delay between retries, in seconds
+        :param jitter: Randomize delays between 0 and the calculated backoff
+        :param retry_statuses: HTTP statuses that should be retried
+        :param retry_connection_errors: Retry requests that fail due to connection
+           errors or timeouts
+        :param respect_retry_after: Use the server's ``Retry-After`` header
+           as the delay when it is provided (still capped at ``max_backoff``)
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries can't be negative")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.stats = RetryStats()
+        self._stats_lock = threading.Lock()
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get the delay before retrying, for the given attempt (starting at 0)
+        """
+        delay = min(self.backoff_factor * 2.0**attempt, self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def get_retry_delay(
+        self,
+        attempt: int,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        connection_error: bool = False,
+    ) -> Optional[float]:
+        """
+        Check whether a failed request should be retried, and
+        update the retry counters.
+
+        :param attempt: Number of retries made so far
+        :param status: HTTP status of the response, if one was received
+        :param retry_after: Value of the response's Retry-After header
+        :param connection_error: The request failed due to a
+           connection error or timeout
+        :return: Seconds to wait before retrying, or None if
+           the request shouldn't be retried
+        """
+        if connection_error:
+            retryable = self.retry_connection_errors
+        else:
+            retryable = status in self.retry_statuses
+        if not retryable:
+            return None
+        if attempt >= self.max_retries:
+            with self._stats_lock:
+                self.stats.gave_up += 1
+            return None
+        server_delay = (
+            parse_retry_after(retry_after) if self.respect_retry_after else None
+        )
+        with self._stats_lock:
+            self.stats.retries += 1
+            if server_delay is not None:
+                self.stats.retry_after += 1
+        if server_delay is not None:
+            return min(server_delay, self.max_backoff)
+        return self.get_backoff(attempt)
+
+
+def sleep(seconds: float) -> None:
+    """
+    Wait before retrying (wrapped so tests can patch it)
+    """
+    if seconds > 0:
+        time.sleep(seconds)
@@ -0,0 +1,162 @@
+"""
+Routing requests between several OLS instances serving the same data,
+e.g. a local mirror and the public EBI instance:
+
+    client = Ols4Client(base_url=["http://localhost:8080/api/", EBI_OLS4])
+
+Each request goes to the healthy instance with the lowest recent latency.
+Instances that fail (connection errors, timeouts, 429 or 5xx responses)
+are marked down for a while, and the request is sent to the next instance
+straight away.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+
+@dataclass
+class Instance:
+    """
+    An OLS instance, and what the router knows about its health
+    """
+
+    base_url: str
+    latency: Optional[float] = None
+    """Moving average of response times in seconds, None if not measured yet"""
+    consecutive_failures: int = 0
+    down_until: float = 0.0
+    """Time (from ``time.monotonic()``) the instance is marked down until"""
+    last_used: float = 0.0
+    probe_started: Optional[float] = None
+    """Time a request was sent to measure the instance, None if not probing"""
+    requests: int = 0
+    failures: int = 0
+
+    def is_down(self, now: float) -> bool:
+        return now < self.down_until
+
+
+class InstanceRouter:
+    """
+    Chooses which instance to send each request to. Latency is tracked with
+    an exponentially weighted moving average, so instances that slow down
+    are avoided until they recover.
+
+    Instances that haven't been measured yet, or haven't been used for
+    ``probe_interval`` seconds, are probed with a single request, so estimates
+    are kept up to date. While the probe is in flight, other requests go
+    to the measured instances. Instances that are down are only tried if
+    every instance is down.
+
+    The router is thread-safe, and can be shared between clients.
+    """
+
+    instances: list[Instance]
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        smoothing: float = 0.3,
+        cooldown: float = 5.0,
+        max_cooldown: float = 300.0,
+        probe_interval: float = 30.0,
+    ):
+        """
+        :param base_urls: Base API URLs of the instances, up to and including /api/.
+           The first is used as the client's ``base_url``, e.g. for cache keys
+        :param smoothing: Weight of each new response time in the latency
+           average (0-1). Higher values react faster to changes
+        :param cooldown: Seconds an instance is marked down for after a failure.
+           Doubles with each consecutive failure, up to ``max_cooldown``
+        :param max_cooldown: Maximum seconds an instance is marked down for
+        :param probe_interval: Retry instances that haven't been used for
+           this many seconds, to update their latency
+        """
+        if not base_urls:
+            raise ValueError("At least one base URL is required")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be between 0 and 1")
+        self.instances = [
+            Instance(url if url.endswith("/") else url + "/") for url in base_urls
+        ]
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return self.instances[0].base_url
+
+    @staticmethod
+    def is_failure(status: int) -> bool:
+        """
+        Check whether a response status means the request should be
+        sent to another instance
+        """
+        return status == 429 or status >= 500
+
+    def candidates(self) -> list[Instance]:
+        """
+        Get the instances to try for a request, in order
+        """
+        now = time.monotonic()
+        with self._lock:
+            up = [i for i in self.instances if not i.is_down(now)]
+            down = sorted(
+                (i for i in self.instances if i.is_down(now)),
+                key=lambda i: i.down_until,
+            )
+
+            def rank(instance: Instance) -> tuple[int, float]:
+                probing = (
+                    instance.probe_started is not None
+                    and now - instance.probe_started < self.probe_interval
+                )
+                stale = now - instance.last_used > self.probe_interval
+                if not probing and (instance.latency is None or stale):
+                    return (0, 0.0)
+                if instance.latency is None:
+                    # Unmeasured, with a probe in flight
+                    return (2, 0.0)
+                return (1, instance.latency)
+
+            up.sort(key=rank)
+            if up and rank(up[0])[0] == 0:
+                # Only send one request to probe an instance
+                up[0].probe_started = now
+        return up + down
+
+    def record_success(self, instance: Instance, seconds: float) -> None:
+        """
+        Record a response from ``instance`` that took ``seconds``
+        """
+        with self._lock:
+            instance.requests += 1
+            instance.last_used = time.monotonic()
+            instance.probe_started = None
+            instance.consecutive_failures = 0
+            instance.down_until = 0.0
+            if instance.latency is None:
+                instance.latency = seconds
+            else:
+                instance.latency += self.smoothing * (seconds - instance.latency)
+
+    def record_failure(self, instance: Instance) -> None:
+        """
+        Record a failed request, marking ``instance`` down
+        """
+        with self._lock:
+            now = time.monotonic()
+            instance.requests += 1
+            instance.failures += 1
+            instance.last_used = now
+            instance.probe_started = None
+            instance.consecutive_failures += 1
+            cooldown = self.cooldown * 2 ** (instance.consecutive_failures - 1)
+            instance.down_until = now + min(cooldown, self.max_cooldown)
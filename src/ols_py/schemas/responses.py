@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
@@ -76,6 +77,24 @@ class Term(BaseModel):
     links: dict[str, Link] = Field(..., alias="_links")
 
 
+@dataclass(frozen=True, slots=True)
+class LeanTerm:
+    """
+    Compact version of [Term][ols_py.schemas.responses.Term] with only the core
+    fields, for handling large numbers of terms. Uses ``__slots__`` and
+    doesn't parse IRIs as URLs, so it's much smaller and faster to create.
+    """
+
+    iri: str
+    label: str
+    short_form: str
+    ontology_name: str
+    obo_id: Optional[str] = None
+    is_obsolete: bool = False
+    has_children: bool = False
+    is_root: bool = False
+
+
 class ApiInfoLinks(BaseModel):
     """
     Set of links returned in the root endpoint/
@@ -151,6 +170,21 @@ class MultipleTerms(BaseModel):
     page: PageInfo
 
 
+class LeanEmbeddedTerms(BaseModel):
+    terms: list[LeanTerm]
+
+
+class LeanMultipleTerms(BaseModel):
+    """
+    Version of [MultipleTerms][ols_py.schemas.responses.MultipleTerms]
+    that parses terms as [LeanTerm][ols_py.schemas.responses.LeanTerm],
+    ignoring other fields
+    """
+
+    embedded: Optional[LeanEmbeddedTerms] = Field(None, alias="_embedded")
+    page: PageInfo
+
+
 class TermInDefiningOntologyLinks(BaseModel):
     self: Link
 
@@ -0,0 +1,380 @@
+"""
+Semantic similarity between terms and between profiles (sets of terms,
+e.g. the phenotypes of a patient or disease), computed locally from a
+[HierarchyIndex][ols_py.hierarchy.HierarchyIndex], e.g.:
+
+    from ols_py.similarity import SimilarityIndex
+    sim = SimilarityIndex.from_hierarchy(HierarchyIndex.load("hp.hierarchy"))
+    sim.similarity(seizure_iri, epilepsy_iri, method="lin")
+    scores = sim.score_profiles(patient_phenotypes, disease_profiles)
+
+Ancestor sets are computed once and stored as sparse (CSR) arrays, and
+scores against many terms or profiles are computed in batches with NumPy.
+
+Install the ``similarity`` extra to use it: ``pip install ols-py[similarity]``
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Hashable,
+    Iterable,
+    Literal,
+    Mapping,
+    Sequence,
+)
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Similarity requires numpy, install it with: pip install ols-py[similarity]"
+    ) from e
+
+if TYPE_CHECKING:
+    from .hierarchy import HierarchyIndex
+
+Method = Literal["resnik", "lin", "jaccard"]
+"""
+Term similarity measures:
+
+- ``resnik``: information content of the most informative common ancestor
+- ``lin``: Resnik similarity scaled by the information content of both terms (0-1)
+- ``jaccard``: overlap of the terms' ancestor sets (0-1)
+"""
+Aggregate = Literal["bma", "max"]
+"""
+Ways to combine term similarities into a profile similarity:
+
+- ``bma``: best-match average, averaged over both directions
+- ``max``: highest similarity between any pair of terms
+"""
+
+
+def _to_csr(rows: Sequence[Collection[int]]) -> tuple[np.ndarray, np.ndarray]:
+    lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    indices = np.fromiter(
+        (i for row in rows for i in row), dtype=np.int32, count=int(offsets[-1])
+    )
+    return offsets, indices
+
+
+class ProfileSet:
+    """
+    Profiles (sets of terms) converted to term indices for a
+    [SimilarityIndex][ols_py.similarity.SimilarityIndex], so they can be
+    scored against many queries without converting them again.
+    Create with [SimilarityIndex.profile_set()][ols_py.similarity.SimilarityIndex.profile_set].
+    """
+
+    keys: list[Hashable]
+    """Keys of the profiles, in the order scores are returned"""
+
+    def __init__(self, keys: list[Hashable], offsets: np.ndarray, indices: np.ndarray):
+        self.keys = keys
+        self.offsets = offsets
+        self.indices = indices
+        self.lengths = np.diff(offsets)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class SimilarityIndex:
+    """
+    Ancestor sets and information content for all terms in a hierarchy,
+    for computing semantic similarity.
+
+    Information content (IC) is computed from the hierarchy itself:
+    ``-log(n_descendants / n_terms)``, counting each term as its own
+    descendant, so the root has an IC of 0 and leaves have the highest IC.
+
+    Terms are identified by IRI. Methods raise ``KeyError`` for IRIs that
+    aren't in the index.
+    """
+
+    iris: list[str]
+    ic: np.ndarray
+    """Information content of each term, in the same order as ``iris``"""
+
+    def __init__(self, iris: list[str], parents: Sequence[Sequence[int]]):
+        """
+        Use [from_hierarchy()][ols_py.similarity.SimilarityIndex.from_hierarchy]
+        or [from_edges()][ols_py.similarity.SimilarityIndex.from_edges]
+        to create an index.
+
+        :param iris: IRIs of all terms
+        :param parents: Indices of each term's direct parents
+        :raises ValueError: if the hierarchy has a cycle
+        """
+        self.iris = iris
+        self._ids = {iri: i for i, iri in enumerate(iris)}
+        ancestors = self._get_ancestor_sets(parents)
+        self._anc_offsets, self._anc_indices = _to_csr(ancestors)
+        self._num_ancestors = np.diff(self._anc_offsets)
+        # Transpose the ancestor sets to get each term's descendants
+        order = np.argsort(self._anc_indices, kind="stable")
+        rows = np.repeat(np.arange(len(iris), dtype=np.int32), self._num_ancestors)
+        self._desc_indices = rows[order]
+        num_descendants = np.bincount(self._anc_indices, minlength=len(iris))
+        self._desc_offsets = np.zeros(len(iris) + 1, dtype=np.int64)
+        np.cumsum(num_descendants, out=self._desc_offsets[1:])
+        self.ic = -np.log(num_descendants / max(len(iris), 1))
+
+    @staticmethod
+    def _get_ancestor_sets(parents: Sequence[Sequence[int]]) -> list[frozenset[int]]:
+        """
+        Get the ancestors of each term (including itself), processing terms
+        in topological order so each parent's ancestors are already known
+        """
+        num_terms = len(parents)
+        children: list[list[int]] = [[] for _ in range(num_terms)]
+        num_unprocessed = [len(term_parents) for term_parents in parents]
+        for child, term_parents in enumerate(parents):
+            for parent in term_parents:
+                children[parent].append(child)
+        ancestors: list[frozenset[int]] = [frozenset()] * num_terms
+        ready = [term for term in range(num_terms) if not parents[term]]
+        num_done = 0
+        while ready:
+            term = ready.pop()
+            num_done += 1
+            ancestors[term] = frozenset({term}).union(
+                *(ancestors[parent] for parent in parents[term])
+            )
+            for child in children[term]:
+                num_unprocessed[child] -= 1
+                if num_unprocessed[child] == 0:
+                    ready.append(child)
+        if num_done < num_terms:
+            raise ValueError("Hierarchy contains a cycle")
+        return ancestors
+
+    @classmethod
+    def from_hierarchy(cls, index: HierarchyIndex) -> SimilarityIndex:
+        """
+        Create a similarity index for all the terms in a
+        [HierarchyIndex][ols_py.hierarchy.HierarchyIndex]
+        """
+        offsets, indices = index._parent_offsets, index._parent_indices
+        parents = [
+            indices[offsets[term] : offsets[term + 1]].tolist()
+            for term in range(len(index.iris))
+        ]
+        return cls(list(index.iris), parents)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str]]) -> SimilarityIndex:
+        """
+        Create a similarity index from ``(child_iri, parent_iri)`` pairs,
+        e.g. from [crawl_subtree()][ols_py.crawl.crawl_subtree]
+        """
+        ids: dict[str, int] = {}
+        pairs = set()
+        for child, parent in edges:
+            pairs.add(
+                (ids.setdefault(child, len(ids)), ids.setdefault(parent, len(ids)))
+            )
+        parents: list[list[int]] = [[] for _ in ids]
+        for child_id, parent_id in pairs:
+            parents[child_id].append(parent_id)
+        return cls(list(ids), parents)
+
+    def __len__(self) -> int:
+        return len(self.iris)
+
+    def __contains__(self, iri: object) -> bool:
+        return iri in self._ids
+
+    def _get_id(self, iri: str) -> int:
+        try:
+            return self._ids[iri]
+        except KeyError:
+            raise KeyError(f"{iri} is not in the index") from None
+
+    def _get_ids(self, iris: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self._get_id(iri) for iri in iris), dtype=np.int64)
+
+    def _ancestor_ids(self, term: int) -> np.ndarray:
+        return self._anc_indices[self._anc_offsets[term] : self._anc_offsets[term + 1]]
+
+    def _descendant_ids(self, term: int) -> np.ndarray:
+        return self._desc_indices[
+            self._desc_offsets[term] : self._desc_offsets[term + 1]
+        ]
+
+    def information_content(self, iri: str) -> float:
+        return float(self.ic[self._get_id(iri)])
+
+    def ancestors(self, iri: str) -> set[str]:
+        """
+        Get the ancestors of a term, including the term itself
+        """
+        return {self.iris[i] for i in self._ancestor_ids(self._get_id(iri))}
+
+    def _score_all(self, term: int, method: Method) -> np.ndarray:
+        """
+        Similarity of ``term`` to every term in the index. Only the terms
+        below each of ``term``'s ancestors need to be visited.
+        """
+        ancestors = self._ancestor_ids(term)
+        if method == "jaccard":
+            common = np.zeros(len(self.iris), dtype=np.float64)
+            for ancestor in ancestors:
+                common[self._descendant_ids(ancestor)] += 1
+            union = len(ancestors) + self._num_ancestors - common
+            return common / union
+        # Assign in increasing order of IC, so each term ends up with the
+        #   IC of its most informative common ancestor
+        resnik = np.zeros(len(self.iris), dtype=np.float64)
+        for ancestor in ancestors[np.argsort(self.ic[ancestors], kind="stable")]:
+            resnik[self._descendant_ids(ancestor)] = self.ic[ancestor]
+        if method == "resnik":
+            return resnik
+        if method == "lin":
+            total_ic = self.ic[term] + self.ic
+            lin = np.ones(len(self.iris), dtype=np.float64)
+            np.divide(2 * resnik, total_ic, out=lin, where=total_ic > 0)
+            return lin
+        raise ValueError(f"Unknown similarity method: {method!r}")
+
+    def _score_matrix(self, terms: np.ndarray, method: Method) -> np.ndarray:
+        scores = np.empty((len(terms), len(self.iris)), dtype=np.float64)
+        for row, term in enumerate(terms):
+            scores[row] = self._score_all(int(term), method)
+        return scores
+
+    def similarity(self, iri1: str, iri2: str, method: Method = "resnik") -> float:
+        """
+        Similarity between two terms
+        """
+        scores = self._score_all(self._get_id(iri1), method)
+        return float(scores[self._get_id(iri2)])
+
+    def one_vs_many(
+        self,
+        iri: str,
+        others: Sequence[str] | None = None,
+        method: Method = "resnik",
+    ) -> np.ndarray:
+        """
+        Similarity between one term and many others
+
+        :param others: IRIs to compare against, or None for every term
+          in the index (in the same order as ``iris``)
+        """
+        scores = self._score_all(self._get_id(iri), method)
+        if others is None:
+            return scores
+        selected: np.ndarray = scores[self._get_ids(others)]
+        return selected
+
+    def pairwise(
+        self, iris1: Sequence[str], iris2: Sequence[str], method: Method = "resnik"
+    ) -> np.ndarray:
+        """
+        Similarity between every pair of terms from ``iris1`` and ``iris2``
+
+        :return: Array of shape ``(len(iris1), len(iris2))``
+        """
+        scores = self._score_matrix(self._get_ids(iris1), method)
+        return scores[:, self._get_ids(iris2)]
+
+    def profile_set(
+        self, profiles: Mapping[Hashable, Iterable[str]] | Sequence[Iterable[str]]
+    ) -> ProfileSet:
+        """
+        Convert profiles to a [ProfileSet][ols_py.similarity.ProfileSet]
+        for scoring
+
+        :param profiles: Mapping of profile key (e.g. disease ID) to term IRIs,
+          or a sequence of term IRI collections (keyed by position)
+        """
+        if isinstance(profiles, Mapping):
+            keys = list(profiles)
+            values = list(profiles.values())
+        else:
+            keys = list(range(len(profiles)))
+            values = list(profiles)
+        offsets, indices = _to_csr(
+            [
+                list(dict.fromkeys(self._get_id(iri) for iri in terms))
+                for terms in values
+            ]
+        )
+        return ProfileSet(keys, offsets, indices)
+
+    def score_profiles(
+        self,
+        query: Iterable[str],
+        profiles: (
+            ProfileSet | Mapping[Hashable, Iterable[str]] | Sequence[Iterable[str]]
+        ),
+        method: Method = "resnik",
+        aggregate: Aggregate = "bma",
+    ) -> np.ndarray:
+        """
+        Score a query profile against many profiles, e.g. a patient's
+        phenotypes against each disease's phenotypes. The similarity of
+        each query term to every term is computed once, then combined for
+        all profiles at once. Empty profiles get a score of 0.
+
+        :param query: Term IRIs in the query profile
+        :param profiles: Profiles to compare against, as a
+          [ProfileSet][ols_py.similarity.ProfileSet] (fastest when scoring
+          many queries) or anything accepted by
+          [profile_set()][ols_py.similarity.SimilarityIndex.profile_set]
+        :param method: Term similarity measure
+        :param aggregate: How to combine term similarities
+        :return: Score for each profile, in the same order as ``profiles.keys``
+        :raises ValueError: if ``query`` is empty
+        """
+        query_ids = np.unique(self._get_ids(query))
+        if len(query_ids) == 0:
+            raise ValueError("query must contain at least one term")
+        if not isinstance(profiles, ProfileSet):
+            profiles = self.profile_set(profiles)
+        result = np.zeros(len(profiles), dtype=np.float64)
+        nonempty = profiles.lengths > 0
+        if not nonempty.any():
+            return result
+        starts = profiles.offsets[:-1][nonempty]
+        lengths = profiles.lengths[nonempty]
+        scores = self._score_matrix(query_ids, method)
+        # Best match in each profile for every query term, one query
+        #   term at a time to limit memory use
+        query_best = np.empty((len(query_ids), len(starts)), dtype=np.float64)
+        for row, term_scores in enumerate(scores):
+            query_best[row] = np.maximum.reduceat(term_scores[profiles.indices], starts)
+        if aggregate == "max":
+            result[nonempty] = query_best.max(axis=0)
+        elif aggregate == "bma":
+            # Best match in the query for every profile term
+            profile_best = scores.max(axis=0)[profiles.indices]
+            forward = query_best.mean(axis=0)
+            backward = np.add.reduceat(profile_best, starts) / lengths
+            result[nonempty] = (forward + backward) / 2
+        else:
+            raise ValueError(f"Unknown aggregate: {aggregate!r}")
+        return result
+
+    def profile_similarity(
+        self,
+        profile1: Iterable[str],
+        profile2: Iterable[str],
+        method: Method = "resnik",
+        aggregate: Aggregate = "bma",
+    ) -> float:
+        """
+        Similarity between two profiles.
+        See [score_profiles()][ols_py.similarity.SimilarityIndex.score_profiles]
+        """
+        return float(
+            self.score_profiles(
+                profile1, [profile2], method=method, aggregate=aggregate
+            )[0]
+        )
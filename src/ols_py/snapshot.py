@@ -0,0 +1,206 @@
+"""
+Offline snapshots of all the terms in an ontology, for looking up terms
+on machines that can't reach an OLS server, e.g.:
+
+    client.export_ontology("mondo", "mondo.jsonl")
+    # Later, possibly on another machine
+    from ols_py.snapshot import OntologySnapshot
+    with OntologySnapshot("mondo.jsonl") as snapshot:
+        term = snapshot.get_term("MONDO:0005148")
+
+Snapshots are stored as JSON Lines (one term per line, in the format
+returned by the API) with an index file alongside, mapping each term's IRI
+to its position in the file. The loader memory-maps the data file, so
+only the terms you look up are read and parsed.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Mapping, Optional, Type
+
+from .schemas.responses import Term
+
+SNAPSHOT_VERSION = 1
+
+
+def get_index_path(path: str | os.PathLike[str]) -> Path:
+    """
+    Get the path of the index file for a snapshot
+    """
+    return Path(str(path) + ".index.json")
+
+
+class SnapshotWriter:
+    """
+    Write terms to a snapshot file. The index is written when the writer
+    is closed, so incomplete snapshots can't be loaded.
+    """
+
+    path: Path
+    ontology_id: str
+
+    def __init__(self, path: str | os.PathLike[str], ontology_id: str):
+        self.path = Path(path)
+        self.ontology_id = ontology_id
+        self._file = open(self.path, "wb")
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._ids: dict[str, str] = {}
+
+    def write(self, term: Mapping[str, Any]) -> None:
+        """
+        Add a term to the snapshot, in the format returned by the API.
+        Terms that have already been written are skipped.
+        """
+        iri = term["iri"]
+        if iri in self._offsets:
+            return
+        line = json.dumps(term, ensure_ascii=False, separators=(",", ":")).encode()
+        self._offsets[iri] = (self._file.tell(), len(line))
+        self._file.write(line + b"\n")
+        for id_field in ("obo_id", "short_form"):
+            term_id = term.get(id_field)
+            if term_id:
+                self._ids.setdefault(term_id, iri)
+
+    def write_many(self, terms: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Add several terms to the snapshot, see
+        [write()][ols_py.snapshot.SnapshotWriter.write]
+        """
+        for term in terms:
+            self.write(term)
+
+    def close(self) -> None:
+        """
+        Finish the snapshot and write its index
+        """
+        if self._file.closed:
+            return
+        self._file.close()
+        index = {
+            "version": SNAPSHOT_VERSION,
+            "ontology_id": self.ontology_id,
+            "created": time.time(),
+            "terms": self._offsets,
+            "ids": self._ids,
+        }
+        with open(get_index_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __enter__(self) -> SnapshotWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't write the index for a failed export
+            self._file.close()
+
+
+class OntologySnapshot:
+    """
+    Look up terms in a snapshot created with
+    [Ols4Client.export_ontology()][ols_py.client.Ols4Client.export_ontology].
+    Terms can be looked up by IRI, OBO ID or short form.
+    """
+
+    path: Path
+    ontology_id: str
+    created: float
+    """Time the snapshot was created, as a Unix timestamp"""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        :param path: Path to the snapshot file. Its index
+            (``<path>.index.json``) must be in the same directory
+        :raises FileNotFoundError: if the snapshot or index file doesn't exist
+        :raises ValueError: if the snapshot was written by an incompatible version
+        """
+        self.path = Path(path)
+        with open(get_index_path(self.path), "rb") as f:
+            index = json.load(f)
+        if index.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {index.get('version')}")
+        self.ontology_id = index["ontology_id"]
+        self.created = index["created"]
+        self._offsets: dict[str, list[int]] = index["terms"]
+        self._ids: dict[str, str] = index["ids"]
+        self._file = open(self.path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        # Empty files can't be memory-mapped
+        if self._offsets:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _get_iri(self, term_id: str) -> str:
+        if term_id in self._offsets:
+            return term_id
+        try:
+            return self._ids[term_id]
+        except KeyError:
+            raise KeyError(f"{term_id} is not in the snapshot") from None
+
+    def get_raw(self, term_id: str) -> bytes:
+        """
+        Get the stored JSON for a term, without parsing it
+
+        :param term_id: IRI, OBO ID or short form
+        :raises KeyError: if the term isn't in the snapshot
+        """
+        offset, length = self._offsets[self._get_iri(term_id)]
+        end = offset + length
+        assert self._mmap is not None
+        return self._mmap[offset:end]
+
+    def get_term(self, term_id: str) -> Term:
+        """
+        Get a term, like [Ols4Client.get_term()][ols_py.client.Ols4Client.get_term]
+
+        :param term_id: IRI, OBO ID or short form
+        :raises KeyError: if the term isn't in the snapshot
+        """
+        return Term.model_validate_json(self.get_raw(term_id))
+
+    @property
+    def iris(self) -> list[str]:
+        return list(self._offsets)
+
+    def __iter__(self) -> Iterator[Term]:
+        for iri in self._offsets:
+            yield self.get_term(iri)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, term_id: object) -> bool:
+        return term_id in self._offsets or term_id in self._ids
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> OntologySnapshot:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
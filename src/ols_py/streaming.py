@@ -0,0 +1,73 @@
+"""
+Incremental parsing of large responses, so items can be validated and
+used as the response is downloaded, without holding the whole response
+in memory. Used by the ``stream_*`` client methods.
+
+Install the ``stream`` extra to use it: ``pip install ols-py[stream]``
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generic, Type, TypeVar
+
+import pydantic
+
+try:
+    import ijson
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Streaming requires ijson, install it with: pip install ols-py[stream]"
+    ) from e
+
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Number of bytes to read from the response at a time"""
+TERMS_PREFIX = "_embedded.terms.item"
+"""ijson prefix for the terms in a MultipleTerms response"""
+
+
+class ItemParser(Generic[M]):
+    """
+    Push parser that extracts the items at ``prefix`` from chunks
+    of a JSON response, validating each with ``schema``, e.g.:
+
+        parser = ItemParser(schemas.responses.Term, TERMS_PREFIX)
+        for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+            yield from parser.feed(chunk)
+        parser.close()
+    """
+
+    def __init__(self, schema: Type[M], prefix: str):
+        """
+        :param schema: Pydantic model to validate each item with
+        :param prefix: ijson prefix for the items, e.g. ``"_embedded.terms.item"``
+        """
+        self.schema = schema
+        self._items: list[Any] = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+
+    def feed(self, chunk: bytes) -> list[M]:
+        """
+        Parse the next chunk of the response
+
+        :return: Items that were completed by this chunk
+        :raises ijson.JSONError: if the response isn't valid JSON
+        """
+        self._coro.send(chunk)
+        return self._take_items()
+
+    def close(self) -> list[M]:
+        """
+        Finish parsing the response
+
+        :return: Any remaining items
+        :raises ijson.IncompleteJSONError: if the response was incomplete
+        """
+        self._coro.close()
+        return self._take_items()
+
+    def _take_items(self) -> list[M]:
+        items = [self.schema.model_validate(item) for item in self._items]
+        del self._items[:]
+        return items
@@ -0,0 +1,194 @@
+"""
+Stores for terms the client has already downloaded. Every term the
+client parses (from ``get_term()``, ``get_terms()``, the relatives endpoints,
+``get_term_in_defining_ontology()`` and their ``iter_*`` versions) is added
+to the store, and ``get_term()`` returns stored terms without a request,
+e.g.:
+
+    from ols_py.term_store import SqliteTermStore
+    client = Ols4Client(term_store=SqliteTermStore("terms.sqlite"))
+    for term in client.iter_term_descendants("mondo", "MONDO:0005148"):
+        ...
+    # No request needed, the term was stored while iterating
+    client.get_term("mondo", "http://purl.obolibrary.org/obo/MONDO_0005149")
+
+Unlike a response cache, terms are stored by IRI and ontology, so a term
+can be reused no matter which endpoint it was first seen in.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from os import PathLike
+from typing import Iterable, Optional
+
+from .cache import CacheStats
+from .schemas.responses import Term
+
+
+class BaseTermStore(ABC):
+    """
+    Base class for term stores. To implement a new storage backend,
+    subclass this and implement ``get_stored()``, ``add()``, ``clear()``
+    and ``__len__()``.
+
+    Backends must be safe to use from multiple threads.
+    """
+
+    ttl: Optional[float]
+    stats: CacheStats
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        :param ttl: Time (in seconds) to keep terms for, or None to
+           keep them until they're replaced or the store is cleared
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, ontology_id: str, iri: str) -> Optional[Term]:
+        """
+        Get the stored version of term ``iri`` in ontology ``ontology_id``,
+        if it has been stored and hasn't expired
+        """
+        min_stored = None if self.ttl is None else time.time() - self.ttl
+        term = self.get_stored(ontology_id.lower(), iri, min_stored=min_stored)
+        with self._stats_lock:
+            if term is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return term
+
+    @abstractmethod
+    def get_stored(
+        self, ontology_id: str, iri: str, min_stored: Optional[float] = None
+    ) -> Optional[Term]:
+        """
+        Get a term from storage
+
+        :param ontology_id: Lowercase ontology ID
+        :param min_stored: Ignore terms stored before this time (seconds since the epoch)
+        """
+
+    @abstractmethod
+    def add(self, terms: Iterable[Term]) -> None:
+        """
+        Store ``terms``, replacing any stored versions
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class MemoryTermStore(BaseTermStore):
+    """
+    Keeps terms in memory, for the lifetime of the client
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        super().__init__(ttl=ttl)
+        self._terms: dict[tuple[str, str], tuple[Term, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_stored(
+        self, ontology_id: str, iri: str, min_stored: Optional[float] = None
+    ) -> Optional[Term]:
+        with self._lock:
+            stored = self._terms.get((ontology_id, iri))
+        if stored is None:
+            return None
+        term, stored_at = stored
+        if min_stored is not None and stored_at < min_stored:
+            return None
+        return term
+
+    def add(self, terms: Iterable[Term]) -> None:
+        now = time.time()
+        new_terms = {(t.ontology_name.lower(), str(t.iri)): (t, now) for t in terms}
+        with self._lock:
+            self._terms.update(new_terms)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._terms.clear()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+class SqliteTermStore(BaseTermStore):
+    """
+    Stores terms in an SQLite database, so they can be reused between
+    processes/runs. Terms are stored as JSON and indexed by IRI.
+    """
+
+    def __init__(self, path: str | PathLike[str], ttl: Optional[float] = None):
+        """
+        :param path: Path to the database file, created if it doesn't exist
+        :param ttl: Time (in seconds) to keep terms for, or None to keep them
+           until they're replaced
+        """
+        super().__init__(ttl=ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS terms (
+                    iri TEXT NOT NULL,
+                    ontology TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    stored REAL NOT NULL,
+                    PRIMARY KEY (iri, ontology)
+                )
+                """)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_stored(
+        self, ontology_id: str, iri: str, min_stored: Optional[float] = None
+    ) -> Optional[Term]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM terms WHERE iri = ? AND ontology = ? AND stored >= ?",
+                (iri, ontology_id, min_stored if min_stored is not None else 0),
+            ).fetchone()
+        if row is None:
+            return None
+        return Term.model_validate_json(row[0])
+
+    def add(self, terms: Iterable[Term]) -> None:
+        now = time.time()
+        rows = [
+            (
+                str(term.iri),
+                term.ontology_name.lower(),
+                term.model_dump_json(by_alias=True),
+                now,
+            )
+            for term in terms
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO terms VALUES (?, ?, ?, ?)", rows
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM terms")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM terms").fetchone()
+        return int(count)
@@ -0,0 +1,101 @@
+"""
+Build example OLS response data for tests that shouldn't hit the live API
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+import requests
+
+BASE_URL = "http://ols.example.com/api/"
+
+
+def make_term(
+    short_form: str = "GO_0043226",
+    label: str = "organelle",
+    ontology_name: str = "go",
+    has_children: bool = True,
+) -> dict[str, Any]:
+    """
+    Term data in the format returned by the OLS4 term endpoints
+    """
+    iri = f"http://purl.obolibrary.org/obo/{short_form}"
+    return {
+        "iri": iri,
+        "label": label,
+        "description": [f"Description of {label}"],
+        "annotation": {"has_obo_namespace": ["cellular_component"]},
+        "synonyms": [f"{label} synonym"],
+        "obo_xref": [{"database": "Wikipedia", "id": "Organelle", "url": None}],
+        "obo_synonym": [
+            {"name": f"{label} synonym", "scope": "hasExactSynonym", "xrefs": []}
+        ],
+        "ontology_name": ontology_name,
+        "ontology_prefix": ontology_name.upper(),
+        "ontology_iri": f"http://purl.obolibrary.org/obo/{ontology_name}.owl",
+        "is_obsolete": False,
+        "term_replaced_by": None,
+        "has_children": has_children,
+        "is_root": False,
+        "short_form": short_form,
+        "obo_id": short_form.replace("_", ":"),
+        "in_subset": None,
+        "_links": {
+            "self": {"href": f"{BASE_URL}ontologies/{ontology_name}/terms/{iri}"}
+        },
+    }
+
+
+def make_multiple_terms(
+    terms: list[dict[str, Any]],
+    page: int = 0,
+    size: int = 20,
+    total_elements: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Wrap ``terms`` in a MultipleTerms-style page
+    """
+    if total_elements is None:
+        total_elements = len(terms)
+    total_pages = -(-total_elements // size)
+    return {
+        "_embedded": {"terms": terms},
+        "_links": {"self": {"href": f"{BASE_URL}ontologies/go/terms"}},
+        "page": {
+            "size": size,
+            "totalElements": total_elements,
+            "totalPages": total_pages,
+            "number": page,
+        },
+    }
+
+
+def make_search_response(docs: list[dict[str, Any]], start: int = 0) -> dict:
+    """
+    Search/select response containing ``docs``
+    """
+    return {
+        "responseHeader": {"status": 0, "QTime": 1},
+        "response": {"numFound": len(docs), "start": start, "docs": docs},
+    }
+
+
+def make_response(
+    data: Any = None,
+    status: int = 200,
+    headers: Optional[dict[str, str]] = None,
+    url: str = BASE_URL,
+) -> requests.Response:
+    """
+    Create a requests.Response with ``data`` as its JSON body, for mocking
+    the session used by the client
+    """
+    resp = requests.Response()
+    resp.status_code = status
+    resp.reason = "OK" if status < 400 else "Error"
+    resp.url = url
+    resp._content = json.dumps(data).encode() if data is not None else b""
+    resp.headers.update(headers or {})
+    return resp
@@ -0,0 +1,206 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+
+from .factories import BASE_URL, make_multiple_terms, make_search_response, make_term
+
+
+def make_client(handler, max_concurrency: int = 10) -> AsyncOls4Client:
+    """
+    Create an async client that sends requests to ``handler`` instead
+    of the network
+    """
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncOls4Client(
+        base_url=BASE_URL, max_concurrency=max_concurrency, http_client=http_client
+    )
+
+
+def test_async_client_mirrors_sync_methods():
+    """
+    Every public method of the sync client should be available on the async client
+    """
+    sync_methods = {name for name in dir(Ols4Client) if not name.startswith("_")}
+    async_methods = {name for name in dir(AsyncOls4Client) if not name.startswith("_")}
+    assert sync_methods - async_methods == set()
+
+
+def test_async_get_term():
+    iri = "http://purl.obolibrary.org/obo/GO_0043226"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.raw_path.endswith(
+            b"/ontologies/go/terms/http%253A%252F%252Fpurl.obolibrary.org%252Fobo%252FGO_0043226"
+        )
+        assert request.headers["accept"] == "application/json"
+        return httpx.Response(200, json=make_term())
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_term("go", iri)
+
+    term = asyncio.run(main())
+    assert str(term.iri) == iri
+
+
+def test_async_get_term_relatives_params():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/ontologies/go/hierarchicalDescendants"
+        assert request.url.params["id"] == "GO:0043226"
+        assert request.url.params["size"] == "50"
+        return httpx.Response(200, json=make_multiple_terms([make_term()]))
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_term_hierarchical_descendants(
+                "go", "GO:0043226", params={"size": 50}
+            )
+
+    resp = asyncio.run(main())
+    assert resp.embedded.terms[0].label == "organelle"
+
+
+def test_async_search():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["q"] == "hi* dys*"
+        assert request.url.params["ontology"] == "mondo,hp"
+        return httpx.Response(200, json=make_search_response([{"iri": "x"}]))
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.search(
+                "hi dys", params={"ontology": ["mondo", "hp"]}, add_wildcards=True
+            )
+
+    resp = asyncio.run(main())
+    assert resp.response.docs[0].iri == "x"
+
+
+def test_async_http_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, content=json.dumps({"status": 404}))
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.get_ontology("foobar")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "timeout, expected",
+    [
+        (None, {"connect": 10.0, "read": 60.0, "write": 60.0, "pool": 60.0}),
+        (5.0, {"connect": 5.0, "read": 5.0, "write": 5.0, "pool": 5.0}),
+    ],
+)
+def test_async_timeout(timeout, expected):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.extensions["timeout"] == expected
+        return httpx.Response(200, json=make_term())
+
+    async def main():
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        async with AsyncOls4Client(
+            base_url=BASE_URL, http_client=http_client, **kwargs
+        ) as client:
+            await client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+
+    asyncio.run(main())
+
+
+def test_async_max_concurrency():
+    """
+    Check no more than max_concurrency requests are in flight at once
+    """
+    in_flight = 0
+    max_seen = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_seen
+        in_flight += 1
+        max_seen = max(max_seen, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=make_term())
+
+    async def main():
+        async with make_client(handler, max_concurrency=3) as client:
+            return await asyncio.gather(
+                *(client.get_term("go", f"iri{i}") for i in range(20))
+            )
+
+    terms = asyncio.run(main())
+    assert len(terms) == 20
+    assert max_seen == 3
+
+
+def test_async_max_concurrency_invalid():
+    with pytest.raises(ValueError):
+        AsyncOls4Client(max_concurrency=0)
+
+
+@pytest.mark.parametrize("prefetch", [False, True, 3])
+def test_async_iter_term_ancestors(prefetch):
+    total = 9
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        size = int(request.url.params["size"])
+        terms = [
+            make_term(short_form=f"GO_{i:07d}")
+            for i in range(page * size, min((page + 1) * size, total))
+        ]
+        return httpx.Response(
+            200,
+            json=make_multiple_terms(terms, page=page, size=size, total_elements=total),
+        )
+
+    async def main():
+        async with make_client(handler) as client:
+            return [
+                term.short_form
+                async for term in client.iter_term_ancestors(
+                    "go", "GO:0043226", page_size=2, prefetch=prefetch
+                )
+            ]
+
+    assert asyncio.run(main()) == [f"GO_{i:07d}" for i in range(total)]
+
+
+def test_async_get_terms_bulk():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.raw_path.endswith(b"MISSING"):
+            return httpx.Response(404, json={"status": 404})
+        return httpx.Response(200, json=make_term())
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_terms_bulk("go", ["a", "MISSING", "a"])
+
+    results = asyncio.run(main())
+    assert list(results) == ["a", "MISSING"]
+    assert results["a"].label == "organelle"
+    assert isinstance(results["MISSING"], httpx.HTTPStatusError)
+
+
+def test_async_search_many():
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        return httpx.Response(200, json=make_search_response([{"label": query}]))
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.search_many(["Seizure", "seizure ", "ataxia"])
+
+    results = asyncio.run(main())
+    assert list(results) == ["Seizure", "seizure ", "ataxia"]
+    assert results["Seizure"] is results["seizure "]
+    assert results["ataxia"].response.docs[0].label == "ataxia"
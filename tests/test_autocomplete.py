@@ -0,0 +1,238 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+from unittest import mock
+
+import httpx
+import pytest
+
+from ols_py.autocomplete import (
+    AUTOCOMPLETE_FIELDS,
+    AsyncAutocompleteSession,
+    AutocompleteSession,
+    PrefixIndex,
+    SelectCache,
+    normalize,
+)
+from ols_py.client import Ols4Client
+from ols_py.schemas.responses import SearchResponse, SearchResultItem, Term
+from ols_py.snapshot import OntologySnapshot
+
+from .factories import (
+    BASE_URL,
+    make_multiple_terms,
+    make_response,
+    make_search_response,
+    make_term,
+)
+from .test_async_client import make_client
+
+
+def term_data(short_form: str, label: str, synonyms=None, obsolete=False) -> dict:
+    data = make_term(short_form, label=label)
+    data["synonyms"] = synonyms
+    data["is_obsolete"] = obsolete
+    return data
+
+
+TERMS = [
+    term_data("T_1", "heart disease", synonyms=["cardiopathy"]),
+    term_data("T_2", "congenital heart disease"),
+    term_data("T_3", "heart"),
+    term_data("T_4", "Heartburn", synonyms=["heart burn"]),
+    term_data("T_5", "lung disease", synonyms=["Heart"]),
+    term_data("T_6", "heart attack", obsolete=True),
+]
+
+
+@pytest.fixture
+def index() -> PrefixIndex:
+    return PrefixIndex.from_terms(Term.model_validate(t) for t in TERMS)
+
+
+def short_forms(results: list[SearchResultItem]) -> list[str]:
+    return [r.short_form for r in results]
+
+
+def test_normalize():
+    assert normalize("  Heart\tDISEASE ") == "heart disease"
+
+
+def test_select_ranking(index):
+    assert len(index) == 5
+    # exact label, exact synonym, label prefixes, then word matches
+    assert short_forms(index.select("heart")) == ["T_3", "T_5", "T_1", "T_4", "T_2"]
+    assert short_forms(index.select("HEART D")) == ["T_1", "T_2"]
+    assert short_forms(index.select("disease")) == ["T_1", "T_2", "T_5"]
+    assert short_forms(index.select("cardio")) == ["T_1"]
+    assert index.select("kidney") == []
+    assert index.select("  ") == []
+
+
+def test_select_rows(index):
+    assert short_forms(index.select("heart", rows=2)) == ["T_3", "T_5"]
+
+
+def test_select_result_fields(index):
+    (result,) = index.select("cardiopathy")
+    assert result.iri == "http://purl.obolibrary.org/obo/T_1"
+    assert result.label == "heart disease"
+    assert result.obo_id == "T:1"
+    assert result.ontology_name == "go"
+    assert result.synonyms == ["cardiopathy"]
+    assert result.type == "class"
+
+
+def test_include_obsolete():
+    index = PrefixIndex.from_terms(
+        (Term.model_validate(t) for t in TERMS), include_obsolete=True
+    )
+    assert "T_6" in short_forms(index.select("heart a"))
+
+
+def test_from_snapshot(tmp_path):
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_multiple_terms(TERMS))
+    )
+    path = tmp_path / "test.jsonl"
+    client.export_ontology("test", path)
+    with OntologySnapshot(path) as snapshot:
+        index = PrefixIndex.from_snapshot(snapshot)
+    assert short_forms(index.select("heart d")) == ["T_1", "T_2"]
+
+
+def test_build():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_multiple_terms(TERMS))
+    )
+    index = PrefixIndex.build(client, "test")
+    assert short_forms(index.select("lung")) == ["T_5"]
+
+
+def make_select_handler(docs: list[dict], delays: Optional[dict[str, float]] = None):
+    """
+    Fake /select endpoint returning the ``docs`` with a label starting
+    with the query, recording the queries it receives
+    """
+    queries = []
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        assert url.endswith("/select")
+        query = params["q"]
+        queries.append(query)
+        time.sleep((delays or {}).get(query, 0))
+        matches = [d for d in docs if d["label"].startswith(query)]
+        rows = int(params["rows"])
+        resp = make_search_response(matches[:rows])
+        resp["response"]["numFound"] = len(matches)
+        return make_response(resp)
+
+    return get, queries
+
+
+SELECT_DOCS = [
+    {"iri": "http://example.com/1", "label": "heart", "synonym": ["cor"]},
+    {"iri": "http://example.com/2", "label": "heartburn"},
+    {"iri": "http://example.com/3", "label": "hepatitis"},
+]
+
+
+def test_select_cache_narrows_complete_results():
+    cache = SelectCache()
+    resp = SearchResponse.model_validate(make_search_response(SELECT_DOCS))
+    cache.store("he", resp)
+    narrowed = cache.get("hear")
+    assert [d.label for d in narrowed.response.docs] == ["heart", "heartburn"]
+    assert narrowed.response.numFound == 2
+    assert cache.get("co") is None
+    # Matches on synonyms are kept too
+    cache.store("c", resp)
+    assert [d.label for d in cache.get("cor").response.docs] == ["heart"]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+    # Queries with several words are left to the server
+    cache.store("heart", resp)
+    assert cache.get("heart b") is None
+
+    # Results for "h" weren't complete, so "he" can't be answered from them
+    incomplete = SearchResponse.model_validate(make_search_response(SELECT_DOCS))
+    incomplete.response.numFound = 10
+    cache = SelectCache()
+    cache.store("h", incomplete)
+    assert cache.get("he") is None
+
+
+def test_autocomplete_session_debounces():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get, queries = make_select_handler(SELECT_DOCS)
+    results = []
+    done = threading.Event()
+
+    def on_results(text, resp):
+        results.append((text, [d.label for d in resp.response.docs]))
+        done.set()
+
+    session = AutocompleteSession(client, on_results, debounce=0.05)
+    for text in ["h", "he", "hea"]:
+        session.update(text)
+    assert done.wait(2)
+    assert queries == ["hea"]
+    assert results == [("hea", ["heart", "heartburn"])]
+    # Each keystroke is looked up in the cache once
+    assert (session.cache.stats.hits, session.cache.stats.misses) == (0, 3)
+
+    # Answered from the "hea" results without a request
+    done.clear()
+    session.update("Heart ")
+    assert done.wait(2)
+    assert queries == ["hea"]
+    assert results[-1] == ("Heart ", ["heart", "heartburn"])
+
+
+def test_autocomplete_session_drops_stale_results():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get, queries = make_select_handler(SELECT_DOCS, delays={"he": 0.3})
+    results = []
+    done = threading.Event()
+
+    def on_results(text, resp):
+        results.append(text)
+        done.set()
+
+    session = AutocompleteSession(client, on_results, debounce=0, rows=1)
+    session.update("he")
+    time.sleep(0.1)
+    session.update("hep")
+    assert done.wait(2)
+    time.sleep(0.3)
+    assert queries == ["he", "hep"]
+    assert results == ["hep"]
+
+
+def test_async_autocomplete_session_cancels_requests():
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        requested.append(query)
+        assert request.url.path.endswith("/select")
+        assert request.url.params["fieldList"] == ",".join(AUTOCOMPLETE_FIELDS)
+        if query == "he":
+            await asyncio.sleep(1)
+        return httpx.Response(200, json=make_search_response(SELECT_DOCS[:1]))
+
+    async def main():
+        async with make_client(handler) as client:
+            session = AsyncAutocompleteSession(client, debounce=0)
+            first = asyncio.ensure_future(session.update("he"))
+            await asyncio.sleep(0.05)
+            second = await session.update("hea")
+            assert session.cache.stats.misses == 2
+            return await first, second
+
+    first, second = asyncio.run(main())
+    assert first is None
+    assert second.response.docs[0].label == "heart"
+    assert requested == ["he", "hea"]
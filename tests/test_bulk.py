@@ -0,0 +1,151 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from ols_py.bulk import run_bulk
+from ols_py.client import Ols4Client
+
+from .factories import (
+    BASE_URL,
+    make_multiple_terms,
+    make_response,
+    make_search_response,
+    make_term,
+)
+
+
+@pytest.fixture
+def client() -> Ols4Client:
+    return Ols4Client(base_url=BASE_URL)
+
+
+def test_run_bulk_order_and_dedup():
+    calls = []
+
+    def lookup(key):
+        calls.append(key)
+        # Finish in reverse order to make sure we keep input order
+        time.sleep(0.001 * (5 - key))
+        return key * 10
+
+    results = run_bulk([3, 1, 3, 2, 1], lookup, max_workers=4)
+    assert list(results.items()) == [(3, 30), (1, 10), (2, 20)]
+    assert sorted(calls) == [1, 2, 3]
+
+
+def test_run_bulk_max_workers():
+    in_flight = 0
+    max_seen = 0
+    lock = threading.Lock()
+
+    def lookup(key):
+        nonlocal in_flight, max_seen
+        with lock:
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return key
+
+    run_bulk(range(30), lookup, max_workers=3)
+    assert max_seen <= 3
+
+
+def test_run_bulk_invalid_max_workers():
+    with pytest.raises(ValueError):
+        run_bulk([1], lambda x: x, max_workers=0)
+
+
+def test_get_terms_bulk(client):
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        if "MISSING" in url:
+            return make_response({"status": 404}, status=404)
+        short_form = url.rsplit("%252F", 1)[-1]
+        return make_response(make_term(short_form=short_form))
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    iris = [
+        "http://purl.obolibrary.org/obo/GO_0000002",
+        "http://purl.obolibrary.org/obo/MISSING",
+        "http://purl.obolibrary.org/obo/GO_0000001",
+        "http://purl.obolibrary.org/obo/GO_0000002",
+    ]
+    results = client.get_terms_bulk("go", iris, max_workers=2)
+    assert list(results) == iris[:3]
+    assert results[iris[0]].short_form == "GO_0000002"
+    assert isinstance(results[iris[1]], requests.HTTPError)
+    assert results[iris[2]].short_form == "GO_0000001"
+    assert client._session.get.call_count == 3
+
+
+def test_resolve_many(client):
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        if params and "obo_id" in params:
+            return make_response(make_multiple_terms([make_term("MONDO_0018660")]))
+        if params and "short_form" in params:
+            # No results
+            return make_response(
+                {
+                    "_links": {"self": {"href": url}},
+                    "page": {
+                        "size": 20,
+                        "totalElements": 0,
+                        "totalPages": 0,
+                        "number": 0,
+                    },
+                }
+            )
+        assert "findByIdAndIsDefiningOntology/http%253A" in url
+        return make_response(make_multiple_terms([make_term("HP_0000118")]))
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    results = client.resolve_many(
+        ["MONDO:0018660", "http://purl.obolibrary.org/obo/HP_0000118", "FOO_1"]
+    )
+    assert results["MONDO:0018660"].short_form == "MONDO_0018660"
+    assert results["http://purl.obolibrary.org/obo/HP_0000118"].short_form == (
+        "HP_0000118"
+    )
+    assert isinstance(results["FOO_1"], LookupError)
+
+
+def test_search_many(client):
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        assert params["ontology"] == "hp"
+        if params["q"] == "fail":
+            return make_response({"status": 500}, status=500)
+        return make_response(make_search_response([{"label": params["q"]}]))
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    queries = ["Short stature", "seizure", "short  stature", "fail"]
+    results = client.search_many(queries, params={"ontology": "hp"})
+    assert list(results) == queries
+    assert results["Short stature"].response.docs[0].label == "short stature"
+    assert results["short  stature"] is results["Short stature"]
+    assert isinstance(results["fail"], requests.HTTPError)
+    assert client._session.get.call_count == 3
+
+    client._session.get.reset_mock()
+    results = client.search_many(
+        queries[:3], params={"ontology": "hp"}, deduplicate=False
+    )
+    assert results["short  stature"].response.docs[0].label == "short  stature"
+    assert client._session.get.call_count == 3
+
+
+def test_search_many_best_hit_only(client):
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_search_response([{"label": "seizure"}]))
+    )
+    client.search_many(["seizure"], best_hit_only=True)
+    params = client._session.get.call_args.kwargs["params"]
+    assert params["rows"] == "1"
+    assert params["fieldList"] == "iri,label,obo_id,short_form,ontology_name,type"
+
+    client.search_many(["seizure"], params={"fieldList": ["iri"]}, best_hit_only=True)
+    params = client._session.get.call_args.kwargs["params"]
+    assert params["fieldList"] == "iri"
@@ -0,0 +1,196 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from ols_py.cache import BaseCache, MemoryCache, SqliteCache
+from ols_py.client import Ols4Client
+
+from .factories import BASE_URL, make_response, make_term
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    """
+    Create caches of each type, with the same arguments
+    """
+
+    def make(**kwargs) -> BaseCache:
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        return SqliteCache(tmp_path / "cache.sqlite", **kwargs)
+
+    return make
+
+
+def test_make_key_normalizes_params():
+    url = BASE_URL + "search"
+    key1 = BaseCache.make_key(url, {"q": "cow", "rows": 10, "start": None})
+    key2 = BaseCache.make_key(url, {"rows": "10", "q": "cow"})
+    assert key1 == key2
+    assert BaseCache.make_key(url, {"start": None}) == url
+    assert BaseCache.make_key(url, {"q": "pig"}) != key1
+
+
+def test_endpoint_ttls():
+    cache = MemoryCache(
+        ttl=100, endpoint_ttls={"/search": 5, "/ontologies/*/terms/*": None}
+    )
+    assert cache.get_ttl("search") == 5
+    assert cache.get_ttl("/ontologies/go/terms/http%253A%252F%252Fx") is None
+    assert cache.get_ttl("/ontologies/go") == 100
+
+
+def test_cache_expiry(make_cache):
+    cache = make_cache(ttl=10, endpoint_ttls={"/search": 1})
+    with mock.patch("ols_py.cache.time.time", return_value=1000.0):
+        cache.store("term", path="/ontologies/go/terms/x", content=b"term")
+        cache.store("search", path="/search", content=b"search")
+    with mock.patch("ols_py.cache.time.time", return_value=1005.0):
+        assert cache.lookup("term").is_fresh()
+        # Expired entries are still returned, so they can be revalidated
+        assert not cache.lookup("search").is_fresh()
+        assert cache.lookup("missing") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_cache_max_entries(make_cache):
+    cache = make_cache(max_entries=2)
+    with mock.patch("ols_py.cache.time.time", side_effect=range(100)):
+        cache.store("a", path="/", content=b"a")
+        cache.store("b", path="/", content=b"b")
+        # Use a, so b is the least recently used
+        cache.lookup("a")
+        cache.store("c", path="/", content=b"c")
+    assert len(cache) == 2
+    assert cache.get_entry("b") is None
+    assert cache.get_entry("a") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_cache_max_bytes(make_cache):
+    cache = make_cache(max_entries=None, max_bytes=10)
+    with mock.patch("ols_py.cache.time.time", side_effect=range(100)):
+        cache.store("a", path="/", content=b"12345")
+        cache.store("b", path="/", content=b"12345")
+        cache.store("c", path="/", content=b"123")
+    assert cache.get_entry("a") is None
+    assert [cache.get_entry(k).content for k in "bc"] == [b"12345", b"123"]
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteCache(path)
+    cache.store("a", path="/", content=b"a", headers={"ETag": "x"})
+    cache.close()
+    reopened = SqliteCache(path)
+    entry = reopened.lookup("a")
+    assert entry.content == b"a"
+    assert entry.headers == {"ETag": "x"}
+
+
+def test_client_uses_cache(make_cache):
+    client = Ols4Client(base_url=BASE_URL, cache=make_cache())
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    first = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    second = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    assert first == second
+    assert client._session.get.call_count == 1
+    assert client.cache.stats.hits == 1
+    assert client.cache.stats.misses == 1
+
+
+def test_client_does_not_cache_errors(make_cache):
+    client = Ols4Client(base_url=BASE_URL, cache=make_cache())
+    client._session.get = mock.MagicMock(
+        return_value=make_response({"status": 404}, status=404)
+    )
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get("/ontologies/foobar")
+    assert client._session.get.call_count == 2
+    assert len(client.cache) == 0
+
+
+def test_client_revalidates_expired_entries(make_cache):
+    """
+    Expired responses should be revalidated with a conditional request, and
+    reused without downloading the body if the server returns 304
+    """
+    client = Ols4Client(base_url=BASE_URL, cache=make_cache(ttl=0))
+    validators = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response(make_term(), headers=validators),
+            make_response(status=304, headers={"ETag": '"v1"'}),
+        ]
+    )
+    first = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    assert client._session.get.call_args.kwargs["headers"] is None
+    second = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    assert first == second
+    assert client._session.get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert client.cache.stats.revalidations == 1
+
+
+def test_client_revalidation_changed(make_cache):
+    """
+    If the response has changed, the new body should be used and stored
+    """
+    client = Ols4Client(base_url=BASE_URL, cache=make_cache(ttl=0))
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response({"version": 1}, headers={"ETag": '"v1"'}),
+            make_response({"version": 2}, headers={"ETag": '"v2"'}),
+            make_response(status=304),
+        ]
+    )
+    assert client.get("/")["version"] == 1
+    assert client.get("/")["version"] == 2
+    assert client.get("/")["version"] == 2
+    assert client._session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v2"'}
+    assert client.cache.stats.revalidations == 1
+
+
+def test_client_no_validators(make_cache):
+    """
+    Expired responses without validators are fetched normally
+    """
+    client = Ols4Client(base_url=BASE_URL, cache=make_cache(ttl=0))
+    client._session.get = mock.MagicMock(return_value=make_response({"number": 1}))
+    client.get("/")
+    client.get("/")
+    assert client._session.get.call_args.kwargs["headers"] == {}
+    assert client.cache.stats.misses == 2
+
+
+def test_memory_cache_reuses_parsed_models():
+    client = Ols4Client(base_url=BASE_URL, cache=MemoryCache(ttl=0, keep_parsed=True))
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response(make_term(), headers={"ETag": '"v1"'}),
+            make_response(status=304),
+        ]
+    )
+    iri = "http://purl.obolibrary.org/obo/GO_0043226"
+    first = client.get_term("go", iri)
+    # Revalidated, but not parsed again
+    assert client.get_term("go", iri) is first
+
+
+def test_memory_cache_doesnt_keep_parsed_models_by_default():
+    # Parsed models aren't counted in the cache's limits, so they aren't kept
+    cache = MemoryCache()
+    assert not cache.keep_parsed
+    client = Ols4Client(base_url=BASE_URL, cache=cache)
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    iri = "http://purl.obolibrary.org/obo/GO_0043226"
+    first = client.get_term("go", iri)
+    second = client.get_term("go", iri)
+    assert second == first and second is not first
+    assert client._session.get.call_count == 1
+    assert MemoryCache(max_bytes=10**6, keep_parsed=True).keep_parsed
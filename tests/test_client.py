@@ -1,3 +1,7 @@
+import http.server
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pydantic
@@ -6,7 +10,9 @@ import requests
 
 from ols_py.client import Ols4Client
 from ols_py.instances import EBI_OLS4
-from ols_py.schemas.responses import OlsErrorSchema
+from ols_py.schemas.responses import OlsErrorSchema, SearchResponse
+
+from .factories import make_response, make_search_response
 
 
 @pytest.fixture
@@ -194,7 +200,7 @@ def test_get_with_schema_valid_data(ols4_client):
     when data matches the schema
     """
     # Return data from the get request that matches the schema
-    ols4_client.get = mock.MagicMock(return_value={"number": 3})
+    ols4_client._session.get = mock.MagicMock(return_value=make_response({"number": 3}))
     data = ols4_client.get_with_schema(DummySchema, "/")
     assert data.number == 3
 
@@ -206,7 +212,9 @@ def test_get_with_schema_invalid_data(ols4_client):
     """
     # Return data from the get request that doesn't match the
     # schema
-    ols4_client.get = mock.MagicMock(return_value={"number": "word"})
+    ols4_client._session.get = mock.MagicMock(
+        return_value=make_response({"number": "word"})
+    )
     with pytest.raises(pydantic.ValidationError):
         resp = ols4_client.get_with_schema(DummySchema, "/")
         print(resp)
@@ -330,6 +338,25 @@ def test_search_validate_params(ols4_client):
         resp = ols4_client.search(query="cow", params={"type": "klass"})
 
 
+def test_search_fields():
+    client = Ols4Client(base_url=EBI_OLS4)
+    client._session.get = mock.MagicMock(
+        return_value=make_response(
+            make_search_response([{"iri": "x", "label": "cow", "synonym": ["bull"]}])
+        )
+    )
+    resp = client.search(
+        "cow", params={"fieldList": ["iri"]}, fields=["label", "synonym"]
+    )
+    assert (
+        client._session.get.call_args.kwargs["params"]["fieldList"] == "label,synonym"
+    )
+    result = resp.response.docs[0]
+    assert result.label == "cow"
+    assert result.synonyms == ["bull"]
+    assert isinstance(resp, SearchResponse)
+
+
 def test_quote_iri():
     """
     Make sure we are correctly double URL encoding IRIs for
@@ -370,3 +397,62 @@ def test_get_term_in_defining_ontology(ols4_client):
     )
     assert resp_from_short_form.page.totalElements == 1
     assert str(resp_from_short_form.embedded.terms[0].iri) == iri
+
+
+def test_session_options():
+    client = Ols4Client(base_url=EBI_OLS4, pool_maxsize=32, compression=False)
+    adapter = client._session.get_adapter(EBI_OLS4)
+    assert adapter._pool_maxsize == 32
+    assert client._session.headers["accept-encoding"] == "identity"
+    assert client._session.headers["accept"] == "application/json"
+    with pytest.raises(ValueError):
+        Ols4Client(base_url=EBI_OLS4, pool_maxsize=0)
+
+
+def test_custom_session_and_timeout():
+    session = requests.Session()
+    session.get = mock.MagicMock(return_value=make_response({"number": 1}))
+    client = Ols4Client(base_url=EBI_OLS4, session=session, timeout=2.5)
+    assert client.get_with_schema(DummySchema, "/dummy").number == 1
+    assert session.get.call_args.kwargs["timeout"] == 2.5
+
+
+def test_shared_between_threads():
+    """
+    Threads sharing a client should reuse the pooled connections
+    """
+    connections = set()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            connections.add(self.client_address)
+            body = json.dumps({"number": int(self.path.rsplit("/", 1)[-1])}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}/api/"
+        client = Ols4Client(base_url=base_url, pool_maxsize=4, pool_block=True)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(
+                    lambda i: client.get_with_schema(DummySchema, f"numbers/{i}"),
+                    range(40),
+                )
+            )
+        assert [r.number for r in results] == list(range(40))
+        assert len(connections) <= 4
+    finally:
+        server.shutdown()
+        server.server_close()
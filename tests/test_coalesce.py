@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import httpx
+import pytest
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.coalesce import SingleFlight
+
+from .factories import BASE_URL, make_response, make_term
+
+IRI = "http://purl.obolibrary.org/obo/GO_0043226"
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_result():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(single_flight.do, "key", slow_call) for _ in range(8)]
+        wait_for(lambda: single_flight.coalesced == 7)
+        release.set()
+        results = [f.result() for f in futures]
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert len(single_flight) == 0
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def failing_call():
+        release.wait(timeout=5)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(single_flight.do, "key", failing_call) for _ in range(4)]
+        wait_for(lambda: single_flight.coalesced == 3)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+    assert len(single_flight) == 0
+
+
+def test_single_flight_no_caching():
+    single_flight = SingleFlight()
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.do("key", lambda: 2) == 2
+    assert single_flight.coalesced == 0
+
+
+def test_client_coalesce():
+    client = Ols4Client(base_url=BASE_URL, coalesce=True)
+    release = threading.Event()
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        release.wait(timeout=5)
+        return make_response(make_term())
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        futures = [pool.submit(client.get_term, "go", IRI) for _ in range(10)]
+        wait_for(lambda: client._single_flight.coalesced == 9)
+        release.set()
+        terms = [f.result() for f in futures]
+    assert client._session.get.call_count == 1
+    assert all(t is terms[0] for t in terms)
+
+
+def test_client_no_coalesce_by_default():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: client.get_term("go", IRI), range(4)))
+    assert client._session.get.call_count == 4
+
+
+def test_async_client_coalesce():
+    num_requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal num_requests
+        num_requests += 1
+        return httpx.Response(200, json=make_term())
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def main():
+        async with AsyncOls4Client(
+            base_url=BASE_URL, http_client=http_client, coalesce=True
+        ) as client:
+            terms = await asyncio.gather(
+                *(client.get_term("go", IRI) for _ in range(10))
+            )
+            data = await asyncio.gather(*(client.get("/") for _ in range(3)))
+            return terms, data
+
+    terms, data = asyncio.run(main())
+    assert num_requests == 2
+    assert all(t is terms[0] for t in terms)
+    # Parsed JSON dicts are separate copies
+    assert data[0] == data[1] and data[0] is not data[1]
@@ -0,0 +1,120 @@
+import threading
+from typing import Optional
+from unittest import mock
+
+import pytest
+import requests
+
+from ols_py.client import Ols4Client
+from ols_py.crawl import CrawlState, Edge, crawl_subtree
+from ols_py.hierarchy import HierarchyIndex
+
+from .factories import BASE_URL, make_multiple_terms, make_response, make_term
+
+OBO = "http://purl.obolibrary.org/obo/"
+
+# GO_1
+# ├── GO_2
+# │   └── GO_4
+# └── GO_3
+#     ├── GO_4
+#     └── GO_5
+#         └── GO_6
+CHILDREN = {
+    "GO_1": ["GO_2", "GO_3"],
+    "GO_2": ["GO_4"],
+    "GO_3": ["GO_4", "GO_5"],
+    "GO_5": ["GO_6"],
+}
+
+
+def make_client(fail: Optional[set[str]] = None) -> Ols4Client:
+    """
+    Client with fake children/hierarchicalChildren endpoints for the
+    tree in ``CHILDREN``
+    """
+    lock = threading.Lock()
+    requested = []
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        assert url.rsplit("/", 1)[1] in ("children", "hierarchicalChildren")
+        short_form = params["id"].removeprefix(OBO)
+        with lock:
+            requested.append(short_form)
+        if short_form in (fail or set()):
+            return make_response({"status": 500}, status=500)
+        terms = [
+            make_term(child, label=child.lower(), has_children=child in CHILDREN)
+            for child in CHILDREN.get(short_form, [])
+        ]
+        return make_response(make_multiple_terms(terms))
+
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(side_effect=get)
+    client.requested = requested  # type: ignore[attr-defined]
+    return client
+
+
+def short_edges(edges: list[Edge]) -> set[tuple[str, str, int]]:
+    return {
+        (e.child.removeprefix(OBO), e.parent.removeprefix(OBO), e.depth) for e in edges
+    }
+
+
+def test_crawl_subtree():
+    client = make_client()
+    edges = list(crawl_subtree(client, "go", OBO + "GO_1", max_workers=4))
+    assert short_edges(edges) == {
+        ("GO_2", "GO_1", 1),
+        ("GO_3", "GO_1", 1),
+        ("GO_4", "GO_2", 2),
+        ("GO_4", "GO_3", 2),
+        ("GO_5", "GO_3", 2),
+        ("GO_6", "GO_5", 3),
+    }
+    # Each term is only requested once. Leaves are requested too, since
+    #   they may have hierarchical children
+    assert sorted(client.requested) == ["GO_1", "GO_2", "GO_3", "GO_4", "GO_5", "GO_6"]
+    # Breadth-first
+    assert [e.depth for e in edges] == sorted(e.depth for e in edges)
+
+    index = HierarchyIndex.from_edges((e.child, e.parent) for e in edges)
+    assert index.ancestors(OBO + "GO_6") == {OBO + "GO_5", OBO + "GO_3", OBO + "GO_1"}
+
+
+def test_crawl_subtree_skip_leaves():
+    client = make_client()
+    edges = list(crawl_subtree(client, "go", OBO + "GO_1", relation="children"))
+    assert len(edges) == 6
+    # has_children is reliable for is-a children, so leaves aren't requested
+    assert sorted(client.requested) == ["GO_1", "GO_2", "GO_3", "GO_5"]
+    with pytest.raises(ValueError):
+        next(crawl_subtree(client, "go", OBO + "GO_1", skip_leaves=True))
+
+
+def test_crawl_subtree_max_depth():
+    client = make_client()
+    edges = list(crawl_subtree(client, "go", OBO + "GO_1", max_depth=1))
+    assert short_edges(edges) == {("GO_2", "GO_1", 1), ("GO_3", "GO_1", 1)}
+    assert client.requested == ["GO_1"]
+    assert list(crawl_subtree(client, "go", OBO + "GO_1", max_depth=0)) == []
+    with pytest.raises(ValueError):
+        next(crawl_subtree(client, "go", OBO + "GO_1", max_depth=-1))
+
+
+def test_crawl_subtree_resume(tmp_path):
+    state = CrawlState()
+    with pytest.raises(requests.HTTPError):
+        client = make_client(fail={"GO_5"})
+        list(crawl_subtree(client, "go", OBO + "GO_1", "children", state=state))
+    assert state.pending == {OBO + "GO_5": 2}
+    assert not state.is_finished
+
+    path = tmp_path / "crawl.json"
+    state.save(path)
+    state = CrawlState.load(path)
+    client = make_client()
+    edges = list(crawl_subtree(client, "go", OBO + "GO_1", "children", state=state))
+    assert short_edges(edges) == {("GO_6", "GO_5", 3)}
+    assert client.requested == ["GO_5"]
+    assert state.is_finished
@@ -0,0 +1,135 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from ols_py.client import Ols4Client
+from ols_py.hierarchy import HierarchyIndex
+
+from .factories import BASE_URL, make_multiple_terms, make_response, make_term
+
+OBO = "http://purl.obolibrary.org/obo/"
+
+# root
+# ├── a
+# │   └── c
+# └── b
+#     ├── c
+#     └── d
+EDGES = [
+    ("a", "root"),
+    ("b", "root"),
+    ("c", "a"),
+    ("c", "b"),
+    ("d", "b"),
+    ("c", "a"),
+]
+
+
+@pytest.fixture
+def index() -> HierarchyIndex:
+    return HierarchyIndex.from_edges(
+        EDGES, labels={"root": "Root", "orphan": "Orphan"}, ontology_id="test"
+    )
+
+
+def test_from_edges(index):
+    assert len(index) == 6
+    assert index.num_edges == 5
+    assert "orphan" in index
+    assert index.label("root") == "Root"
+    assert index.label("c") == ""
+    assert sorted(index.parents("c")) == ["a", "b"]
+    assert sorted(index.children("b")) == ["c", "d"]
+    assert index.parents("orphan") == []
+
+
+def test_ancestors_descendants(index):
+    assert index.ancestors("c") == {"a", "b", "root"}
+    assert index.ancestors("root") == set()
+    assert index.descendants("root") == {"a", "b", "c", "d"}
+    assert index.descendants("b") == {"c", "d"}
+
+
+def test_is_a(index):
+    assert index.is_a("c", "root")
+    assert index.is_a("c", "c")
+    assert not index.is_a("d", "a")
+    assert not index.is_a("root", "c")
+    with pytest.raises(KeyError):
+        index.is_a("missing", "root")
+
+
+def test_lowest_common_ancestors(index):
+    assert index.lowest_common_ancestors("c", "d") == {"b"}
+    assert index.lowest_common_ancestors("a", "d") == {"root"}
+    assert index.lowest_common_ancestors("c", "a") == {"a"}
+    assert index.lowest_common_ancestors("c", "orphan") == set()
+
+
+def test_save_load(index, tmp_path):
+    path = tmp_path / "test.hierarchy"
+    index.save(path)
+    loaded = HierarchyIndex.load(path)
+    assert loaded.iris == index.iris
+    assert loaded.labels == index.labels
+    assert loaded.ontology_id == "test"
+    assert loaded.relation == "hierarchicalParents"
+    assert loaded.descendants("root") == index.descendants("root")
+    assert loaded.lowest_common_ancestors("c", "d") == {"b"}
+
+
+def test_load_invalid(tmp_path):
+    path = tmp_path / "not_an_index"
+    path.write_bytes(b"{}")
+    with pytest.raises(ValueError):
+        HierarchyIndex.load(path)
+
+
+def test_build():
+    terms = {
+        "GO_1": make_term("GO_1", label="root"),
+        "GO_2": make_term("GO_2", label="child"),
+        "GO_3": make_term("GO_3", label="leaf", has_children=False),
+    }
+    children = {"GO_1": ["GO_2"], "GO_2": ["GO_3"], "GO_3": []}
+    relation = "hierarchicalChildren"
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        if url.endswith("/terms"):
+            return make_response(make_multiple_terms(list(terms.values())))
+        assert url == BASE_URL + f"ontologies/go/{relation}"
+        short_form = params["id"].removeprefix(OBO)
+        return make_response(
+            make_multiple_terms([terms[c] for c in children[short_form]])
+        )
+
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(side_effect=get)
+    index = HierarchyIndex.build(client, "go", max_workers=2)
+    # Leaf terms may still have hierarchical (e.g. part-of) children
+    assert client._session.get.call_count == 4
+    assert index.ontology_id == "go"
+    assert index.ancestors(OBO + "GO_3") == {OBO + "GO_1", OBO + "GO_2"}
+    assert index.label(OBO + "GO_3") == "leaf"
+
+    # Leaves are skipped for is-a relations
+    client._session.get.reset_mock()
+    relation = "children"
+    index = HierarchyIndex.build(client, "go", relation="parents")
+    assert client._session.get.call_count == 3
+    assert index.ancestors(OBO + "GO_3") == {OBO + "GO_1", OBO + "GO_2"}
+    with pytest.raises(ValueError):
+        HierarchyIndex.build(client, "go", skip_leaves=True)
+
+
+def test_build_error():
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        if url.endswith("/terms"):
+            return make_response(make_multiple_terms([make_term("GO_1")]))
+        return make_response({"status": 500}, status=500)
+
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(side_effect=get)
+    with pytest.raises(requests.HTTPError):
+        HierarchyIndex.build(client, "go", relation="parents")
@@ -0,0 +1,214 @@
+import asyncio
+import http.server
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+import requests
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.cache import MemoryCache
+from ols_py.client import Ols4Client
+from ols_py.instrumentation import (
+    ClientHooks,
+    PrometheusExporter,
+    StatsCollector,
+    get_endpoint,
+    percentile,
+)
+from ols_py.retry import RetryPolicy
+
+from .factories import BASE_URL, make_response, make_term
+
+TERM_IRI = "http://purl.obolibrary.org/obo/GO_0043226"
+TERM_ENDPOINT = "/ontologies/{ontology}/terms/{iri}"
+
+
+class RecordingHooks(ClientHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, event):
+        self.events.append(("start", event))
+
+    def on_request(self, event):
+        self.events.append(("request", event))
+
+    def on_retry(self, event):
+        self.events.append(("retry", event))
+
+    def on_cache(self, event):
+        self.events.append(("cache", event))
+
+    def on_parse(self, event):
+        self.events.append(("parse", event))
+
+    def kinds(self):
+        return [kind for kind, _ in self.events]
+
+
+def test_get_endpoint():
+    assert get_endpoint("ontologies/go/terms/http%253A%252F%252Fx/parents") == (
+        "/ontologies/{ontology}/terms/{iri}/parents"
+    )
+    assert get_endpoint("/ontologies/go/terms") == "/ontologies/{ontology}/terms"
+    assert get_endpoint("/search") == "/search"
+
+
+def test_percentile():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 50) == 2.0
+    assert percentile(values, 99) == 4.0
+    assert percentile(values, 0) == 1.0
+
+
+def test_request_and_parse_events():
+    hooks = RecordingHooks()
+    client = Ols4Client(base_url=BASE_URL, hooks=[hooks])
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    client.get_term("go", TERM_IRI)
+    assert hooks.kinds() == ["start", "request", "parse"]
+    request = hooks.events[1][1]
+    assert request.endpoint == TERM_ENDPOINT
+    assert request.status == 200
+    assert request.num_bytes > 0
+    assert request.seconds >= 0
+    parse = hooks.events[2][1]
+    assert parse.schema == "Term"
+    assert parse.decode_seconds == 0.0
+
+
+def test_retry_events():
+    hooks = RecordingHooks()
+    policy = RetryPolicy(backoff_factor=1.0, jitter=False)
+    client = Ols4Client(base_url=BASE_URL, retry=policy, hooks=[hooks])
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            requests.ConnectionError("reset"),
+            make_response({"status": 503}, status=503),
+            make_response(make_term()),
+        ]
+    )
+    with mock.patch("ols_py.client.retry_sleep"):
+        client.get("/ontologies/go/terms")
+    requests_ = [e for kind, e in hooks.events if kind == "request"]
+    retries = [e for kind, e in hooks.events if kind == "retry"]
+    assert [r.attempt for r in requests_] == [0, 1, 2]
+    assert isinstance(requests_[0].error, requests.ConnectionError)
+    assert [r.attempt for r in retries] == [1, 2]
+    assert [r.status for r in retries] == [None, 503]
+
+
+def test_cache_events():
+    hooks = RecordingHooks()
+    client = Ols4Client(
+        base_url=BASE_URL, cache=MemoryCache(keep_parsed=True), hooks=[hooks]
+    )
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    client.get_term("go", TERM_IRI)
+    client.get_term("go", TERM_IRI)
+    results = [e.result for kind, e in hooks.events if kind == "cache"]
+    assert results == ["miss", "hit"]
+    # Parsed result is reused from the cache, so only parsed once
+    assert hooks.kinds().count("parse") == 1
+
+
+def test_stats_collector():
+    stats = StatsCollector(percentiles=(50, 100))
+    policy = RetryPolicy(backoff_factor=1.0, jitter=False)
+    client = Ols4Client(base_url=BASE_URL, retry=policy, hooks=[stats])
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response({"status": 503}, status=503),
+            make_response(make_term()),
+            make_response(make_term()),
+        ]
+    )
+    with mock.patch("ols_py.client.retry_sleep"):
+        client.get_term("go", TERM_IRI)
+        client.get_term("go", TERM_IRI)
+    summary = stats.summary()[TERM_ENDPOINT]
+    assert summary.requests == 3
+    assert summary.errors == 1
+    assert summary.retries == 1
+    assert summary.parses == 2
+    assert set(summary.request_percentiles) == {50, 100}
+    stats.reset()
+    assert stats.summary() == {}
+
+
+def test_async_client_events():
+    hooks = RecordingHooks()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=make_term())
+    )
+
+    async def run():
+        async with AsyncOls4Client(
+            base_url=BASE_URL,
+            http_client=httpx.AsyncClient(transport=transport),
+            hooks=[hooks],
+        ) as client:
+            await client.get_term("go", TERM_IRI)
+
+    asyncio.run(run())
+    assert hooks.kinds() == ["start", "request", "parse"]
+    assert hooks.events[1][1].endpoint == TERM_ENDPOINT
+
+
+def test_prometheus_render():
+    stats = StatsCollector()
+    client = Ols4Client(
+        base_url=BASE_URL, cache=MemoryCache(keep_parsed=True), hooks=[stats]
+    )
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    client.get_term("go", TERM_IRI)
+    client.get_term("go", TERM_IRI)
+    text = PrometheusExporter(stats).render()
+    labels = '{endpoint="/ontologies/{ontology}/terms/{iri}"}'
+    assert f"ols_requests_total{labels} 1" in text
+    assert (
+        'ols_cache_events_total{endpoint="/ontologies/{ontology}/terms/{iri}",'
+        'result="hit"} 1'
+    ) in text
+    assert f"ols_parse_duration_seconds_count{labels} 1" in text
+    assert "# TYPE ols_request_duration_seconds summary" in text
+
+
+@pytest.fixture
+def pushgateway():
+    """
+    Local stand-in for a Prometheus Pushgateway, recording pushed metrics
+    """
+    pushed = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_PUT(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            pushed.append((self.path, body.decode("utf-8")))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", pushed
+    server.shutdown()
+    server.server_close()
+
+
+def test_prometheus_push(pushgateway):
+    url, pushed = pushgateway
+    stats = StatsCollector()
+    client = Ols4Client(base_url=BASE_URL, hooks=[stats])
+    client._session.get = mock.MagicMock(return_value=make_response(make_term()))
+    client.get_term("go", TERM_IRI)
+    PrometheusExporter(stats).push(url, job="test")
+    assert len(pushed) == 1
+    path, body = pushed[0]
+    assert path == "/metrics/job/test"
+    assert "ols_requests_total" in body
@@ -0,0 +1,100 @@
+from unittest import mock
+
+import pydantic
+import pytest
+
+from ols_py.client import Ols4Client
+from ols_py.lazy import LazyModel, is_lazy, lazy_validate
+from ols_py.schemas.responses import (
+    MultipleTerms,
+    OboSynonym,
+    SearchResponse,
+    Term,
+)
+from ols_py.term_store import MemoryTermStore
+
+from .factories import (
+    BASE_URL,
+    make_multiple_terms,
+    make_response,
+    make_search_response,
+    make_term,
+)
+
+
+def test_lazy_fields():
+    page = lazy_validate(MultipleTerms, make_multiple_terms([make_term()]))
+    assert is_lazy(page, MultipleTerms)
+    term = page.embedded.terms[0]
+    assert is_lazy(term, Term)
+    assert term.label == "organelle"
+    assert isinstance(term.iri, pydantic.AnyUrl)
+    assert is_lazy(term.links["self"])
+    assert term.links["self"].href == term.materialize().links["self"].href
+    assert page.page.totalPages == 1
+    # Values are only converted once
+    assert term.iri is term.iri
+
+
+def test_lazy_defaults_and_aliases():
+    synonym = lazy_validate(OboSynonym, {"name": "x", "scope": "exact"})
+    assert synonym.type is None
+    assert synonym.xrefs == []
+    other = lazy_validate(OboSynonym, {"name": "y", "scope": "exact"})
+    assert synonym.xrefs is not other.xrefs
+
+    resp = lazy_validate(
+        SearchResponse, make_search_response([{"synonym": ["a"], "extra": 1}])
+    )
+    doc = resp.response.docs[0]
+    assert doc.synonyms == ["a"]
+    # Extra fields are allowed on search results
+    assert doc.extra == 1
+    with pytest.raises(AttributeError):
+        doc.not_a_field
+
+
+def test_lazy_errors_on_access():
+    data = make_term()
+    data["is_obsolete"] = "not a bool"
+    del data["label"]
+    term = lazy_validate(Term, data)
+    # Other fields can still be read
+    assert term.short_form == "GO_0043226"
+    with pytest.raises(pydantic.ValidationError):
+        term.is_obsolete
+    with pytest.raises(pydantic.ValidationError):
+        term.label
+    with pytest.raises(pydantic.ValidationError):
+        term.materialize()
+    with pytest.raises(TypeError):
+        term.label = "organelle"
+
+
+def test_lazy_client():
+    terms = [make_term(f"GO_000000{i}") for i in range(3)]
+    client = Ols4Client(base_url=BASE_URL, lazy=True, term_store=MemoryTermStore())
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_multiple_terms(terms))
+    )
+    page = client.get_term_children("go", "GO:0043226")
+    assert isinstance(page, LazyModel)
+    assert [t.short_form for t in page.embedded.terms] == [
+        "GO_0000000",
+        "GO_0000001",
+        "GO_0000002",
+    ]
+    # Terms are validated to be stored
+    stored = client.term_store.get("go", "http://purl.obolibrary.org/obo/GO_0000001")
+    assert isinstance(stored, Term)
+
+    labels = [t.label for t in client.iter_term_children("go", "GO:0043226")]
+    assert labels == ["organelle"] * 3
+
+    # Terms from the store are returned as proxies too
+    term = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0000001")
+    assert is_lazy(term, Term)
+    assert not isinstance(term, Term)
+    assert term.short_form == "GO_0000001"
+    assert term.materialize() == stored
+    assert term.raw["_links"]["self"]["href"] == str(stored.links["self"].href)
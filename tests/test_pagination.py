@@ -0,0 +1,227 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ols_py.client import Ols4Client
+from ols_py.pagination import MAX_PAGE_SIZE, MAX_SEARCH_ROWS, iter_pages
+from ols_py.schemas.responses import LeanTerm
+
+from .factories import (
+    BASE_URL,
+    make_multiple_terms,
+    make_response,
+    make_search_response,
+    make_term,
+)
+
+
+def paged_terms_handler(total: int):
+    """
+    Fake session.get() that returns ``total`` terms split into pages
+    according to the page/size params
+    """
+    all_terms = [make_term(short_form=f"GO_{i:07d}") for i in range(total)]
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        page, size = params["page"], params["size"]
+        terms = all_terms[page * size : (page + 1) * size]
+        return make_response(
+            make_multiple_terms(terms, page=page, size=size, total_elements=total)
+        )
+
+    return get
+
+
+@pytest.fixture
+def client() -> Ols4Client:
+    return Ols4Client(base_url=BASE_URL)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_term_descendants(client, prefetch):
+    client._session.get = mock.MagicMock(side_effect=paged_terms_handler(total=25))
+    terms = list(
+        client.iter_term_descendants(
+            "go", "GO:0043226", page_size=10, prefetch=prefetch
+        )
+    )
+    assert [t.short_form for t in terms] == [f"GO_{i:07d}" for i in range(25)]
+    assert client._session.get.call_count == 3
+    last_call = client._session.get.call_args.kwargs
+    assert last_call["url"] == BASE_URL + "ontologies/go/descendants"
+    assert last_call["params"] == {"id": "GO:0043226", "page": 2, "size": 10}
+
+
+def test_iter_lean_term_relatives(client):
+    client._session.get = mock.MagicMock(side_effect=paged_terms_handler(total=5))
+    terms = list(
+        client.iter_lean_term_relatives("descendants", "go", "GO:0043226", page_size=2)
+    )
+    assert [t.short_form for t in terms] == [f"GO_{i:07d}" for i in range(5)]
+    assert all(isinstance(t, LeanTerm) for t in terms)
+    last_call = client._session.get.call_args.kwargs
+    assert last_call["url"] == BASE_URL + "ontologies/go/descendants"
+
+
+def test_iter_lean_terms(client):
+    client._session.get = mock.MagicMock(side_effect=paged_terms_handler(total=3))
+    terms = list(client.iter_lean_terms("go", params={"page": 3}))
+    assert [t.label for t in terms] == ["organelle"] * 3
+    assert client._session.get.call_args.kwargs["params"] == {
+        "page": 0,
+        "size": MAX_PAGE_SIZE,
+    }
+
+
+def test_iter_terms_default_page_size(client):
+    client._session.get = mock.MagicMock(side_effect=paged_terms_handler(total=3))
+    terms = list(client.iter_terms("go", params={"obo_id": "GO:0000001", "size": 5}))
+    assert len(terms) == 3
+    params = client._session.get.call_args.kwargs["params"]
+    assert params == {"obo_id": "GO:0000001", "page": 0, "size": MAX_PAGE_SIZE}
+
+
+def test_iter_empty_page(client):
+    """
+    Empty pages don't include _embedded
+    """
+    empty = make_multiple_terms([], total_elements=0)
+    del empty["_embedded"]
+    client._session.get = mock.MagicMock(return_value=make_response(empty))
+    assert list(client.iter_term_children("go", "GO:0043226")) == []
+
+
+def test_iter_ontologies(client):
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        page = params["page"]
+        data = {
+            "_embedded": {
+                "ontologies": [
+                    {
+                        "ontologyId": f"onto{page}",
+                        "status": "LOADED",
+                        "numberOfProperties": 1,
+                        "numberOfTerms": 1,
+                        "_links": {
+                            rel: {"href": f"{BASE_URL}ontologies/onto{page}"}
+                            for rel in ["self", "terms", "properties", "individuals"]
+                        },
+                    }
+                ]
+            },
+            "page": {"size": 1, "totalElements": 2, "totalPages": 2, "number": page},
+        }
+        return make_response(data)
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    ontologies = list(client.iter_ontologies(page_size=1))
+    assert [o.ontologyId for o in ontologies] == ["onto0", "onto1"]
+
+
+def test_iter_search(client):
+    docs = [{"iri": f"iri{i}"} for i in range(7)]
+
+    def get(url, params=None, headers=None, timeout=None, stream=False):
+        assert url == BASE_URL + "search"
+        start, rows = int(params["start"]), int(params["rows"])
+        data = make_search_response(docs[start : start + rows], start=start)
+        data["response"]["numFound"] = len(docs)
+        return make_response(data)
+
+    client._session.get = mock.MagicMock(side_effect=get)
+    results = list(
+        client.iter_search("cow", params={"ontology": "go", "start": 2}, page_size=2)
+    )
+    assert [r.iri for r in results] == [f"iri{i}" for i in range(2, 7)]
+    assert client._session.get.call_count == 3
+    assert client._session.get.call_args_list[0].kwargs["params"] == {
+        "q": "cow",
+        "ontology": "go",
+        "rows": "2",
+        "start": "2",
+    }
+
+
+def test_iter_select_default_rows(client):
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_search_response([]))
+    )
+    assert list(client.iter_select("cow")) == []
+    assert client._session.get.call_args.kwargs["params"]["rows"] == str(
+        MAX_SEARCH_ROWS
+    )
+
+
+def test_iter_invalid_page_size(client):
+    with pytest.raises(ValueError):
+        client.iter_terms("go", page_size=0)
+
+
+def test_iter_pages_prefetches_next_page():
+    """
+    The next page should be requested while the current page
+    is still being consumed
+    """
+    fetched = []
+    second_page_requested = threading.Event()
+
+    def fetch_page(page_num):
+        fetched.append(page_num)
+        if page_num == 1:
+            second_page_requested.set()
+        return [page_num]
+
+    pages = iter_pages(fetch_page, get_items=lambda p: p, get_num_pages=lambda p: 3)
+    assert next(pages) == 0
+    # Consumer hasn't asked for the next item yet
+    assert second_page_requested.wait(timeout=5)
+    assert list(pages) == [1, 2]
+    assert fetched == [0, 1, 2]
+
+
+def test_iter_pages_close_early():
+    """
+    Closing the iterator early shouldn't fetch any further pages
+    """
+    fetched = []
+
+    def fetch_page(page_num):
+        fetched.append(page_num)
+        time.sleep(0.01)
+        return [page_num]
+
+    pages = iter_pages(fetch_page, get_items=lambda p: p, get_num_pages=lambda p: 100)
+    assert next(pages) == 0
+    pages.close()
+    time.sleep(0.05)
+    assert len(fetched) <= 2
+
+
+def test_iter_pages_parallel_keeps_order():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fetch_page(page_num):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        # Later pages finish first
+        time.sleep(0.001 * (20 - page_num))
+        with lock:
+            in_flight -= 1
+        return [page_num]
+
+    pages = iter_pages(
+        fetch_page, get_items=lambda p: p, get_num_pages=lambda p: 20, prefetch=4
+    )
+    assert list(pages) == list(range(20))
+    assert 1 < max_in_flight <= 4
+
+
+def test_iter_pages_invalid_prefetch():
+    with pytest.raises(ValueError):
+        list(iter_pages(lambda n: [n], lambda p: p, lambda p: 2, prefetch=-1))
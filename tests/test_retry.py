@@ -0,0 +1,177 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import httpx
+import pytest
+import requests
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.rate_limit import RateLimiter
+from ols_py.retry import RetryPolicy, parse_retry_after
+
+from .factories import BASE_URL, make_response, make_term
+
+
+@pytest.fixture
+def sleeps():
+    """
+    Record retry delays instead of sleeping
+    """
+    with mock.patch("ols_py.client.retry_sleep") as fake_sleep:
+        yield fake_sleep
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+    assert [policy.get_backoff(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    jittered = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+    assert all(0 <= jittered.get_backoff(2) <= 4.0 for _ in range(20))
+
+
+def test_no_retry_by_default(sleeps):
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        return_value=make_response({"status": 503}, status=503)
+    )
+    with pytest.raises(requests.HTTPError):
+        client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    assert client._session.get.call_count == 1
+    sleeps.assert_not_called()
+
+
+def test_retry_server_error_then_succeed(sleeps):
+    policy = RetryPolicy(backoff_factor=1.0, jitter=False)
+    client = Ols4Client(base_url=BASE_URL, retry=policy)
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response({"status": 503}, status=503),
+            requests.ConnectionError("connection reset"),
+            make_response(make_term()),
+        ]
+    )
+    term = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    assert term.short_form == "GO_0043226"
+    assert [c.args[0] for c in sleeps.call_args_list] == [1.0, 2.0]
+    assert policy.stats.retries == 2
+
+
+def test_retry_gives_up(sleeps):
+    policy = RetryPolicy(max_retries=2, jitter=False)
+    client = Ols4Client(base_url=BASE_URL, retry=policy)
+    client._session.get = mock.MagicMock(
+        return_value=make_response({"status": 502}, status=502)
+    )
+    with pytest.raises(requests.HTTPError):
+        client.get_api_info()
+    assert client._session.get.call_count == 3
+    assert policy.stats.gave_up == 1
+
+
+def test_client_errors_not_retried(sleeps):
+    policy = RetryPolicy()
+    client = Ols4Client(base_url=BASE_URL, retry=policy)
+    client._session.get = mock.MagicMock(
+        return_value=make_response({"status": 404}, status=404)
+    )
+    with pytest.raises(requests.HTTPError):
+        client.get_api_info()
+    assert client._session.get.call_count == 1
+    assert policy.stats.retries == 0
+
+
+def test_retry_after_pauses_rate_limiter(sleeps):
+    policy = RetryPolicy(max_backoff=10.0)
+    limiter = RateLimiter(rate=1000)
+    client = Ols4Client(base_url=BASE_URL, retry=policy, rate_limiter=limiter)
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response({"status": 429}, status=429, headers={"Retry-After": "7"}),
+            make_response(make_term()),
+        ]
+    )
+    with mock.patch("ols_py.rate_limit.time.sleep"):
+        client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+    sleeps.assert_called_once_with(7.0)
+    assert policy.stats.retry_after == 1
+    assert limiter.stats.pauses == 1
+    # Other threads sharing the limiter now have to wait for the pause
+    assert limiter.reserve() > 6
+
+
+def test_rate_limiter_burst_then_wait():
+    with mock.patch("ols_py.rate_limit.time.monotonic", return_value=100.0):
+        limiter = RateLimiter(rate=2, burst=3)
+        waits = [limiter.reserve() for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+    assert limiter.stats.delayed == 2
+    assert limiter.stats.total_wait == 1.5
+
+
+def test_rate_limiter_refills():
+    with mock.patch("ols_py.rate_limit.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        limiter = RateLimiter(rate=2, burst=1)
+        assert limiter.reserve() == 0.0
+        monotonic.return_value = 100.5
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == 0.5
+
+
+def test_rate_limiter_pause_spreads_queued_requests():
+    with mock.patch("ols_py.rate_limit.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        limiter = RateLimiter(rate=2, burst=2)
+        limiter.pause(5)
+        waits = [limiter.reserve() for _ in range(4)]
+        assert waits == [5.5, 6.0, 6.5, 7.0]
+        assert limiter.stats.pauses == 1
+        # Once the pause and queue have passed, the bucket refills as usual
+        monotonic.return_value = 120.0
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_rate_limiter_invalid():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0.5)
+
+
+def test_async_retry():
+    responses = iter(
+        [
+            httpx.Response(500),
+            httpx.Response(200, json=make_term()),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses)
+
+    policy = RetryPolicy(backoff_factor=0.001)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def main():
+        async with AsyncOls4Client(
+            base_url=BASE_URL, http_client=http_client, retry=policy
+        ) as client:
+            return await client.get_term(
+                "go", "http://purl.obolibrary.org/obo/GO_0043226"
+            )
+
+    term = asyncio.run(main())
+    assert term.short_form == "GO_0043226"
+    assert policy.stats.retries == 1
@@ -0,0 +1,189 @@
+import asyncio
+import http.server
+import json
+import threading
+import time
+from typing import Optional
+
+import httpx
+import pytest
+import requests
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.routing import InstanceRouter
+
+from .factories import make_term
+
+
+class StandIn:
+    """
+    Local server returning a term for every request, after ``delay``
+    seconds, or an error response if ``status`` is set
+    """
+
+    def __init__(self, delay: float = 0.0, status: Optional[int] = None):
+        self.delay = delay
+        self.status = status
+        self.requests = 0
+        body = json.dumps(make_term()).encode()
+        stand_in = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stand_in.requests += 1
+                time.sleep(stand_in.delay)
+                self.send_response(stand_in.status or 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def make_stand_in():
+    servers = []
+
+    def make(**kwargs) -> StandIn:
+        server = StandIn(**kwargs)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.stop()
+
+
+def unused_url() -> str:
+    server = http.server.HTTPServer(
+        ("127.0.0.1", 0), http.server.BaseHTTPRequestHandler
+    )
+    host, port = server.server_address[:2]
+    server.server_close()
+    return f"http://{host}:{port}/api/"
+
+
+def test_router_order():
+    router = InstanceRouter(["http://a/api", "http://b/api/"], probe_interval=60)
+    a, b = router.instances
+    assert router.base_url == "http://a/api/"
+    router.record_success(a, 0.5)
+    router.record_success(b, 0.1)
+    assert router.candidates() == [b, a]
+    router.record_success(b, 1.1)
+    assert b.latency == pytest.approx(0.4)
+    assert router.candidates() == [b, a]
+    router.record_success(b, 2.0)
+    assert router.candidates() == [a, b]
+    # Down instances are only tried last
+    router.record_failure(a)
+    assert router.candidates() == [b, a]
+    assert a.down_until - time.monotonic() == pytest.approx(5, abs=0.5)
+    router.record_failure(a)
+    assert a.down_until - time.monotonic() == pytest.approx(10, abs=0.5)
+
+
+def test_router_probes_once():
+    router = InstanceRouter(["http://slow/api/", "http://fast/api/"])
+    slow, fast = router.instances
+    router.record_success(fast, 0.01)
+    # Only one request goes to the unmeasured instance while it's probed
+    assert router.candidates()[0] is slow
+    for _ in range(5):
+        assert router.candidates() == [fast, slow]
+    router.record_success(slow, 0.5)
+    assert router.candidates() == [fast, slow]
+
+
+def test_router_probes_once_at_startup():
+    router = InstanceRouter(["http://a/api/", "http://b/api/"])
+    a, b = router.instances
+    # Concurrent requests before any response probe each instance once
+    assert router.candidates()[0] is a
+    assert router.candidates()[0] is b
+    router.record_success(b, 0.1)
+    for _ in range(3):
+        assert router.candidates() == [b, a]
+
+
+def test_routes_to_fastest_instance(make_stand_in):
+    slow = make_stand_in(delay=0.2)
+    fast = make_stand_in()
+    client = Ols4Client(base_url=[slow.base_url, fast.base_url])
+    assert client.base_url == slow.base_url
+    for _ in range(10):
+        assert client.get_term("go", "GO:0043226").label == "organelle"
+    # One request to each to measure latency, then only the fast one
+    assert slow.requests == 1
+    assert fast.requests == 9
+
+
+def test_failover(make_stand_in):
+    failing = make_stand_in(status=503)
+    working = make_stand_in()
+    router = InstanceRouter([unused_url(), failing.base_url, working.base_url])
+    client = Ols4Client(router=router, timeout=1)
+    for _ in range(3):
+        assert client.get_term("go", "GO:0043226").label == "organelle"
+    down, failed, up = router.instances
+    assert (down.failures, failed.failures, up.failures) == (1, 1, 0)
+    assert failing.requests == 1
+    assert working.requests == 3
+
+
+def test_all_instances_fail(make_stand_in):
+    failing = make_stand_in(status=500)
+    client = Ols4Client(base_url=[unused_url(), failing.base_url])
+    with pytest.raises(requests.HTTPError):
+        client.get_term("go", "GO:0043226")
+    client = Ols4Client(base_url=[unused_url()])
+    with pytest.raises(requests.ConnectionError):
+        client.get_term("go", "GO:0043226")
+
+
+def test_async_failover(make_stand_in):
+    failing = make_stand_in(status=502)
+    working = make_stand_in()
+
+    async def main():
+        async with AsyncOls4Client(
+            base_url=[failing.base_url, working.base_url]
+        ) as client:
+            return await asyncio.gather(
+                *(client.get_term("go", "GO:0043226") for _ in range(3))
+            )
+
+    terms = asyncio.run(main())
+    assert [t.label for t in terms] == ["organelle"] * 3
+    assert working.requests == 3
+
+
+def test_async_all_instances_fail(make_stand_in):
+    failing = make_stand_in(status=500)
+
+    async def main():
+        async with AsyncOls4Client(base_url=[failing.base_url]) as client:
+            await client.get_term("go", "GO:0043226")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
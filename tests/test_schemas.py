@@ -1,8 +1,12 @@
+import json
 from typing import get_args
 
 import ols_py.schemas.requests
 import ols_py.schemas.responses
 from ols_py.schemas.requests import SearchParams, get_query_dict
+from ols_py.schemas.responses import LeanMultipleTerms, LeanTerm, MultipleTerms
+
+from .factories import make_multiple_terms, make_term
 
 
 def test_search_params_valid():
@@ -51,3 +55,26 @@ def test_search_fields():
     # Result items have an extra id field, and we also remap 'synonym'
     #   to synonyms
     assert result_item_fields - return_fields == {"id", "synonyms"}
+
+
+def test_lean_multiple_terms():
+    """
+    LeanMultipleTerms should parse the same data as MultipleTerms,
+    keeping only the core term fields
+    """
+    data = make_multiple_terms([make_term(short_form="GO_0000001", label="first")])
+    content = json.dumps(data)
+    full = MultipleTerms.model_validate_json(content).embedded.terms[0]
+    lean = LeanMultipleTerms.model_validate_json(content).embedded.terms[0]
+    assert lean == LeanTerm(
+        iri="http://purl.obolibrary.org/obo/GO_0000001",
+        label="first",
+        short_form="GO_0000001",
+        ontology_name="go",
+        obo_id="GO:0000001",
+        is_obsolete=False,
+        has_children=True,
+        is_root=False,
+    )
+    assert lean.iri == str(full.iri)
+    assert not hasattr(lean, "__dict__")
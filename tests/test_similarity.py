@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+
+from ols_py.hierarchy import HierarchyIndex
+from ols_py.similarity import SimilarityIndex
+
+from .test_hierarchy import EDGES
+
+TERMS = ["root", "a", "b", "c", "d"]
+
+
+@pytest.fixture
+def sim() -> SimilarityIndex:
+    return SimilarityIndex.from_hierarchy(HierarchyIndex.from_edges(EDGES))
+
+
+def brute_force(sim: SimilarityIndex, iri1: str, iri2: str, method: str) -> float:
+    """
+    Compute similarity directly from the ancestor sets
+    """
+    common = sim.ancestors(iri1) & sim.ancestors(iri2)
+    if method == "jaccard":
+        return len(common) / len(sim.ancestors(iri1) | sim.ancestors(iri2))
+    resnik = max(sim.information_content(iri) for iri in common)
+    if method == "resnik":
+        return resnik
+    total = sim.information_content(iri1) + sim.information_content(iri2)
+    return 2 * resnik / total if total else 1.0
+
+
+def test_information_content(sim):
+    assert sim.information_content("root") == 0
+    assert sim.information_content("b") == pytest.approx(math.log(5 / 3))
+    assert sim.information_content("c") == pytest.approx(math.log(5))
+    assert sim.ancestors("c") == {"c", "a", "b", "root"}
+
+
+def test_term_similarity(sim):
+    assert sim.similarity("c", "d") == pytest.approx(math.log(5 / 3))
+    assert sim.similarity("c", "d", method="lin") == pytest.approx(
+        math.log(5 / 3) / math.log(5)
+    )
+    assert sim.similarity("c", "d", method="jaccard") == pytest.approx(0.4)
+    assert sim.similarity("root", "root", method="lin") == 1.0
+    with pytest.raises(KeyError):
+        sim.similarity("c", "missing")
+
+
+@pytest.mark.parametrize("method", ["resnik", "lin", "jaccard"])
+def test_pairwise_matches_brute_force(sim, method):
+    scores = sim.pairwise(TERMS, TERMS, method=method)
+    expected = [[brute_force(sim, t1, t2, method) for t2 in TERMS] for t1 in TERMS]
+    np.testing.assert_allclose(scores, expected)
+    np.testing.assert_allclose(
+        sim.one_vs_many("c", TERMS, method=method), expected[TERMS.index("c")]
+    )
+
+
+def test_score_profiles(sim):
+    profiles = {"p1": ["d", "a"], "p2": ["c"], "empty": []}
+    scores = sim.score_profiles(["c"], profiles)
+    forward = math.log(2.5)
+    backward = (math.log(5 / 3) + math.log(2.5)) / 2
+    np.testing.assert_allclose(scores, [(forward + backward) / 2, math.log(5), 0.0])
+    np.testing.assert_allclose(
+        sim.score_profiles(["c", "d"], sim.profile_set(profiles), aggregate="max"),
+        [math.log(5), math.log(5), 0.0],
+    )
+    assert sim.profile_similarity(["c"], ["c"], method="lin") == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        sim.score_profiles([], profiles)
+
+
+def test_cycle():
+    with pytest.raises(ValueError):
+        SimilarityIndex.from_edges([("a", "b"), ("b", "a")])
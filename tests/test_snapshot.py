@@ -0,0 +1,116 @@
+import asyncio
+import json
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+import requests
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.snapshot import OntologySnapshot, SnapshotWriter, get_index_path
+
+from .factories import BASE_URL, make_multiple_terms, make_response, make_term
+
+TERMS = [make_term(f"GO_{i:07d}", label=f"term {i}") for i in range(5)]
+
+
+def terms_page(page: int, size: int) -> dict:
+    # Include a duplicate to check it's only stored once
+    terms = (TERMS + TERMS[:1])[page * size : (page + 1) * size]
+    return make_multiple_terms(terms, page=page, size=size, total_elements=6)
+
+
+def test_export_and_load(tmp_path):
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        side_effect=lambda url, params, headers, timeout, stream: make_response(
+            terms_page(params["page"], params["size"])
+        )
+    )
+    path = tmp_path / "go.jsonl"
+    assert client.export_ontology("go", path, page_size=4) == 5
+    assert client._session.get.call_count == 2
+    assert client._session.get.call_args.kwargs["url"] == (
+        BASE_URL + "ontologies/go/terms"
+    )
+
+    with OntologySnapshot(path) as snapshot:
+        assert snapshot.ontology_id == "go"
+        assert len(snapshot) == 5
+        iri = "http://purl.obolibrary.org/obo/GO_0000003"
+        assert snapshot.get_term(iri).label == "term 3"
+        assert snapshot.get_term("GO:0000003").label == "term 3"
+        assert snapshot.get_term("GO_0000003").label == "term 3"
+        assert json.loads(snapshot.get_raw(iri)) == TERMS[3]
+        assert "GO:0000004" in snapshot
+        assert "GO:0000099" not in snapshot
+        with pytest.raises(KeyError):
+            snapshot.get_term("GO:0000099")
+        assert [t.short_form for t in snapshot] == [t["short_form"] for t in TERMS]
+
+
+def test_failed_export_has_no_index(tmp_path):
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        side_effect=[
+            make_response(terms_page(0, 4)),
+            make_response({"status": 500}, status=500),
+        ]
+    )
+    path = tmp_path / "go.jsonl"
+    with pytest.raises(requests.HTTPError):
+        client.export_ontology("go", path, page_size=4)
+    assert not get_index_path(path).exists()
+    with pytest.raises(FileNotFoundError):
+        OntologySnapshot(path)
+
+
+def test_empty_snapshot(tmp_path):
+    client = Ols4Client(base_url=BASE_URL)
+    empty = make_multiple_terms([], total_elements=0)
+    del empty["_embedded"]
+    client._session.get = mock.MagicMock(return_value=make_response(empty))
+    path = tmp_path / "empty.jsonl"
+    assert client.export_ontology("empty", path) == 0
+    with OntologySnapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert list(snapshot) == []
+
+
+def test_async_export(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        return httpx.Response(
+            200, json=terms_page(int(params["page"]), int(params["size"]))
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    path = tmp_path / "go.jsonl"
+
+    # File I/O should be done outside the event loop's thread
+    io_threads = set()
+    original_write, original_close = SnapshotWriter.write, SnapshotWriter.close
+
+    def write(self, term):
+        io_threads.add(threading.get_ident())
+        original_write(self, term)
+
+    def close(self):
+        if not self._file.closed:
+            io_threads.add(threading.get_ident())
+        original_close(self)
+
+    async def main():
+        async with AsyncOls4Client(base_url=BASE_URL, http_client=http_client) as c:
+            return await c.export_ontology("go", path, page_size=2)
+
+    with (
+        mock.patch.object(SnapshotWriter, "write", write),
+        mock.patch.object(SnapshotWriter, "close", close),
+    ):
+        assert asyncio.run(main()) == 5
+    assert io_threads and threading.get_ident() not in io_threads
+    with OntologySnapshot(path) as snapshot:
+        assert snapshot.get_term("GO:0000001").label == "term 1"
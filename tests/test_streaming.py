@@ -0,0 +1,70 @@
+import asyncio
+import io
+import json
+from unittest import mock
+
+import httpx
+import pytest
+import requests
+
+from ols_py.client import Ols4Client
+from ols_py.schemas.responses import Term
+from ols_py.streaming import TERMS_PREFIX, ItemParser
+
+from .factories import BASE_URL, make_multiple_terms, make_response, make_term
+from .test_async_client import make_client
+
+TERMS = [make_term(short_form=f"GO_{i:07d}") for i in range(5)]
+CONTENT = json.dumps(make_multiple_terms(TERMS, size=5)).encode()
+
+
+def make_stream_response(content: bytes, status: int = 200) -> requests.Response:
+    resp = make_response(status=status)
+    resp._content = False
+    resp.raw = io.BytesIO(content)
+    return resp
+
+
+def test_item_parser_small_chunks():
+    parser = ItemParser(Term, TERMS_PREFIX)
+    terms = []
+    for i in range(0, len(CONTENT), 7):
+        terms.extend(parser.feed(CONTENT[i : i + 7]))
+    terms.extend(parser.close())
+    assert [t.short_form for t in terms] == [f"GO_{i:07d}" for i in range(5)]
+
+
+def test_stream_term_relatives():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(return_value=make_stream_response(CONTENT))
+    terms = client.stream_term_relatives(
+        "descendants", "go", "GO:0043226", params={"size": 5000}
+    )
+    # Request isn't sent until iteration starts
+    client._session.get.assert_not_called()
+    assert next(terms).short_form == "GO_0000000"
+    assert len(list(terms)) == 4
+    call = client._session.get.call_args.kwargs
+    assert call["stream"] is True
+    assert call["params"] == {"id": "GO:0043226", "size": 5000}
+
+
+def test_stream_terms_error():
+    client = Ols4Client(base_url=BASE_URL)
+    client._session.get = mock.MagicMock(
+        return_value=make_stream_response(b'{"status": 404}', status=404)
+    )
+    with pytest.raises(requests.HTTPError):
+        list(client.stream_terms("go"))
+
+
+def test_async_stream_terms():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=CONTENT)
+
+    async def main():
+        async with make_client(handler) as client:
+            return [term async for term in client.stream_terms("go")]
+
+    terms = asyncio.run(main())
+    assert [t.short_form for t in terms] == [f"GO_{i:07d}" for i in range(5)]
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+
+from ols_py.async_client import AsyncOls4Client
+from ols_py.client import Ols4Client
+from ols_py.schemas.responses import Term
+from ols_py.term_store import BaseTermStore, MemoryTermStore, SqliteTermStore
+
+from .factories import BASE_URL, make_multiple_terms, make_response, make_term
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**kwargs) -> BaseTermStore:
+        if request.param == "memory":
+            return MemoryTermStore(**kwargs)
+        return SqliteTermStore(tmp_path / "terms.sqlite", **kwargs)
+
+    return make
+
+
+def test_store_by_iri_and_ontology(make_store):
+    store = make_store()
+    go_term = Term.model_validate(make_term("GO_0000001", ontology_name="go"))
+    imported = Term.model_validate(make_term("GO_0000001", ontology_name="efo"))
+    store.add([go_term, imported])
+    assert len(store) == 2
+    iri = "http://purl.obolibrary.org/obo/GO_0000001"
+    assert store.get("GO", iri) == go_term
+    assert store.get("efo", iri).ontology_name == "efo"
+    assert store.get("mondo", iri) is None
+    assert (store.stats.hits, store.stats.misses) == (2, 1)
+    store.clear()
+    assert len(store) == 0
+
+
+def test_store_ttl(make_store):
+    store = make_store(ttl=10)
+    with mock.patch("ols_py.term_store.time.time", return_value=1000.0):
+        store.add([Term.model_validate(make_term("GO_0000001"))])
+    iri = "http://purl.obolibrary.org/obo/GO_0000001"
+    with mock.patch("ols_py.term_store.time.time", return_value=1005.0):
+        assert store.get("go", iri) is not None
+    with mock.patch("ols_py.term_store.time.time", return_value=1011.0):
+        assert store.get("go", iri) is None
+
+
+def test_sqlite_store_persists(tmp_path):
+    store = SqliteTermStore(tmp_path / "terms.sqlite")
+    store.add([Term.model_validate(make_term("GO_0000001"))])
+    store.close()
+    reopened = SqliteTermStore(tmp_path / "terms.sqlite")
+    term = reopened.get("go", "http://purl.obolibrary.org/obo/GO_0000001")
+    assert term.short_form == "GO_0000001"
+
+
+def test_client_reuses_terms_from_other_endpoints(make_store):
+    client = Ols4Client(base_url=BASE_URL, term_store=make_store())
+    terms = [make_term(f"GO_000000{i}") for i in range(3)]
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_multiple_terms(terms))
+    )
+    client.get_term_children("go", "GO:0043226")
+    term = client.get_term("go", "http://purl.obolibrary.org/obo/GO_0000002")
+    assert term.short_form == "GO_0000002"
+    assert client._session.get.call_count == 1
+
+    # Unknown terms are requested, then stored
+    client._session.get.return_value = make_response(make_term("GO_0000009"))
+    client.get_term("go", "http://purl.obolibrary.org/obo/GO_0000009")
+    client.get_term("go", "http://purl.obolibrary.org/obo/GO_0000009")
+    assert client._session.get.call_count == 2
+
+
+def test_client_doesnt_store_properties(make_store):
+    """
+    Properties are parsed with the Term schema, but mustn't be
+    returned by get_term()
+    """
+    client = Ols4Client(base_url=BASE_URL, term_store=make_store())
+    client._session.get = mock.MagicMock(
+        return_value=make_response(make_term("BFO_0000050", label="part of"))
+    )
+    iri = "http://purl.obolibrary.org/obo/BFO_0000050"
+    client.get_property("go", iri)
+    client._session.get.return_value = make_response(
+        make_term("BFO_0000050", label="part of term")
+    )
+    term = client.get_term("go", iri)
+    assert term.label == "part of term"
+    assert client._session.get.call_count == 2
+    assert "/terms/" in client._session.get.call_args.kwargs["url"]
+
+
+def test_async_client_reuses_terms():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        terms = [make_term(f"GO_000000{i}") for i in range(3)]
+        return httpx.Response(200, json=make_multiple_terms(terms))
+
+    async def main():
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncOls4Client(
+            base_url=BASE_URL, http_client=http_client, term_store=MemoryTermStore()
+        ) as client:
+            await client.get_term_parents("go", "GO:0043226")
+            return await client.get_term(
+                "go", "http://purl.obolibrary.org/obo/GO_0000001"
+            )
+
+    term = asyncio.run(main())
+    assert term.short_form == "GO_0000001"
+    assert len(requested) == 1
+
+
+def test_async_client_uses_store_off_event_loop():
+    """
+    The store might do blocking I/O (e.g. sqlite), so it shouldn't
+    be used from the event loop's thread
+    """
+    store = MemoryTermStore()
+    threads = []
+    for method in ["get", "add"]:
+        original = getattr(store, method)
+
+        def record(*args, _original=original, **kwargs):
+            threads.append(threading.get_ident())
+            return _original(*args, **kwargs)
+
+        setattr(store, method, record)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=make_term())
+
+    async def main():
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncOls4Client(
+            base_url=BASE_URL, http_client=http_client, term_store=store
+        ) as client:
+            await client.get_term("go", "http://purl.obolibrary.org/obo/GO_0043226")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert len(threads) == 2
+    assert loop_thread not in threads